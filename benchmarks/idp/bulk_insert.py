@@ -0,0 +1,93 @@
+"""Throughput of `QueryExecutor` bulk writes.
+
+Inserts `--rows` identities with `add_all` (ORM flush), `insert_many`
+(insertmanyvalues) and, on an asyncpg `--url`, `copy_records` (COPY). Defaults
+to in-memory SQLite, where COPY is unavailable.
+
+    PYTHONPATH=src python benchmarks/idp/bulk_insert.py
+    PYTHONPATH=src python benchmarks/idp/bulk_insert.py --url <asyncpg url>
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import cast
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
+    IdentityBase,
+)
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+IDENTITIES = cast(Table, IdentityBase.__table__)
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.url)
+    executor = QueryExecutor(
+        UnitOfWork(MakerSessionFactory(async_sessionmaker(engine)))
+    )
+
+    def rows() -> list[dict[str, object]]:
+        return [
+            {
+                "identity_id": uuid.uuid4(),
+                "username": str(uuid.uuid4()),
+                "password": "h",
+            }
+            for _ in range(args.rows)
+        ]
+
+    async def add_all() -> None:
+        await executor.add_all([IdentityBase(**row) for row in rows()])
+
+    async def insert_many() -> None:
+        await executor.insert_many(IdentityBase, rows())
+
+    async def copy_records() -> None:
+        await executor.copy_records(
+            IdentityBase,
+            ["identity_id", "username", "password"],
+            [tuple(row.values()) for row in rows()],
+        )
+
+    paths: dict[str, Callable[[], Awaitable[None]]] = {
+        "add_all": add_all,
+        "insert_many": insert_many,
+    }
+    if engine.dialect.driver == "asyncpg":
+        paths["copy_records"] = copy_records
+
+    print(f"{'path':<14}{'rows/s':>12}")
+    for name, load in paths.items():
+        async with engine.begin() as conn:
+            await conn.run_sync(IdentityBase.metadata.drop_all, tables=[IDENTITIES])
+            await conn.run_sync(IdentityBase.metadata.create_all, tables=[IDENTITIES])
+
+        started_at = time.perf_counter()
+        await load()
+        elapsed = time.perf_counter() - started_at
+        print(f"{name:<14}{args.rows / elapsed:>12.0f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
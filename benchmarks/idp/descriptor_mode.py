@@ -0,0 +1,213 @@
+"""Cost of `JWTTokenIntrospector.extract_user` per descriptor mode.
+
+Compares resolving the `IdentityDescriptor` through the repository (plain,
+batched by a `DataLoader`, and behind the descriptor cache) against reading it
+from the access-token claims.
+The identity repository is in memory and sleeps `--db-latency` per query to
+stand in for a Postgres round trip, running at most `--db-connections` queries
+at once like the connection pool.
+
+    PYTHONPATH=src python benchmarks/idp/descriptor_mode.py
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Sequence
+from operator import attrgetter
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.loaders.data_loader import DataLoader
+from common.infrastructure.services.clock import SystemClock
+from common.infrastructure.services.id_generator import UUID4Generator
+from common.infrastructure.services.secrets_token_generator import (
+    SecretsTokenGenerator,
+)
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
+from idp.auth.application.interfaces.repositories.token_repository import (
+    IRefreshTokenRepository,
+)
+from idp.auth.application.repositories.descriptor_repository import (
+    IdentityDescriptorRepository,
+)
+from idp.auth.domain.entity.token import Token
+from idp.auth.infrastructure.cache.descriptor_repository import (
+    CachedIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
+from idp.auth.infrastructure.services.jwt.token_introspector import (
+    JWTTokenIntrospector,
+)
+from idp.auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
+from idp.identity.application.exceptions import IdentityNotFoundError
+from idp.identity.application.interfaces.repositories.identity_repository import (
+    IIdentityRepository,
+)
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+from idp.identity.domain.value_objects.password import Password
+from idp.identity.domain.value_objects.username import Username
+
+
+MODES = ("repository", "batched", "cached", "stateless")
+
+
+class SlowIdentityRepository(IIdentityRepository):
+    def __init__(
+        self, identities: list[Identity], latency: float, connections: int
+    ) -> None:
+        self.identities = {identity.identity_id: identity for identity in identities}
+        self.latency = latency
+        self.connections = asyncio.Semaphore(connections)
+        self.queries = 0
+
+    async def get_by_id(self, identity_id: UUID) -> Identity:
+        await self._query()
+        if identity_id not in self.identities:
+            raise IdentityNotFoundError(identity_id)
+        return self.identities[identity_id]
+
+    async def get_many_by_ids(self, identity_ids: Sequence[UUID]) -> list[Identity]:
+        await self._query()
+        return [self.identities[i] for i in identity_ids if i in self.identities]
+
+    async def exists_by_username(self, username: str) -> bool:
+        raise NotImplementedError
+
+    async def get_by_username(self, username: str) -> Identity:
+        raise NotImplementedError
+
+    async def get_credentials_by_username(self, username: str) -> IdentityCredentials:
+        raise NotImplementedError
+
+    async def add(self, entity: Identity) -> None:
+        raise NotImplementedError
+
+    async def _query(self) -> None:
+        async with self.connections:
+            self.queries += 1
+            await asyncio.sleep(self.latency)
+
+
+class NullRefreshTokenRepository(IRefreshTokenRepository):
+    async def get(self, value: str) -> Token:
+        raise NotImplementedError
+
+    async def revoke(self, value: str) -> None:
+        raise NotImplementedError
+
+    async def revoke_active(self, value: str, now: DateTime) -> UUID | None:
+        raise NotImplementedError
+
+    async def revoke_all(self, identity_id: UUID, now: DateTime) -> list[UUID]:
+        raise NotImplementedError
+
+    async def revoke_all_many(
+        self, identity_ids: Sequence[UUID], now: DateTime
+    ) -> list[UUID]:
+        raise NotImplementedError
+
+    async def add(self, token: Token) -> None:
+        pass
+
+    async def delete_stale(self, now: DateTime, limit: int) -> int:
+        raise NotImplementedError
+
+
+async def run(mode: str, args: argparse.Namespace) -> tuple[list[float], int]:
+    config = AuthConfig(
+        secret_key="benchmark-secret",
+        issuer="benchmark",
+        stateless_descriptor=mode == "stateless",
+    )
+    clock = SystemClock()
+    codec = JoseJWTCodec(config)
+    uuid_generator = UUID4Generator()
+    identities = [
+        Identity(uuid_generator.create(), Username(f"user-{i}"), Password("hash"))
+        for i in range(args.users)
+    ]
+    identity_repository = SlowIdentityRepository(
+        identities, args.db_latency, args.db_connections
+    )
+
+    descriptor_repository: IIdentityDescriptorRepository = IdentityDescriptorRepository(
+        identity_repository
+    )
+    if mode == "batched":
+        descriptor_repository = IdentityDescriptorRepository(
+            identity_repository,
+            loader=DataLoader(
+                identity_repository.get_many_by_ids, attrgetter("identity_id")
+            ),
+        )
+    if mode == "cached":
+        descriptor_repository = CachedIdentityDescriptorRepository(
+            descriptor_repository, config
+        )
+
+    issuer = JWTTokenIssuer(
+        clock,
+        config,
+        SecretsTokenGenerator(),
+        uuid_generator,
+        NullRefreshTokenRepository(),
+        descriptor_repository,
+        codec,
+    )
+    introspector = JWTTokenIntrospector(config, clock, descriptor_repository, codec)
+
+    tokens = [
+        issuer.issue_access_token(
+            identity.identity_id,
+            IdentityDescriptor(identity.identity_id, identity.username.value),
+        ).value
+        for identity in identities
+    ]
+    identity_repository.queries = 0
+
+    latencies: list[float] = []
+
+    async def worker(offset: int) -> None:
+        for i in range(args.requests // args.concurrency):
+            token = tokens[(offset + i) % len(tokens)]
+            started_at = time.perf_counter()
+            await introspector.extract_user(token)
+            latencies.append(time.perf_counter() - started_at)
+
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    return latencies, identity_repository.queries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency", type=float, default=0.001)
+    parser.add_argument("--db-connections", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'req/s':>10}{'mean us':>10}{'p99 us':>10}{'db queries':>12}")
+    for mode in MODES:
+        started_at = time.perf_counter()
+        latencies, queries = asyncio.run(run(mode, args))
+        elapsed = time.perf_counter() - started_at
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(
+            f"{mode:<12}{len(latencies) / elapsed:>10.0f}"
+            f"{statistics.fmean(latencies) * 1e6:>10.0f}"
+            f"{p99 * 1e6:>10.0f}{queries:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Encode/decode throughput of each `IJWTCodec` backend.
+
+PYTHONPATH=src python benchmarks/idp/jwt_codec.py
+"""
+
+import argparse
+import time
+import timeit
+from typing import Any
+
+from idp.auth.infrastructure.config.auth_config import AuthConfig, JWTBackendEnum
+from idp.auth.infrastructure.di.container.providers import provide_jwt_codec
+from idp.auth.infrastructure.services.jose.key_ring import JWTKeyRing
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+
+
+def claims() -> dict[str, Any]:
+    now = int(time.time())
+    return {
+        "sub": "5a0c1d5e-54a8-4c55-9d0c-4e1bbd0b8a5e",
+        "iss": "benchmark",
+        "iat": now,
+        "exp": now + 3600,
+        "preferred_username": "benchmark",
+    }
+
+
+def measure(codec: IJWTCodec, number: int, repeat: int) -> tuple[float, float]:
+    payload = claims()
+    token = codec.encode(payload)
+
+    encode = min(
+        timeit.repeat(lambda: codec.encode(payload), number=number, repeat=repeat)
+    )
+    decode = min(
+        timeit.repeat(lambda: codec.decode(token), number=number, repeat=repeat)
+    )
+    return number / encode, number / decode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--algorithm", default="HS256")
+    args = parser.parse_args()
+
+    print(f"{'backend':<10}{'encode/s':>12}{'decode/s':>12}")
+    for backend in JWTBackendEnum:
+        config = AuthConfig(
+            secret_key="benchmark-secret",
+            algorithm=args.algorithm,
+            issuer="benchmark",
+            jwt_backend=backend,
+        )
+        encode, decode = measure(
+            provide_jwt_codec(config, JWTKeyRing.from_config(config)),
+            args.number,
+            args.repeat,
+        )
+        print(f"{backend.value:<10}{encode:>12.0f}{decode:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
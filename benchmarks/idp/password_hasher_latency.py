@@ -0,0 +1,252 @@
+"""Latency of `/users/me` while a burst of logins is hashing passwords.
+
+Runs the real identity and auth routers in-process through an ASGI transport.
+Token introspection and persistence are stubbed so that the only expensive
+work is the bcrypt verification performed by `IdentityService`.
+
+    PYTHONPATH=src python benchmarks/idp/password_hasher_latency.py
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Sequence
+from uuid import UUID, uuid4
+
+import bcrypt
+import httpx
+from common.infrastructure.server.fastapi.server import FastAPIServer
+from common.infrastructure.services.id_generator import UUID4Generator
+from fastapi import FastAPI
+from idp.auth.application.dtos.commands.login_command import LoginCommand
+from idp.auth.application.dtos.models.auth_tokens import AuthTokens
+from idp.auth.application.interfaces.usecases.command.login_use_case import (
+    ILoginUseCase,
+)
+from idp.auth.application.interfaces.usecases.command.logout_all_use_case import (
+    ILogoutAllUseCase,
+)
+from idp.auth.application.interfaces.usecases.command.logout_use_case import (
+    ILogoutUseCase,
+)
+from idp.auth.application.interfaces.usecases.command.refresh_token_use_case import (
+    IRefreshTokenUseCase,
+)
+from idp.auth.presentation.http.fastapi.controllers import auth_router
+from idp.identity.application.dtos.commands.verify_password_command import (
+    VerifyPasswordCommand,
+)
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
+from idp.identity.application.interfaces.repositories.identity_repository import (
+    IIdentityRepository,
+)
+from idp.identity.application.interfaces.services.identity_service import (
+    IIdentityService,
+)
+from idp.identity.application.interfaces.services.token_intospector import (
+    ITokenIntrospector,
+)
+from idp.identity.application.interfaces.usecases.command.create_identity_use_case import (
+    ICreateIdentityUseCase,
+)
+from idp.identity.application.services.identity_service import IdentityService
+from idp.identity.application.usecases.command.create_identity_use_case import (
+    CreateIdentityUseCase,
+)
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.domain.factories.identity_factory import IdentityFactory
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+from idp.identity.domain.value_objects.password import Password
+from idp.identity.domain.value_objects.username import Username
+from idp.identity.infrastructure.config.password_hasher_config import (
+    PasswordHasherConfig,
+    PasswordHasherExecutorEnum,
+)
+from idp.identity.infrastructure.services.bcrypt.password_hasher import (
+    BcryptPasswordHasher,
+)
+from idp.identity.infrastructure.services.executor.password_hasher import (
+    ExecutorPasswordHasher,
+)
+from idp.identity.presentation.http.fastapi.controllers import identity_router
+
+
+USERNAME = "benchmark"
+PASSWORD = "benchmark-password"
+
+
+class InMemoryIdentityRepository(IIdentityRepository):
+    def __init__(self, identity: Identity) -> None:
+        self.identity = identity
+
+    async def get_by_id(self, identity_id: UUID) -> Identity:
+        return self.identity
+
+    async def get_many_by_ids(self, identity_ids: Sequence[UUID]) -> list[Identity]:
+        return [self.identity]
+
+    async def exists_by_username(self, username: str) -> bool:
+        return username == self.identity.username.value
+
+    async def get_by_username(self, username: str) -> Identity:
+        return self.identity
+
+    async def get_credentials_by_username(self, username: str) -> IdentityCredentials:
+        return IdentityCredentials(
+            self.identity.identity_id, self.identity.password.value
+        )
+
+    async def add(self, entity: Identity) -> None:
+        pass
+
+
+class StaticTokenIntrospector(ITokenIntrospector):
+    def __init__(self, descriptor: IdentityDescriptor) -> None:
+        self.descriptor = descriptor
+
+    async def extract_user(self, token: str) -> IdentityDescriptor:
+        return self.descriptor
+
+    async def is_token_valid(self, token: str) -> bool:
+        return True
+
+    async def validate(self, token: str) -> UUID:
+        return self.descriptor.identity_id
+
+
+class VerifyOnlyLoginUseCase(ILoginUseCase):
+    def __init__(self, identity_service: IIdentityService) -> None:
+        self.identity_service = identity_service
+
+    async def execute(self, command: LoginCommand) -> AuthTokens:
+        identity_id = await self.identity_service.verify_password(
+            VerifyPasswordCommand(command.username, command.password)
+        )
+        return AuthTokens.create(identity_id, "access", "refresh")
+
+
+def build_app(hasher: ExecutorPasswordHasher, rounds: int) -> FastAPI:
+    password_hash = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds)).decode()
+    identity = Identity(uuid4(), Username(USERNAME), Password(password_hash))
+    identity_service = IdentityService(
+        InMemoryIdentityRepository(identity),
+        IdentityFactory(UUID4Generator()),
+        hasher,
+    )
+
+    server = FastAPIServer(logging.getLogger("benchmark"))
+    server.override_dependency(
+        ITokenIntrospector,
+        StaticTokenIntrospector(
+            IdentityDescriptor(identity.identity_id, identity.username.value)
+        ),
+    )
+    server.override_dependency(ILoginUseCase, VerifyOnlyLoginUseCase(identity_service))
+    server.override_dependency(
+        ICreateIdentityUseCase, CreateIdentityUseCase(identity_service)
+    )
+    # NOTE: Not exercised, but class based controllers resolve every dependency
+    server.override_dependency(ILogoutUseCase, None)
+    server.override_dependency(ILogoutAllUseCase, None)
+    server.override_dependency(IRefreshTokenUseCase, None)
+    server.register_router(auth_router, "/auth", ["Auth"])
+    server.register_router(identity_router, "/users", ["Users"])
+    return server.get_app()
+
+
+async def login_burst(client: httpx.AsyncClient, logins: int) -> None:
+    async def login() -> None:
+        response = await client.post(
+            "/auth/login", data={"username": USERNAME, "password": PASSWORD}
+        )
+        response.raise_for_status()
+
+    await asyncio.gather(*(login() for _ in range(logins)))
+
+
+async def probe_me(
+    client: httpx.AsyncClient, burst: asyncio.Task[None], interval: float
+) -> list[float]:
+    latencies: list[float] = []
+    headers = {"Authorization": "Bearer token"}
+    while not burst.done():
+        started_at = time.perf_counter()
+        response = await client.get("/users/me", headers=headers)
+        latencies.append(time.perf_counter() - started_at)
+        response.raise_for_status()
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run(
+    executor: PasswordHasherExecutorEnum, args: argparse.Namespace
+) -> list[float]:
+    hasher = ExecutorPasswordHasher.create(
+        BcryptPasswordHasher(),
+        PasswordHasherConfig(
+            executor=executor,
+            max_workers=args.workers,
+            max_queue_depth=args.logins,
+        ),
+    )
+    app = build_app(hasher, args.rounds)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark"
+        ) as client:
+            burst = asyncio.create_task(login_burst(client, args.logins))
+            probes = [
+                asyncio.create_task(probe_me(client, burst, args.interval))
+                for _ in range(args.probes)
+            ]
+            await burst
+            results = await asyncio.gather(*probes)
+    finally:
+        hasher.shutdown()
+
+    return [latency for probe in results for latency in probe]
+
+
+def percentile(values: list[float], q: int) -> float:
+    if len(values) < 2:  # noqa: PLR2004
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--probes", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument(
+        "--executor",
+        choices=[e.value for e in PasswordHasherExecutorEnum],
+        action="append",
+    )
+    args = parser.parse_args()
+
+    executors = [
+        PasswordHasherExecutorEnum(e)
+        for e in (args.executor or [e.value for e in PasswordHasherExecutorEnum])
+    ]
+
+    print(f"{'executor':<10}{'samples':>10}{'p50 ms':>12}{'p99 ms':>12}{'max ms':>12}")
+    for executor in executors:
+        latencies = asyncio.run(run(executor, args))
+        print(
+            f"{executor.value:<10}{len(latencies):>10}"
+            f"{percentile(latencies, 50) * 1000:>12.2f}"
+            f"{percentile(latencies, 99) * 1000:>12.2f}"
+            f"{max(latencies, default=0.0) * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
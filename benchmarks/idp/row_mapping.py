@@ -0,0 +1,95 @@
+"""Cost of mapping identities from ORM instances vs plain Core rows.
+
+Loads `--rows` identities per query through `QueryExecutor`, once as
+`IdentityBase` instances mapped with `IdentityMapper.to_domain` and once as
+Core rows mapped with `IdentityMapper.from_row`. Runs against in-memory SQLite
+so the difference is the Python-side hydration, not the round trip.
+
+    PYTHONPATH=src python benchmarks/idp/row_mapping.py
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import cast
+
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.infrastructure.database.postgres.sqlalchemy.mappers.identity_mapper import (
+    IdentityMapper,
+)
+from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
+    IdentityBase,
+)
+from sqlalchemy import Table, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+IDENTITIES = cast(Table, IdentityBase.__table__)
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(IdentityBase.metadata.create_all, tables=[IDENTITIES])
+        await conn.execute(
+            insert(IDENTITIES),
+            [
+                {
+                    "identity_id": uuid.uuid4(),
+                    "username": f"user-{i}",
+                    "password": "hash",
+                }
+                for i in range(args.rows)
+            ],
+        )
+
+    uow = UnitOfWork(MakerSessionFactory(async_sessionmaker(engine)))
+    executor = QueryExecutor(uow)
+
+    async def orm() -> list[Identity]:
+        async with uow.read_only():
+            bases = await executor.execute_scalar_many(select(IdentityBase))
+            return [IdentityMapper.to_domain(base) for base in bases]
+
+    async def core() -> list[Identity]:
+        async with uow.read_only():
+            rows = await executor.execute_core_many(select(IDENTITIES))
+            return [IdentityMapper.from_row(row) for row in rows]
+
+    paths: dict[str, Callable[[], Awaitable[list[Identity]]]] = {
+        "orm": orm,
+        "core": core,
+    }
+    print(f"{'path':<8}{'ms/query':>10}{'us/row':>10}")
+    for name, load in paths.items():
+        await load()
+        best = float("inf")
+        for _ in range(args.repeat):
+            started_at = time.perf_counter()
+            for _ in range(args.number):
+                await load()
+            best = min(best, (time.perf_counter() - started_at) / args.number)
+        print(f"{name:<8}{best * 1e3:>10.2f}{best / args.rows * 1e6:>10.2f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
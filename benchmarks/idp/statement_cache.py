@@ -0,0 +1,92 @@
+"""Per-query Python overhead of inline vs precompiled repository statements.
+
+Measures what SQLAlchemy does before a query reaches the driver: building the
+statement, computing its cache key and looking the compiled SQL up in the
+compiled cache. Inline statements are rebuilt per call the way the
+repositories used to; precompiled ones are the module-level statements with
+bound parameters. `--cache-size 0` shows the cost after an eviction.
+
+    PYTHONPATH=src python benchmarks/idp/statement_cache.py
+"""
+
+import argparse
+import timeit
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
+    TokenBase,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories import (
+    refresh_token_repository,
+)
+from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
+    IdentityBase,
+)
+from idp.identity.infrastructure.database.postgres.sqlalchemy.repositories import (
+    identity_repository,
+)
+from sqlalchemy import exists, select
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.sql import Executable
+from sqlalchemy.util import LRUCache
+
+
+QUERIES: dict[str, tuple[Callable[[], Executable], Executable]] = {
+    "get_by_id": (
+        lambda: select(IdentityBase).where(IdentityBase.identity_id == uuid.uuid4()),
+        identity_repository.GET_BY_ID,
+    ),
+    "get_by_username": (
+        lambda: select(IdentityBase).where(IdentityBase.username == "username"),
+        identity_repository.GET_BY_USERNAME,
+    ),
+    "exists_by_username": (
+        lambda: select(exists().where(IdentityBase.username == "username")),
+        identity_repository.EXISTS_BY_USERNAME,
+    ),
+    "tokens.get": (
+        lambda: select(TokenBase).where(TokenBase.token_id == uuid.uuid4()),
+        refresh_token_repository.GET_BY_ID,
+    ),
+}
+
+
+def measure(
+    build: Callable[[], Executable],
+    cache: LRUCache[Any, Any] | None,
+    args: argparse.Namespace,
+) -> float:
+    dialect = PGDialect_asyncpg()  # type: ignore[no-untyped-call]
+
+    def run() -> None:
+        build()._compile_w_cache(  # noqa: SLF001
+            dialect, compiled_cache=cache, column_keys=[]
+        )
+
+    return min(timeit.repeat(run, number=args.number, repeat=args.repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cache-size", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'query':<20}{'inline us':>12}{'precompiled us':>16}{'speedup':>10}")
+    for name, (inline, precompiled) in QUERIES.items():
+        cache: LRUCache[Any, Any] | None = (
+            LRUCache(args.cache_size) if args.cache_size else None
+        )
+        before = measure(inline, cache, args) / args.number
+        after = measure(lambda stmt=precompiled: stmt, cache, args) / args.number  # type: ignore[misc]
+        print(
+            f"{name:<20}{before * 1e6:>12.1f}{after * 1e6:>16.1f}"
+            f"{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 from bootstrap.config import AppConfig
 from bootstrap.utils import log_config
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from common.infrastructure.app.app import App
 from common.infrastructure.database.sqlalchemy.database import Database
 from common.infrastructure.di.container.container import CommonContainer
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
 from common.infrastructure.server.fastapi.server import FastAPIServer
+from common.infrastructure.tasks.periodic_task import PeriodicTask
 from idp.auth.infrastructure.app.app import AuthApp, TokenApp
 from idp.auth.infrastructure.di.container.container import AuthContainer, TokenContainer
 from idp.identity.infrastructure.app.app import IdentityApp
@@ -28,28 +30,82 @@ def main() -> App:
     logger.info("setting up FastAPI server...")
     server = FastAPIServer(logger)
     server.on_tear_down(database.shutdown)
+
+    replicas = database.get_replica_set()
+    if replicas is not None:
+        replica_health = PeriodicTask(
+            "replica-health",
+            replicas.check,
+            config.db.replica_health_check_interval.total_seconds(),
+            logger,
+        )
+        server.on_start_up(replicas.check)
+        server.on_start_up(replica_health.start)
+        server.on_tear_down(replica_health.stop)
     logger.info("FastAPI server setup complete")
 
     common_container = CommonContainer(config=config, database=database)
+    server.override_dependency(IUnitOfWork, common_container.unit_of_work())
     uuid_generator = common_container.uuid_generator
     query_executor = common_container.query_executor
+    driver_executor = common_container.driver_executor
+    repository_driver = common_container.repository_driver
     clock = common_container.clock
 
     identity_container = IdentityContainer(
         uuid_generator=uuid_generator,
         query_executor=query_executor,
+        driver_executor=driver_executor,
+        repository_driver=repository_driver,
         token_introspector=None,  # NOTE: Need to be overriden later
+        password_hasher_config=config.password_hasher,
     )
+    server.on_tear_down(identity_container.async_password_hasher().shutdown)
 
     token_container = TokenContainer(
         auth_config=config.auth,
         clock=clock,
         uuid_generator=uuid_generator,
         token_generator=common_container.token_generator,
+        unit_of_work=common_container.unit_of_work,
         query_executor=query_executor,
+        driver_executor=driver_executor,
+        repository_driver=repository_driver,
         identity_repository=identity_container.identity_repository,
     )
 
+    token_partition_manager = token_container.token_partition_manager()
+    token_partitions = PeriodicTask(
+        "token-partitions",
+        token_partition_manager.maintain,
+        config.auth.token_partition_maintenance_interval.total_seconds(),
+        logger,
+    )
+    server.on_start_up(token_partition_manager.maintain)
+    server.on_start_up(token_partitions.start)
+    server.on_tear_down(token_partitions.stop)
+
+    revocation_list = token_container.access_token_revocation_list()
+    revocation_refresh = PeriodicTask(
+        "access-token-revocations",
+        revocation_list.refresh,
+        config.auth.revocation_refresh_interval.total_seconds(),
+        logger,
+    )
+    server.on_start_up(revocation_list.rebuild)
+    server.on_start_up(revocation_refresh.start)
+    server.on_tear_down(revocation_refresh.stop)
+
+    if config.auth.reaper_enabled:
+        token_reaper = PeriodicTask(
+            "token-reaper",
+            token_container.token_reaper().reap,
+            config.auth.reaper_interval.total_seconds(),
+            logger,
+        )
+        server.on_start_up(token_reaper.start)
+        server.on_tear_down(token_reaper.stop)
+
     identity_container.token_introspector.override(token_container.token_introspector)
 
     auth_container = AuthContainer(
@@ -7,6 +7,9 @@ from bootstrap.utils import log_config
 from common.infrastructure.database.sqlalchemy.database import Database
 from common.infrastructure.database.sqlalchemy.models.base import Base
 from common.infrastructure.logger.logging.logger_factory import LoggerFactory
+from idp.auth.infrastructure.database.postgres.sqlalchemy.models.revoked_access_token_base import (
+    RevokedAccessTokenBase,
+)
 from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
     TokenBase,
 )
@@ -18,7 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 
 # Needed for proper database configuration, e.g. fkeys and tables
-__models__: list[type[Base]] = [IdentityBase, TokenBase]
+__models__: list[type[Base]] = [IdentityBase, TokenBase, RevokedAccessTokenBase]
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -34,6 +37,8 @@ if config.config_file_name is not None:
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 cfg = AppConfig.load()
+# NOTE: Lets revisions read application settings, e.g. the partition period
+config.attributes["app_config"] = cfg
 
 logger = LoggerFactory.create(__name__, cfg.env, cfg.logger)
 log_config(logger, cfg)
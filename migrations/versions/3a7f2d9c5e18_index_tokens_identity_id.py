@@ -0,0 +1,31 @@
+"""index tokens identity_id
+
+Revision ID: 3a7f2d9c5e18
+Revises: 8d1e4b6a2c07
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a7f2d9c5e18"
+down_revision: str | Sequence[str] | None = "8d1e4b6a2c07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTE: Created on every partition of tokens, including future ones
+    op.create_index(
+        op.f("ix_tokens_identity_id"), "tokens", ["identity_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_tokens_identity_id"), table_name="tokens")
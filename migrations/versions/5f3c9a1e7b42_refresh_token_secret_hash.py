@@ -0,0 +1,33 @@
+"""refresh token secret hash
+
+Revision ID: 5f3c9a1e7b42
+Revises: db2b7a2b032a
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5f3c9a1e7b42"
+down_revision: str | Sequence[str] | None = "db2b7a2b032a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tokens", sa.Column("secret_hash", sa.LargeBinary(), nullable=True))
+    op.alter_column("tokens", "value", existing_type=sa.String(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # NOTE: Hashed tokens cannot be restored to plaintext, their owners log in again
+    op.execute("DELETE FROM tokens WHERE value IS NULL")
+    op.alter_column("tokens", "value", existing_type=sa.String(), nullable=False)
+    op.drop_column("tokens", "secret_hash")
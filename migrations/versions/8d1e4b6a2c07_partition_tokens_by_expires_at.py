@@ -0,0 +1,131 @@
+"""partition tokens by expires_at
+
+Revision ID: 8d1e4b6a2c07
+Revises: 5f3c9a1e7b42
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import sqlalchemy as sa
+from alembic import context, op
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d1e4b6a2c07"
+down_revision: str | Sequence[str] | None = "5f3c9a1e7b42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# NOTE: Must match TokenPartition naming
+NAME_FORMAT = "%Y%m%d%H%M"
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+COLUMNS = (
+    "token_id, identity_id, value, secret_hash, issued_at, expires_at, revoked, "
+    "created_at, updated_at"
+)
+
+
+def _columns() -> list[sa.Column[object]]:
+    return [
+        sa.Column("token_id", sa.UUID(), nullable=False),
+        sa.Column("identity_id", sa.UUID(), nullable=False),
+        sa.Column("value", sa.String(), nullable=True),
+        sa.Column("secret_hash", sa.LargeBinary(), nullable=True),
+        sa.Column("issued_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("revoked", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def _period() -> timedelta:
+    """The configured `token_partition_period`, so maintenance continues the ranges."""
+    app_config = context.config.attributes.get("app_config")
+    if app_config is not None:
+        period: timedelta = app_config.auth.token_partition_period
+        return period
+    default: timedelta = AuthConfig.model_fields["token_partition_period"].default
+    return default
+
+
+def _create_partitions(low: datetime, high: datetime) -> None:
+    period = _period()
+    start = EPOCH + (low - EPOCH) // period * period
+    while start <= high:
+        end = start + period
+        name = f"tokens_p{start.strftime(NAME_FORMAT)}_{end.strftime(NAME_FORMAT)}"
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF tokens "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table("tokens", "tokens_unpartitioned")
+    op.execute("ALTER INDEX tokens_pkey RENAME TO tokens_unpartitioned_pkey")
+    op.execute("ALTER INDEX tokens_value_key RENAME TO tokens_unpartitioned_value_key")
+
+    op.create_table(
+        "tokens",
+        *_columns(),
+        sa.PrimaryKeyConstraint("token_id", "expires_at"),
+        sa.UniqueConstraint("value", "expires_at"),
+        postgresql_partition_by="RANGE (expires_at)",
+    )
+    op.execute("CREATE TABLE tokens_default PARTITION OF tokens DEFAULT")
+
+    # NOTE: Expired tokens are not carried over
+    low, high = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT min(expires_at), max(expires_at) FROM tokens_unpartitioned "
+                "WHERE expires_at > now()"
+            )
+        )
+        .one()
+    )
+    if low is not None:
+        _create_partitions(low.astimezone(UTC), high.astimezone(UTC))
+
+    op.execute(
+        f"INSERT INTO tokens ({COLUMNS}) SELECT {COLUMNS} "
+        "FROM tokens_unpartitioned WHERE expires_at > now()"
+    )
+    op.drop_table("tokens_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "tokens_unpartitioned",
+        *_columns(),
+        sa.PrimaryKeyConstraint("token_id", name="tokens_unpartitioned_pkey"),
+        sa.UniqueConstraint("value", name="tokens_unpartitioned_value_key"),
+    )
+    op.execute(
+        f"INSERT INTO tokens_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM tokens"
+    )
+    op.drop_table("tokens")  # NOTE: Drops every partition as well
+
+    op.rename_table("tokens_unpartitioned", "tokens")
+    op.execute("ALTER INDEX tokens_unpartitioned_pkey RENAME TO tokens_pkey")
+    op.execute("ALTER INDEX tokens_unpartitioned_value_key RENAME TO tokens_value_key")
@@ -0,0 +1,55 @@
+"""revoked access tokens
+
+Revision ID: c4e8a1f06d93
+Revises: 3a7f2d9c5e18
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a1f06d93"
+down_revision: str | Sequence[str] | None = "3a7f2d9c5e18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "revoked_access_tokens",
+        sa.Column("jti", sa.UUID(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index(
+        op.f("ix_revoked_access_tokens_expires_at"),
+        "revoked_access_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_revoked_access_tokens_expires_at"), table_name="revoked_access_tokens"
+    )
+    op.drop_table("revoked_access_tokens")
@@ -0,0 +1,34 @@
+"""token version
+
+Revision ID: e1b7c3a94f25
+Revises: c4e8a1f06d93
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1b7c3a94f25"
+down_revision: str | Sequence[str] | None = "c4e8a1f06d93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NOTE: A constant default is stored in the catalog, so no partition is
+    # rewritten
+    op.add_column(
+        "tokens",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("tokens", "version")
@@ -4,15 +4,22 @@ from common.infrastructure.config.config import Settings
 from common.infrastructure.config.database_config import DatabaseConfig
 from common.infrastructure.config.logger_config import LoggerConfig
 from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.identity.infrastructure.config.password_hasher_config import (
+    PasswordHasherConfig,
+)
 
 
 class AppConfig(Settings):
     auth: AuthConfig
     db: DatabaseConfig
     logger: LoggerConfig
+    password_hasher: PasswordHasherConfig = PasswordHasherConfig()
 
     def masked_dict(self) -> dict[str, Any]:
         return self.model_dump(
             mode="json",
-            exclude={"db": {"db_pass"}, "auth": {"secret_key", "algorithm"}},
+            exclude={
+                "db": {"db_pass", "replica_urls"},
+                "auth": {"secret_key", "algorithm"},
+            },
         )
@@ -20,14 +20,31 @@ class NotFoundError(ApplicationError):
         self.entity_id = entity_id
 
 
+class ServiceUnavailableError(ApplicationError): ...
+
+
 class RepositoryError(ApplicationError): ...
 
 
-class OptimisticLockError(RepositoryError):
+class TransactionConflictError(RepositoryError):
+    """The transaction lost a race with a concurrent one and can be re-run."""
+
+
+class OptimisticLockError(TransactionConflictError):
     def __init__(self, message: str = "Concurrent update"):
         super().__init__(message)
 
 
+class SerializationFailureError(TransactionConflictError):
+    def __init__(self, message: str = "Could not serialize access"):
+        super().__init__(message)
+
+
+class DeadlockDetectedError(TransactionConflictError):
+    def __init__(self, message: str = "Deadlock detected"):
+        super().__init__(message)
+
+
 class DuplicateEntryError(RepositoryError):
     def __init__(self, field: str, value: str):
         self.field = field
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+
+KEY = TypeVar("KEY", bound=Hashable)
+VALUE = TypeVar("VALUE")
+
+
+class IDataLoader(ABC, Generic[KEY, VALUE]):
+    @abstractmethod
+    async def load(self, key: KEY) -> VALUE | None: ...
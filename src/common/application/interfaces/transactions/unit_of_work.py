@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
-from typing import Self
+from typing import Self, TypeVar
+
+
+RESULT = TypeVar("RESULT")
 
 
 class IUnitOfWork(ABC):
@@ -10,6 +15,23 @@ class IUnitOfWork(ABC):
     @abstractmethod
     async def rollback(self) -> None: ...
 
+    @abstractmethod
+    def read_only(self) -> AbstractAsyncContextManager[Self]: ...
+
+    @abstractmethod
+    def scope(self) -> AbstractAsyncContextManager[Self]: ...
+
+    @abstractmethod
+    def is_bound(self) -> bool: ...
+
+    @abstractmethod
+    async def run(
+        self,
+        func: Callable[[], Awaitable[RESULT]],
+        retries: int = 3,
+        backoff: float = 0.05,
+    ) -> RESULT: ...
+
     @abstractmethod
     async def __aenter__(self) -> Self: ...
 
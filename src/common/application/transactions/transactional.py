@@ -0,0 +1,38 @@
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+
+
+class HasUnitOfWork(Protocol):
+    uow: IUnitOfWork
+
+
+SELF = TypeVar("SELF", bound=HasUnitOfWork)
+PARAMS = ParamSpec("PARAMS")
+RESULT = TypeVar("RESULT")
+
+
+def transactional(
+    retries: int = 3, backoff: float = 0.05
+) -> Callable[
+    [Callable[Concatenate[SELF, PARAMS], Awaitable[RESULT]]],
+    Callable[Concatenate[SELF, PARAMS], Coroutine[Any, Any, RESULT]],
+]:
+    """Run a method in `self.uow.run`, retrying it on transaction conflicts."""
+
+    def decorator(
+        func: Callable[Concatenate[SELF, PARAMS], Awaitable[RESULT]],
+    ) -> Callable[Concatenate[SELF, PARAMS], Coroutine[Any, Any, RESULT]]:
+        @wraps(func)
+        async def wrapper(
+            self: SELF, /, *args: PARAMS.args, **kwargs: PARAMS.kwargs
+        ) -> RESULT:
+            return await self.uow.run(
+                lambda: func(self, *args, **kwargs), retries, backoff
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,75 @@
+import hashlib
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BloomFilterMetrics:
+    size: int
+    capacity: int
+    bits: int
+    hashes: int
+    fill_ratio: float
+
+
+class BloomFilter:
+    """Fixed-size set membership filter with no false negatives.
+
+    Sized for `capacity` items at `error_rate` false positives. Positions are
+    derived from one BLAKE2b digest by double hashing. Items cannot be removed,
+    so owners rebuild the filter once it holds stale or too many items.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Error rate must be in (0, 1), got {error_rate}")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self._size = 0
+
+    def add(self, item: bytes) -> None:
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self._size += 1
+
+    def update(self, items: Iterable[bytes]) -> None:
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of `add` calls, duplicates included."""
+        return self._size
+
+    def is_saturated(self) -> bool:
+        return self._size >= self.capacity
+
+    def get_metrics(self) -> BloomFilterMetrics:
+        set_bits = sum(byte.bit_count() for byte in self._array)
+        return BloomFilterMetrics(
+            size=self._size,
+            capacity=self.capacity,
+            bits=self.bits,
+            hashes=self.hashes,
+            fill_ratio=set_bits / self.bits,
+        )
+
+    def _positions(self, item: bytes) -> Iterable[int]:
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.bits for i in range(self.hashes))
@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+
+KEY = TypeVar("KEY", bound=Hashable)
+VALUE = TypeVar("VALUE")
+
+
+@dataclass(frozen=True)
+class CacheMetrics:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class TTLCache(Generic[KEY, VALUE]):
+    """In-process LRU cache where every entry carries its own deadline.
+
+    Deadlines are absolute timestamps of `timer` (wall clock by default), so an
+    entry can be made to expire exactly when the data it describes does. When
+    `max_size` is reached the least recently used entry is evicted. A cache
+    with `max_size == 0` stores nothing.
+
+    Not thread-safe; intended to be owned by a single event loop.
+    """
+
+    def __init__(self, max_size: int, timer: Callable[[], float] = time.time) -> None:
+        self.max_size = max_size
+        self.timer = timer
+        self._entries: OrderedDict[KEY, tuple[VALUE, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: KEY) -> VALUE | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= self.timer():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: KEY, value: VALUE, expires_at: float) -> None:
+        if self.max_size <= 0 or expires_at <= self.timer():
+            return
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def set_for(self, key: KEY, value: VALUE, ttl: float) -> None:
+        self.set(key, value, self.timer() + ttl)
+
+    def delete(self, key: KEY) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_metrics(self) -> CacheMetrics:
+        return CacheMetrics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self.max_size,
+        )
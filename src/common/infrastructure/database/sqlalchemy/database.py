@@ -1,8 +1,21 @@
 import logging
+from dataclasses import asdict
 from typing import Self
 
-from common.infrastructure.config.database_config import DatabaseConfig
-from common.infrastructure.database.sqlalchemy.session_factory import MAKER
+from common.infrastructure.config.database_config import (
+    REPLICA_HEALTH_CHECK_TIMEOUT,
+    DatabaseConfig,
+)
+from common.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    PoolMonitor,
+)
+from common.infrastructure.database.sqlalchemy.replicas import Replica, ReplicaSet
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MAKER,
+    ReadOnlySession,
+)
 from sqlalchemy import MetaData, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -12,10 +25,23 @@ from sqlalchemy.ext.asyncio import (
 
 
 class Database:
-    def __init__(self, engine: AsyncEngine, logger: logging.Logger):
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        logger: logging.Logger,
+        replica_engines: list[AsyncEngine] | None = None,
+        replica_health_check_timeout: float = (
+            REPLICA_HEALTH_CHECK_TIMEOUT.total_seconds()
+        ),
+    ):
         self._engine = engine
         self._logger = logger
-        self._create_session_maker()
+        self._pool_monitor = PoolMonitor(engine)
+        self._session_maker = self._create_session_maker(engine)
+        self._read_only_session_maker = self._create_read_only_session_maker(engine)
+        self._replicas = self._create_replica_set(
+            replica_engines or [], replica_health_check_timeout
+        )
 
     @classmethod
     def create(
@@ -24,25 +50,66 @@ class Database:
         return cls(
             engine=cls.create_engine(config),
             logger=logger or logging.getLogger(),
+            replica_engines=[
+                cls.create_engine(config, url) for url in config.replica_urls
+            ],
+            replica_health_check_timeout=(
+                config.replica_health_check_timeout.total_seconds()
+            ),
         )
 
     @staticmethod
-    def create_engine(config: DatabaseConfig) -> AsyncEngine:
+    def create_engine(config: DatabaseConfig, url: str | None = None) -> AsyncEngine:
         return create_async_engine(
-            config.database_url, echo=False
-        )  # echo=True for detailed logs
+            url or config.database_url,
+            echo=False,  # echo=True for detailed logs
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **config.engine_options,
+        )
+
+    def _create_session_maker(self, engine: AsyncEngine) -> MAKER:
+        return async_sessionmaker(bind=engine, expire_on_commit=False)
 
-    def _create_session_maker(self) -> None:
-        self._session_maker = async_sessionmaker(
-            bind=self._engine, expire_on_commit=False
+    def _create_read_only_session_maker(self, engine: AsyncEngine) -> MAKER:
+        # NOTE: No BEGIN/COMMIT round trips; each statement sees its own snapshot.
+        # Writes would commit one by one, so the session rejects them.
+        return async_sessionmaker(
+            bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+            expire_on_commit=False,
+            sync_session_class=ReadOnlySession,
         )
 
+    def _create_replica_set(
+        self, engines: list[AsyncEngine], health_check_timeout: float
+    ) -> ReplicaSet | None:
+        if not engines:
+            return None
+
+        replicas = [
+            Replica(
+                name=engine.url.render_as_string(hide_password=True),
+                engine=engine,
+                maker=self._create_read_only_session_maker(engine),
+            )
+            for engine in engines
+        ]
+        return ReplicaSet(replicas, self._logger, health_check_timeout)
+
     def get_engine(self) -> AsyncEngine:
         return self._engine
 
     def get_session_maker(self) -> MAKER:
         return self._session_maker
 
+    def get_read_only_session_maker(self) -> MAKER:
+        return self._read_only_session_maker
+
+    def get_replica_set(self) -> ReplicaSet | None:
+        return self._replicas
+
+    def get_pool_metrics(self) -> PoolMetrics:
+        return self._pool_monitor.get_metrics()
+
     async def truncate_database(self, metadata: MetaData) -> None:
         async with self._engine.begin() as conn:
             table_names = [table.name for table in metadata.sorted_tables]
@@ -55,6 +122,11 @@ class Database:
             await conn.execute(stmt)
 
     async def shutdown(self) -> None:
-        self._logger.info("disposing database engine...")
+        self._logger.info(
+            "disposing database engine...",
+            extra={"extra": {"pool": asdict(self.get_pool_metrics())}},
+        )
         await self._engine.dispose()
+        if self._replicas is not None:
+            await self._replicas.dispose()
         self._logger.info("database engine disposed gracefully")
@@ -0,0 +1,97 @@
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, Protocol
+
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+class Record(Protocol):
+    def __getitem__(self, key: str) -> Any: ...
+
+
+async def get_driver_connection(connection: AsyncConnection, begin: bool = True) -> Any:
+    """Return the asyncpg connection behind `connection`, inside its transaction.
+
+    SQLAlchemy's asyncpg adapter sends BEGIN lazily with its first statement,
+    which calls made on the driver connection bypass; a write would then
+    commit on its own instead of with the unit of work. With `begin`, a
+    transaction the driver has not started yet is started through SQLAlchemy
+    with a no-op statement, one extra round trip that only bulk calls such as
+    COPY should pay; `AsyncpgExecutor` avoids it. Autocommit connections
+    never start one, so pass `begin=False` for them.
+    """
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    if begin and not driver.is_in_transaction():  # type: ignore[union-attr]
+        await connection.exec_driver_sql("SELECT 1")
+    return driver
+
+
+class AsyncpgExecutor:
+    """Runs raw SQL on the asyncpg connection behind the unit of work's session.
+
+    Skips SQLAlchemy statement compilation, result processing and the ORM, so
+    queries are `$n` SQL strings that asyncpg prepares once per connection and
+    rows are asyncpg records. Connections come from the same pool and join the
+    current transaction exactly like `QueryExecutor`; outside a transaction
+    each call runs in its own unit of work. Requires the asyncpg driver.
+    """
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        self.uow = uow
+
+    async def fetchrow(
+        self, query: str, *args: Any, read_only: bool = False
+    ) -> Record | None:
+        async with self._connection(read_only) as (connection, driver):
+            if driver is None:
+                result = await connection.exec_driver_sql(query, args)
+                return result.mappings().first()
+            record: Record | None = await driver.fetchrow(query, *args)
+            return record
+
+    async def fetch(
+        self, query: str, *args: Any, read_only: bool = False
+    ) -> Sequence[Record]:
+        async with self._connection(read_only) as (connection, driver):
+            if driver is None:
+                result = await connection.exec_driver_sql(query, args)
+                return result.mappings().all()
+            records: Sequence[Record] = await driver.fetch(query, *args)
+            return records
+
+    async def fetchval(self, query: str, *args: Any, read_only: bool = False) -> Any:
+        async with self._connection(read_only) as (connection, driver):
+            if driver is None:
+                return (await connection.exec_driver_sql(query, args)).scalar()
+            return await driver.fetchval(query, *args)
+
+    async def execute(self, query: str, *args: Any) -> None:
+        async with self._connection(read_only=False) as (connection, driver):
+            if driver is None:
+                await connection.exec_driver_sql(query, args)
+            else:
+                await driver.execute(query, *args)
+
+    @asynccontextmanager
+    async def _connection(
+        self, read_only: bool
+    ) -> AsyncGenerator[tuple[AsyncConnection, Any | None], None]:
+        """Yield the session's connection and the asyncpg one, if usable.
+
+        SQLAlchemy's asyncpg adapter sends BEGIN lazily with the first
+        statement of a transaction, which a driver call would bypass. Until
+        the driver is in a transaction the asyncpg connection is withheld and
+        the statement runs through `exec_driver_sql`, so BEGIN goes out with
+        it and costs no extra round trip. Read-only sessions are autocommit
+        and never begin, so they always get the driver.
+        """
+        async with self.uow.get_session(read_only) as session:
+            connection = await session.connection()
+            raw = await connection.get_raw_connection()
+            driver: Any = raw.driver_connection
+            if read_only or driver.is_in_transaction():
+                yield connection, driver
+            else:
+                yield connection, None
@@ -1,16 +1,41 @@
-from collections.abc import Sequence
-from typing import Any, TypeVar, overload
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from typing import Any, TypeVar, cast, overload
 
+from common.application.exceptions import OptimisticLockError
+from common.infrastructure.database.sqlalchemy.driver_executor import (
+    get_driver_connection,
+)
 from common.infrastructure.database.sqlalchemy.models.base import Base
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
-from sqlalchemy import Delete, Insert, Result, Row, Select, Update
+from sqlalchemy import (
+    CursorResult,
+    Delete,
+    Insert,
+    Result,
+    Row,
+    Select,
+    Update,
+    insert,
+    inspect,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase, InstanceState, QueryableAttribute
 from sqlalchemy.sql.dml import (
     ReturningInsert,
     ReturningUpdate,
 )
+from sqlalchemy.sql.elements import ColumnElement, TextClause
 
 
 RESULT = TypeVar("RESULT")
+ROW = TypeVar("ROW", bound=tuple[Any, ...])
+PARAMS = Mapping[str, Any]
+YIELD_PER = 1000
+CHUNK_SIZE = 5000
+T = TypeVar("T")
 
 
 class QueryExecutor:
@@ -27,8 +52,9 @@ class QueryExecutor:
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> RESULT:
-        return (await self.execute(statement)).unique().scalar_one()
+        return (await self.execute(statement, params)).unique().scalar_one()
 
     async def execute_scalar_one(
         self,
@@ -40,8 +66,9 @@ class QueryExecutor:
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> RESULT | None:
-        return (await self.execute(statement)).unique().scalar_one_or_none()
+        return (await self.execute(statement, params)).unique().scalar_one_or_none()
 
     async def execute_scalar_many(
         self,
@@ -53,49 +80,133 @@ class QueryExecutor:
             | ReturningInsert[tuple[RESULT]]
             | ReturningUpdate[tuple[RESULT]]
         ),
+        params: PARAMS | None = None,
     ) -> Sequence[RESULT]:
-        return (await self.execute(statement)).unique().scalars().all()
+        return (await self.execute(statement, params)).unique().scalars().all()
 
     async def execute_one(
         self,
-        statement: Select[tuple[RESULT, ...]],
-    ) -> Row[tuple[RESULT]] | None:
-        return (await self.execute(statement)).unique().one_or_none()
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Row[ROW] | None:
+        return (await self.execute(statement, params)).unique().one_or_none()
 
     async def execute_many(
         self,
-        statement: Select[tuple[RESULT, ...]],
-    ) -> Sequence[Row[tuple[RESULT]]]:
-        return (await self.execute(statement)).unique().all()
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Sequence[Row[ROW]]:
+        return (await self.execute(statement, params)).unique().all()
+
+    async def execute_core_one(
+        self,
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Row[ROW] | None:
+        """Return one plain row of a Core select.
+
+        Rows are not registered in the identity map nor deduplicated, so map
+        them with `Mapper.from_row`. The statement must select table columns,
+        not ORM entities or attributes.
+        """
+        return (await self.execute(statement, params)).one_or_none()
+
+    async def execute_core_many(
+        self,
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+    ) -> Sequence[Row[ROW]]:
+        """Return the plain rows of a Core select, see `execute_core_one`."""
+        return (await self.execute(statement, params)).all()
+
+    async def stream_scalars(
+        self,
+        statement: Select[tuple[RESULT]],
+        params: PARAMS | None = None,
+        yield_per: int = YIELD_PER,
+    ) -> AsyncIterator[RESULT]:
+        """Iterate a select through a server-side cursor, `yield_per` at a time.
+
+        Entities of a partition are expunged before the next one is fetched,
+        so memory stays flat however many rows the scan reads, and changes
+        made to them are not flushed. Postgres only opens cursors inside a
+        transaction, so do not stream within `read_only()`. Close the iterator
+        (e.g. with `contextlib.aclosing`) when stopping early.
+        """
+        async with self.uow.get_session() as session:
+            result = await session.stream_scalars(
+                statement.execution_options(yield_per=yield_per), params
+            )
+            async for partition in result.partitions():
+                for item in partition:
+                    yield item
+                self._release(session, partition)
+
+    async def stream_rows(
+        self,
+        statement: Select[ROW],
+        params: PARAMS | None = None,
+        yield_per: int = YIELD_PER,
+    ) -> AsyncIterator[Row[ROW]]:
+        """Iterate the rows of a select, see `stream_scalars`."""
+        async with self.uow.get_session() as session:
+            result = await session.stream(
+                statement.execution_options(yield_per=yield_per), params
+            )
+            async for partition in result.partitions():
+                for row in partition:
+                    yield row
+                for row in partition:
+                    self._release(session, row)
 
     @overload
     async def execute(
-        self, statement: Select[tuple[RESULT]]
+        self, statement: Select[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
     async def execute(
-        self, statement: Select[tuple[RESULT, ...]]
-    ) -> Result[tuple[RESULT]]: ...
+        self, statement: Select[ROW], params: PARAMS | None = None
+    ) -> Result[ROW]: ...
     @overload
     async def execute(  # type: ignore[overload-overlap]
-        self, statement: ReturningInsert[tuple[RESULT]]
+        self, statement: ReturningInsert[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
     async def execute(  # type: ignore[overload-overlap]
-        self, statement: ReturningUpdate[tuple[RESULT]]
+        self, statement: ReturningUpdate[tuple[RESULT]], params: PARAMS | None = None
     ) -> Result[tuple[RESULT]]: ...
     @overload
-    async def execute(self, statement: Insert) -> Result[tuple[()]]: ...
+    async def execute(
+        self, statement: Insert, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
+    @overload
+    async def execute(
+        self, statement: Update, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
     @overload
-    async def execute(self, statement: Update) -> Result[tuple[()]]: ...
+    async def execute(
+        self, statement: Delete, params: PARAMS | None = None
+    ) -> Result[tuple[()]]: ...
     @overload
-    async def execute(self, statement: Delete) -> Result[tuple[()]]: ...
+    async def execute(
+        self, statement: TextClause, params: PARAMS | None = None
+    ) -> Result[Any]: ...
 
-    async def execute(self, statement: Any) -> Result[Any]:
-        async with self.uow.get_session() as session:
-            result = await session.execute(statement)
+    async def execute(
+        self, statement: Any, params: PARAMS | None = None
+    ) -> Result[Any]:
+        # NOTE: A SELECT outside a transaction needs neither BEGIN nor COMMIT
+        read_only = isinstance(statement, Select)
+        async with self.uow.get_session(read_only) as session:
+            result = await session.execute(statement, params)
             return result  # type: ignore[no-any-return]
 
+    async def execute_rowcount(
+        self, statement: Update | Delete, params: PARAMS | None = None
+    ) -> int:
+        result = await self.execute(statement, params)
+        return cast(CursorResult[Any], result).rowcount
+
     async def add(
         self,
         model: Base,
@@ -114,8 +225,160 @@ class QueryExecutor:
 
     async def save(
         self,
-        model: Base,
+        model: DeclarativeBase,
     ) -> None:
-        async with self.uow.get_session() as session:
-            model = await session.merge(model)
-            await session.flush()
+        """Write a detached `model` back.
+
+        Models with a `version_id_col` go through `update_versioned`: one
+        UPDATE of the attributes set on `model`, keyed by its primary key and
+        the version it was read at, which then bumps the version on `model`.
+        Other models are merged, which SELECTs the row first.
+        """
+        mapper = inspect(type(model))
+        if mapper.version_id_col is None:
+            async with self.uow.get_session() as session:
+                model = await session.merge(model)
+                await session.flush()
+            return
+
+        state = inspect(model)
+        version_key = mapper.get_property_by_column(mapper.version_id_col).key
+        primary_keys = {
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        }
+        values = {
+            prop.key: state.dict[prop.key]
+            for prop in mapper.column_attrs
+            if prop.key in state.dict and prop.key not in {*primary_keys, version_key}
+        }
+        version = await self.update_versioned(
+            type(model),
+            {key: state.dict[key] for key in primary_keys},
+            values,
+            state.dict[version_key],
+        )
+        setattr(model, version_key, version)
+
+    async def update_versioned(
+        self,
+        model: type[DeclarativeBase],
+        key: PARAMS,
+        values: PARAMS,
+        version: int,
+    ) -> int:
+        """Set `values` on the row matching `key` if it is still at `version`.
+
+        Sends a single `UPDATE ... WHERE <key> AND version = :version` that
+        also bumps the `version_id_col` of `model`, with no SELECT first.
+        Returns the new version and raises
+        `OptimisticLockError` when the row was changed or deleted meanwhile.
+        """
+        mapper = inspect(model)
+        version_column = mapper.version_id_col
+        if version_column is None:
+            raise ValueError(f"{model.__name__} has no version_id_col")
+
+        stmt = (
+            update(model)
+            .where(
+                *(mapper.columns[column] == value for column, value in key.items()),
+                version_column == version,
+            )
+            .values({**values, version_column.key: version + 1})
+            .execution_options(synchronize_session=False)
+        )
+        if await self.execute_rowcount(stmt) == 0:
+            raise OptimisticLockError()
+        return version + 1
+
+    async def insert_many(
+        self,
+        model: type[DeclarativeBase],
+        rows: Iterable[PARAMS],
+        *returning: ColumnElement[Any] | QueryableAttribute[Any],
+        chunk_size: int = CHUNK_SIZE,
+    ) -> list[Row[Any]]:
+        """Insert `rows` with one batched statement per chunk.
+
+        The driver sends each chunk as multi-row INSERTs (insertmanyvalues)
+        instead of one statement per object. Rows of `returning` come back in
+        the order of `rows`. Outside a transaction every chunk commits on its
+        own, so a long job holds no locks or session state across chunks.
+        """
+        stmt = insert(model)
+        if returning:
+            stmt = stmt.returning(*returning, sort_by_parameter_order=True)
+        return await self._execute_chunks(stmt, rows, chunk_size, bool(returning))
+
+    async def upsert_many(
+        self,
+        model: type[DeclarativeBase],
+        rows: Iterable[PARAMS],
+        index_elements: Sequence[str],
+        update: Sequence[str] = (),
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Insert `rows`, updating the `update` columns on conflict.
+
+        Conflicting rows are skipped when `update` is empty. Chunks behave as
+        in `insert_many`.
+        """
+        stmt = postgresql.insert(model)
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={column: stmt.excluded[column] for column in update},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+        await self._execute_chunks(stmt, rows, chunk_size, False)
+
+    async def copy_records(
+        self,
+        model: type[DeclarativeBase],
+        columns: Sequence[str],
+        records: Iterable[Sequence[Any]],
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Load `records` into the table of `model` with asyncpg `COPY`.
+
+        Fastest path for large loads, but Python-side column defaults are not
+        applied and a conflict fails the whole chunk. Requires asyncpg; chunks
+        behave as in `insert_many`.
+        """
+        table = model.__table__
+        for chunk in self._chunks(records, chunk_size):
+            async with self.uow.get_session() as session:
+                driver = await get_driver_connection(await session.connection())
+                await driver.copy_records_to_table(
+                    table.name,  # type: ignore[attr-defined]
+                    records=chunk,
+                    columns=list(columns),
+                    schema_name=table.schema,
+                )
+
+    def _release(self, session: AsyncSession, objects: Iterable[Any]) -> None:
+        for obj in objects:
+            state = inspect(obj, raiseerr=False)
+            if isinstance(state, InstanceState) and obj in session:
+                session.expunge(obj)
+
+    async def _execute_chunks(
+        self,
+        statement: Insert,
+        rows: Iterable[PARAMS],
+        chunk_size: int,
+        returning: bool,
+    ) -> list[Row[Any]]:
+        result: list[Row[Any]] = []
+        for chunk in self._chunks(rows, chunk_size):
+            async with self.uow.get_session() as session:
+                chunk_result = await session.execute(statement, chunk)
+                if returning:
+                    result.extend(chunk_result.all())
+        return result
+
+    def _chunks(self, items: Iterable[T], size: int) -> Iterator[list[T]]:
+        iterator = iter(items)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
@@ -0,0 +1,117 @@
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    size: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    connects: int
+    checkouts: int
+    checkins: int
+    invalidations: int
+    timeouts: int
+    checkout_wait_total: float
+    checkout_wait_max: float
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` that measures how long checkouts wait.
+
+    Pool events fire only once a connection has been handed out, so callers
+    queued on an exhausted pool (and how long they queued) are tracked here.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waiters = 0
+        self.timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        # NOTE: Only a checkout on a pool at capacity queues; others are served
+        # an idle or new connection straight away
+        waiting = self._at_capacity()
+        if waiting:
+            self.waiters += 1
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started_at
+            if waiting:
+                self.waiters -= 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+
+    def _at_capacity(self) -> bool:
+        if self._max_overflow < 0:
+            return False
+        return self.checkedout() >= self.size() + self._max_overflow
+
+
+class PoolMonitor:
+    """Live connection pool gauges for an engine.
+
+    Counters come from pool events registered on the engine, so they survive
+    the pool being recreated on `dispose()`. Checkout waits are only known
+    when the engine uses `InstrumentedAsyncAdaptedQueuePool`.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+
+        target = engine.sync_engine
+        event.listen(target, "connect", self._on_connect)
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "checkin", self._on_checkin)
+        event.listen(target, "invalidate", self._on_invalidate)
+
+    def get_metrics(self) -> PoolMetrics:
+        pool = self.engine.sync_engine.pool
+        queue_pool = pool if isinstance(pool, AsyncAdaptedQueuePool) else None
+        instrumented = (
+            pool if isinstance(pool, InstrumentedAsyncAdaptedQueuePool) else None
+        )
+        return PoolMetrics(
+            size=queue_pool.size() if queue_pool else 0,
+            checked_out=queue_pool.checkedout() if queue_pool else 0,
+            overflow=max(queue_pool.overflow(), 0) if queue_pool else 0,
+            waiters=instrumented.waiters if instrumented else 0,
+            connects=self.connects,
+            checkouts=self.checkouts,
+            checkins=self.checkins,
+            invalidations=self.invalidations,
+            timeouts=instrumented.timeouts if instrumented else 0,
+            checkout_wait_total=(
+                instrumented.checkout_wait_total if instrumented else 0.0
+            ),
+            checkout_wait_max=instrumented.checkout_wait_max if instrumented else 0.0,
+        )
+
+    def _on_connect(self, *args: Any) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, *args: Any) -> None:
+        self.checkouts += 1
+
+    def _on_checkin(self, *args: Any) -> None:
+        self.checkins += 1
+
+    def _on_invalidate(self, *args: Any) -> None:
+        self.invalidations += 1
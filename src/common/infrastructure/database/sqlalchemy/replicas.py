@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from functools import partial
+
+from common.infrastructure.config.database_config import (
+    REPLICA_HEALTH_CHECK_TIMEOUT,
+)
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    maker: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+
+
+@dataclass(frozen=True)
+class ReplicaSetMetrics:
+    replicas: int
+    healthy: int
+    routed: int
+    unavailable: int
+    ejections: int
+
+
+class ReplicaSet:
+    """Read replicas served round-robin.
+
+    A replica that fails a health check, or drops or refuses a connection while
+    serving a session, is ejected from the rotation until a later check
+    succeeds. When no replica is healthy `next()` returns None and
+    callers fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        replicas: list[Replica],
+        logger: logging.Logger,
+        health_check_timeout: float = REPLICA_HEALTH_CHECK_TIMEOUT.total_seconds(),
+    ) -> None:
+        self.replicas = replicas
+        self.logger = logger
+        self.health_check_timeout = health_check_timeout
+        self._cursor = 0
+        self._routed = 0
+        self._unavailable = 0
+        self._ejections = 0
+        for replica in replicas:
+            event.listen(
+                replica.engine.sync_engine,
+                "handle_error",
+                partial(self._handle_error, replica),
+            )
+
+    def next(self) -> Replica | None:
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._cursor % len(self.replicas)]
+            self._cursor += 1
+            if replica.healthy:
+                self._routed += 1
+                return replica
+
+        self._unavailable += 1
+        return None
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    def eject(self, replica: Replica) -> None:
+        if not replica.healthy:
+            return
+        replica.healthy = False
+        self._ejections += 1
+        self.logger.warning(f"replica {replica.name} ejected")
+
+    def readmit(self, replica: Replica) -> None:
+        if replica.healthy:
+            return
+        replica.healthy = True
+        self.logger.info(f"replica {replica.name} readmitted")
+
+    async def dispose(self) -> None:
+        await asyncio.gather(*(replica.engine.dispose() for replica in self.replicas))
+
+    def get_metrics(self) -> ReplicaSetMetrics:
+        return ReplicaSetMetrics(
+            replicas=len(self.replicas),
+            healthy=sum(replica.healthy for replica in self.replicas),
+            routed=self._routed,
+            unavailable=self._unavailable,
+            ejections=self._ejections,
+        )
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                async with replica.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            self.logger.warning(f"replica {replica.name} health check failed: {e}")
+            self.eject(replica)
+        else:
+            self.readmit(replica)
+
+    def _handle_error(self, replica: Replica, context: ExceptionContext) -> None:
+        # NOTE: No connection means it failed while connecting
+        if context.is_disconnect or context.connection is None:
+            self.logger.warning(
+                f"replica {replica.name} connection failed: "
+                f"{context.original_exception}"
+            )
+            self.eject(replica)
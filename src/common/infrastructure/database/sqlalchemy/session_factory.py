@@ -1,24 +1,75 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
+from common.application.exceptions import RepositoryError
+from common.infrastructure.database.sqlalchemy.replicas import ReplicaSet
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
 
 
 class ISessionFactory(ABC):
     @abstractmethod
-    def create(self) -> AsyncSession: ...
+    def create(
+        self, read_only: bool = False, allow_replica: bool = True
+    ) -> AsyncSession: ...
 
 
 MAKER = async_sessionmaker[AsyncSession]
 
 
+class ReadOnlySession(Session):
+    """A session that rejects writes.
+
+    Read-only sessions run on autocommit connections, where every statement
+    commits on its own and a rollback has nothing to undo, so INSERT, UPDATE
+    and DELETE statements and flushes fail before reaching the database.
+    Textual SQL is not inspected.
+    """
+
+
+@event.listens_for(ReadOnlySession, "do_orm_execute")
+def _reject_dml(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        raise RepositoryError("Cannot write in a read-only transaction")
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session: Session, *args: Any) -> None:
+    raise RepositoryError("Cannot flush a read-only transaction")
+
+
 class MakerSessionFactory(ISessionFactory):
+    """Creates sessions on the primary, or on a replica for read-only work.
+
+    Read-only sessions come from `read_only_maker` (an autocommit engine,
+    see `ReadOnlySession`) when one is given, so they never issue BEGIN or
+    COMMIT.
+    """
+
     _maker: MAKER
 
-    def __init__(self, maker: MAKER) -> None:
+    def __init__(
+        self,
+        maker: MAKER,
+        replicas: ReplicaSet | None = None,
+        read_only_maker: MAKER | None = None,
+    ) -> None:
         self._maker = maker
+        self._replicas = replicas
+        self._read_only_maker = read_only_maker
+
+    def create(
+        self, read_only: bool = False, allow_replica: bool = True
+    ) -> AsyncSession:
+        if not read_only:
+            return self._maker()
 
-    def create(self) -> AsyncSession:
-        return self._maker()
+        if allow_replica and self._replicas is not None:
+            replica = self._replicas.next()
+            if replica is not None:
+                return replica.maker()
+        return (self._read_only_maker or self._maker)()
 
     def set_maker(self, maker: MAKER) -> None:
         self._maker = maker
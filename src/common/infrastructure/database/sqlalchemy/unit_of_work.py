@@ -1,20 +1,25 @@
+import asyncio
+import random
 import re
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
 from sqlite3 import IntegrityError
 from types import TracebackType
-from typing import Self
+from typing import Self, TypeVar
 
 import psycopg2
 import sqlalchemy.exc
 import sqlalchemy.orm
 from common.application.exceptions import (
     ApplicationError,
+    DeadlockDetectedError,
     DuplicateEntryError,
     OptimisticLockError,
     RepositoryError,
+    SerializationFailureError,
+    TransactionConflictError,
 )
 from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from common.infrastructure.database.sqlalchemy.session_factory import (
@@ -23,10 +28,17 @@ from common.infrastructure.database.sqlalchemy.session_factory import (
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+RESULT = TypeVar("RESULT")
+
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+
+
 @dataclass
 class Transaction:
     session: AsyncSession
     nesting_level: int = 0
+    read_only: bool = False
 
     def should_commit(self) -> bool:
         return self.nesting_level == 0
@@ -38,12 +50,45 @@ class Transaction:
         self.nesting_level -= 1
 
 
+@dataclass
+class TransactionScope:
+    transaction: Transaction | None = None
+
+
+@dataclass(frozen=True)
+class UnitOfWorkMetrics:
+    runs: int
+    conflicts: int
+    retries: int
+    exhausted: int
+    # NOTE: Conflicts inside an outer transaction, left to its owner to retry
+    propagated: int
+
+
 class UnitOfWork(IUnitOfWork):
-    def __init__(self, session_factory: ISessionFactory):
+    def __init__(self, session_factory: ISessionFactory, read_your_writes: bool = True):
         self.session_factory = session_factory
+        self.read_your_writes = read_your_writes
         self._current_transaction: ContextVar[Transaction | None] = ContextVar(
             "_current_transaction", default=None
         )
+        self._read_only: ContextVar[bool] = ContextVar("_read_only", default=False)
+        # NOTE: Only explicit read_only() may be served by a replica; implicit
+        # single-statement reads may be security checks that must not lag
+        self._allow_replica: ContextVar[bool] = ContextVar(
+            "_allow_replica", default=False
+        )
+        # NOTE: Set once the current context commits a write, so later reads
+        # are not served by a replica that may lag behind
+        self._pinned: ContextVar[bool] = ContextVar("_pinned", default=False)
+        self._scope: ContextVar[TransactionScope | None] = ContextVar(
+            "_scope", default=None
+        )
+        self._runs = 0
+        self._conflicts = 0
+        self._retries = 0
+        self._exhausted = 0
+        self._propagated = 0
 
     async def commit(self) -> None:
         session = self._get_session()
@@ -55,8 +100,15 @@ class UnitOfWork(IUnitOfWork):
         try:
             await session.commit()
         except Exception as e:
+            # NOTE: Serialization failures are usually only detected at commit
+            conflict = self._conflict_error(e)
+            if conflict is not None:
+                raise conflict from e
             raise RepositoryError("Unnable to commit transaction") from e
 
+        if self.read_your_writes and not self._get_transaction().read_only:
+            self._pinned.set(True)
+
     async def rollback(self) -> None:
         session = self._get_session()
 
@@ -93,43 +145,176 @@ class UnitOfWork(IUnitOfWork):
             self._handle_exception(exc_val)
 
     @asynccontextmanager
-    async def get_session(
+    async def read_only(self) -> AsyncGenerator[Self, None]:
+        """Open a transaction that only reads.
+
+        It may be served by a read replica unless this context has already
+        written, and is never committed: the session runs in autocommit mode,
+        so there is no BEGIN/COMMIT round trip. Inside an existing transaction
+        it joins that transaction.
+        """
+        async with self._read_only_transaction(allow_replica=True):
+            yield self
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncGenerator[Self, None]:
+        """Share one lazily opened transaction across this context.
+
+        The first unit of work entered inside the scope opens a read-write
+        transaction and every later one joins it instead of committing on its
+        own. The transaction is committed once when the scope exits, or rolled
+        back on error; a scope that never touches the database checks out no
+        connection. Inside a transaction or another scope this is a no-op.
+        """
+        if self._scope.get() is not None or self._transaction_exists():
+            yield self
+            return
+
+        scope = TransactionScope()
+        token = self._scope.set(scope)
+        try:
+            yield self
+        except BaseException:
+            await self._close_scope(scope, has_error=True)
+            raise
+        else:
+            await self._close_scope(scope, has_error=False)
+        finally:
+            self._scope.reset(token)
+
+    async def run(
         self,
+        func: Callable[[], Awaitable[RESULT]],
+        retries: int = 3,
+        backoff: float = 0.05,
+    ) -> RESULT:
+        """Run `func` in a unit of work, re-running it on transaction conflicts.
+
+        Optimistic-lock, serialization and deadlock failures roll the unit of
+        work back and re-run `func` in a fresh one up to `retries` times,
+        sleeping a random time of up to `backoff * 2 ** attempt` seconds in
+        between. Inside a transaction or scope only the outermost unit of work
+        could be re-run, so `func` runs once and conflicts propagate.
+        """
+        self._runs += 1
+        owns_transaction = not self._transaction_exists() and self._scope.get() is None
+        attempt = 0
+        while True:
+            try:
+                async with self:
+                    return await func()
+            except TransactionConflictError:
+                self._conflicts += 1
+                if not owns_transaction:
+                    self._propagated += 1
+                    raise
+                if attempt >= retries:
+                    self._exhausted += 1
+                    raise
+
+            self._retries += 1
+            await asyncio.sleep(random.uniform(0, backoff * 2**attempt))
+            attempt += 1
+
+    def get_metrics(self) -> UnitOfWorkMetrics:
+        return UnitOfWorkMetrics(
+            runs=self._runs,
+            conflicts=self._conflicts,
+            retries=self._retries,
+            exhausted=self._exhausted,
+            propagated=self._propagated,
+        )
+
+    def is_pinned(self) -> bool:
+        return self._pinned.get()
+
+    def is_bound(self) -> bool:
+        """Whether reads here depend on this context's state.
+
+        True inside a transaction or scope, or once pinned to the primary, so
+        the reads must not be handed to work that runs outside this context.
+        """
+        return (
+            self._transaction_exists()
+            or self._scope.get() is not None
+            or self._pinned.get()
+        )
+
+    @asynccontextmanager
+    async def get_session(
+        self, read_only: bool = False
     ) -> AsyncGenerator[AsyncSession, None]:
         """Context manager for obtaining a session.
 
         - Uses the current session if it exists.
         - Otherwise, creates a temporary one, commits/rolls back, and closes it.
+          With `read_only` the temporary session is an autocommit one on the
+          primary; unlike `read_only()` it is never served by a replica.
         """
         if self._transaction_exists():
             yield self._get_session()
             return
 
-        async with self as uow:
-            yield uow._get_session()  # noqa: SLF001
+        if not read_only:
+            async with self:
+                yield self._get_session()
+            return
+
+        async with self._read_only_transaction(allow_replica=False):
+            yield self._get_session()
+
+    @asynccontextmanager
+    async def _read_only_transaction(
+        self, allow_replica: bool
+    ) -> AsyncGenerator[None, None]:
+        read_only = self._read_only.set(True)
+        replica = self._allow_replica.set(allow_replica)
+        try:
+            async with self:
+                yield
+        finally:
+            self._allow_replica.reset(replica)
+            self._read_only.reset(read_only)
 
     async def _finalize_transaction(self, has_error: bool) -> None:
         if not self._transaction_exists():
             return
 
         tx = self._get_transaction()
-        if has_error:
-            await self.rollback()
-        elif tx.should_commit():
-            await self.commit()
+        try:
+            if has_error:
+                await self.rollback()
+            elif tx.should_commit() and not tx.read_only:
+                await self.commit()
+        finally:
+            if tx.should_commit():  # Out of context manager
+                await self.close()
+                self._reset_session()
+            else:
+                tx.exit()
+
+    async def _close_scope(self, scope: TransactionScope, has_error: bool) -> None:
+        if scope.transaction is None:
+            return
 
-        if tx.should_commit():  # Out of context manager
+        self._set_transaction(scope.transaction)
+        try:
+            if has_error:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
             await self.close()
             self._reset_session()
-        else:
-            tx.exit()
+            scope.transaction = None
 
     def _handle_exception(self, exception: BaseException) -> None:
         if isinstance(exception, ApplicationError):
             raise exception
 
-        if isinstance(exception, sqlalchemy.orm.exc.StaleDataError):
-            raise OptimisticLockError() from exception
+        conflict = self._conflict_error(exception)
+        if conflict is not None:
+            raise conflict from exception
 
         if isinstance(exception, sqlalchemy.exc.DatabaseError):
             if isinstance(exception.orig, psycopg2.errors.UniqueViolation):
@@ -142,6 +327,24 @@ class UnitOfWork(IUnitOfWork):
 
         raise exception
 
+    def _conflict_error(
+        self, exception: BaseException
+    ) -> TransactionConflictError | None:
+        if isinstance(exception, sqlalchemy.orm.exc.StaleDataError):
+            return OptimisticLockError()
+
+        if isinstance(exception, sqlalchemy.exc.DBAPIError):
+            # NOTE: asyncpg exposes the SQLSTATE as sqlstate, psycopg2 as pgcode
+            code = getattr(exception.orig, "sqlstate", None) or getattr(
+                exception.orig, "pgcode", None
+            )
+            if code == SERIALIZATION_FAILURE:
+                return SerializationFailureError()
+            if code == DEADLOCK_DETECTED:
+                return DeadlockDetectedError()
+
+        return None
+
     def _extract_duplicate_info(self, error: BaseException) -> tuple[str, str]:
         match = re.search(r"\((\w+)\)=\((.*?)\)", str(error))
         if match:
@@ -161,8 +364,24 @@ class UnitOfWork(IUnitOfWork):
         return self._current_transaction.get() is not None
 
     def _create_transaction(self) -> Transaction:
-        session = self.session_factory.create()
-        return Transaction(session, 0)
+        scope = self._scope.get()
+        if scope is not None:
+            return self._create_scoped_transaction(scope)
+
+        read_only = self._read_only.get()
+        session = self.session_factory.create(
+            read_only=read_only,
+            allow_replica=self._allow_replica.get() and not self._pinned.get(),
+        )
+        return Transaction(session, 0, read_only)
+
+    def _create_scoped_transaction(self, scope: TransactionScope) -> Transaction:
+        # NOTE: The scope holds the outermost level, so units of work inside it
+        # never reach nesting level 0 and never commit
+        if scope.transaction is None:
+            scope.transaction = Transaction(self.session_factory.create(), 0)
+        scope.transaction.enter()
+        return scope.transaction
 
     def _set_transaction(self, session: Transaction) -> None:
         self._current_transaction.set(session)
@@ -1,5 +1,6 @@
 from typing import Any
 
+from common.infrastructure.database.sqlalchemy.driver_executor import AsyncpgExecutor
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
 from common.infrastructure.di.container.providers import provide_maker_session_factory
@@ -20,5 +21,12 @@ class CommonContainer(containers.DeclarativeContainer):
 
     # ---------------------- Database ----------------------
     session_factory = providers.Singleton(provide_maker_session_factory, database)
-    unit_of_work = providers.Singleton(UnitOfWork, session_factory)
+    unit_of_work = providers.Singleton(
+        UnitOfWork,
+        session_factory,
+        read_your_writes=config.provided.db.read_your_writes,
+    )
     query_executor = providers.Singleton(QueryExecutor, unit_of_work)
+    driver_executor = providers.Singleton(AsyncpgExecutor, unit_of_work)
+    # NOTE: Selects the repository implementations, see RepositoryDriverEnum
+    repository_driver = config.provided.db.repository_driver.value
@@ -6,4 +6,8 @@ from common.infrastructure.database.sqlalchemy.session_factory import (
 
 
 def provide_maker_session_factory(database: Database) -> ISessionFactory:
-    return MakerSessionFactory(database.get_session_maker())
+    return MakerSessionFactory(
+        database.get_session_maker(),
+        database.get_replica_set(),
+        database.get_read_only_session_maker(),
+    )
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from common.application.interfaces.loaders.data_loader import IDataLoader
+
+
+KEY = TypeVar("KEY", bound=Hashable)
+VALUE = TypeVar("VALUE")
+
+
+@dataclass(frozen=True)
+class DataLoaderMetrics:
+    loads: int
+    coalesced: int
+    batches: int
+    keys: int
+
+
+class DataLoader(IDataLoader[KEY, VALUE]):
+    """Coalesces concurrent lookups into batched `load_many` calls.
+
+    Keys requested in the same event loop iteration are fetched together, at
+    most `max_batch_size` per call, and a key that is already queued or in
+    flight is joined instead of fetched again. `key` extracts the key of each
+    returned value; keys missing from the result load as `None`. Nothing is
+    kept once a batch completes, so it never serves stale values.
+
+    A batch serves many callers but runs in a copy of the context of the one
+    that queued it, so callers whose reads depend on their own transaction or
+    connection must not go through the loader.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[list[KEY]], Awaitable[Iterable[VALUE]]],
+        key: Callable[[VALUE], KEY],
+        max_batch_size: int = 100,
+    ) -> None:
+        self.load_many = load_many
+        self.key = key
+        self.max_batch_size = max_batch_size
+        self._futures: dict[KEY, asyncio.Future[VALUE | None]] = {}
+        self._queue: list[KEY] = []
+        self._scheduled: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._loads = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._keys = 0
+
+    async def load(self, key: KEY) -> VALUE | None:
+        self._loads += 1
+        future = self._futures.get(key)
+        if future is None:
+            future = self._enqueue(key)
+        else:
+            self._coalesced += 1
+        # NOTE: A cancelled caller must not cancel the load for the others
+        return await asyncio.shield(future)
+
+    def get_metrics(self) -> DataLoaderMetrics:
+        return DataLoaderMetrics(
+            loads=self._loads,
+            coalesced=self._coalesced,
+            batches=self._batches,
+            keys=self._keys,
+        )
+
+    def _enqueue(self, key: KEY) -> asyncio.Future[VALUE | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[VALUE | None] = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) >= self.max_batch_size:
+            self._dispatch()
+        elif self._scheduled is None:
+            self._scheduled = loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+
+        keys, self._queue = self._queue, []
+        if not keys:
+            return
+
+        futures = {key: self._futures[key] for key in keys}
+        self._batches += 1
+        self._keys += len(keys)
+        task = asyncio.get_running_loop().create_task(self._run(futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, futures: dict[KEY, asyncio.Future[VALUE | None]]) -> None:
+        try:
+            values = {
+                self.key(value): value for value in await self.load_many(list(futures))
+            }
+        except asyncio.CancelledError:
+            self._release(futures)
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            self._release(futures)
+            for future in futures.values():
+                future.set_exception(e)
+                future.exception()  # NOTE: Marks it retrieved when nobody is waiting
+            return
+
+        self._release(futures)
+        for key, future in futures.items():
+            future.set_result(values.get(key))
+
+    def _release(self, futures: dict[KEY, asyncio.Future[VALUE | None]]) -> None:
+        for key, future in futures.items():
+            if self._futures.get(key) is future:
+                del self._futures[key]
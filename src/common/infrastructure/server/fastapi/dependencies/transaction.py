@@ -0,0 +1,19 @@
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from fastapi import Depends
+
+
+async def request_transaction(
+    uow: Annotated[IUnitOfWork, Depends()],
+) -> AsyncGenerator[None, None]:
+    """Run the route in one transaction that is committed before responding.
+
+    Opt in per route with `dependencies=[Depends(request_transaction)]`,
+    listed before dependencies that query the database so they share it.
+    Conflicts inside the scope are not retried, so leave it off routes whose
+    use case relies on `@transactional` retries.
+    """
+    async with uow.scope():
+        yield
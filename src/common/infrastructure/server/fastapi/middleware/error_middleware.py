@@ -6,8 +6,9 @@ from common.application.exceptions import (
     ApplicationError,
     DuplicateEntryError,
     NotFoundError,
-    OptimisticLockError,
     RepositoryError,
+    ServiceUnavailableError,
+    TransactionConflictError,
 )
 from common.domain.exceptions import DomainError
 from fastapi import FastAPI, Request, Response, status
@@ -36,7 +37,8 @@ class DomainErrorHandler(IHTTPErrorHandler):
 
 class ApplicationErrorHandler(IHTTPErrorHandler):
     ERROR_STATUS_MAP: ClassVar[dict[type[Exception], int]] = {
-        NotFoundError: status.HTTP_404_NOT_FOUND
+        NotFoundError: status.HTTP_404_NOT_FOUND,
+        ServiceUnavailableError: status.HTTP_503_SERVICE_UNAVAILABLE,
     }
 
     def can_handle(self, exc: Exception) -> bool:
@@ -53,18 +55,17 @@ class ApplicationErrorHandler(IHTTPErrorHandler):
 class RepositoryErrorHandler(IHTTPErrorHandler):
     ERROR_STATUS_MAP: ClassVar[dict[type[Exception], int]] = {
         DuplicateEntryError: status.HTTP_409_CONFLICT,
-        OptimisticLockError: status.HTTP_409_CONFLICT,
     }
 
     def can_handle(self, exc: Exception) -> bool:
         return isinstance(exc, RepositoryError)
 
     def handle(self, request: Request, exc: Exception) -> JSONResponse:
-        if isinstance(exc, OptimisticLockError):
+        if isinstance(exc, TransactionConflictError):
             return JSONResponse(
                 status_code=status.HTTP_409_CONFLICT,
                 content={
-                    "error": "OptimisticLockError",
+                    "error": type(exc).__name__,
                     "detail": f"Retry later: {exc!s}",
                 },
             )
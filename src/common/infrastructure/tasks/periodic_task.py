@@ -0,0 +1,56 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class PeriodicTask:
+    """Runs `func` in the background every `interval` seconds.
+
+    A failing run is logged and retried on the next tick; `stop` cancels the
+    loop, including a run that is still in flight.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        logger: logging.Logger,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
+
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.logger = logger
+        self._task: asyncio.Task[None] | None = None
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.is_running():
+            return
+        self._task = asyncio.create_task(self._run(), name=self.name)
+        self.logger.info(f"periodic task started: {self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.logger.info(f"periodic task stopped: {self.name}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.func()
+            except Exception as e:
+                self.logger.exception(f"periodic task {self.name} failed: {e}")
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PublicKeySet:
+    keys: list[dict[str, Any]]
+    max_age: int
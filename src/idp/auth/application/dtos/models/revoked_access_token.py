@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+
+
+@dataclass(frozen=True)
+class RevokedAccessToken:
+    jti: UUID
+    revoked_at: DateTime
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from idp.auth.application.dtos.models.revoked_access_token import (
+    RevokedAccessToken,
+)
+
+
+class IAccessTokenRevocationRepository(ABC):
+    @abstractmethod
+    async def add_many(self, jtis: Sequence[UUID], expires_at: DateTime) -> None: ...
+    @abstractmethod
+    async def exists(self, jti: UUID, now: DateTime) -> bool: ...
+    @abstractmethod
+    async def get_active(
+        self, now: DateTime, since: DateTime | None = None
+    ) -> list[RevokedAccessToken]: ...
+    @abstractmethod
+    async def delete_expired(self, now: DateTime) -> int: ...
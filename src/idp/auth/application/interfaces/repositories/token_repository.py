@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
 
+from common.domain.value_objects.datetime import DateTime
 from idp.auth.domain.entity.token import Token
 
 
@@ -9,4 +12,14 @@ class IRefreshTokenRepository(ABC):
     @abstractmethod
     async def revoke(self, value: str) -> None: ...
     @abstractmethod
+    async def revoke_active(self, value: str, now: DateTime) -> UUID | None: ...
+    @abstractmethod
+    async def revoke_all(self, identity_id: UUID, now: DateTime) -> list[UUID]: ...
+    @abstractmethod
+    async def revoke_all_many(
+        self, identity_ids: Sequence[UUID], now: DateTime
+    ) -> list[UUID]: ...
+    @abstractmethod
     async def add(self, token: Token) -> None: ...
+    @abstractmethod
+    async def delete_stale(self, now: DateTime, limit: int) -> int: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from uuid import UUID
+
+
+class IAccessTokenRevocationList(ABC):
+    @abstractmethod
+    async def revoke(self, jtis: Sequence[UUID]) -> None: ...
+    @abstractmethod
+    async def is_revoked(self, jti: UUID) -> bool: ...
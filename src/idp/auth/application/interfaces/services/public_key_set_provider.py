@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from idp.auth.application.dtos.models.public_key_set import PublicKeySet
+
+
+class IPublicKeySetProvider(ABC):
+    @abstractmethod
+    def get_public_key_set(self) -> PublicKeySet: ...
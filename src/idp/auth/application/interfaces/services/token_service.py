@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
@@ -17,3 +18,7 @@ class ITokenRefresher(ABC):
 class ITokenRevoker(ABC):
     @abstractmethod
     async def revoke_refresh_token(self, refresh_token: str) -> None: ...
+    @abstractmethod
+    async def revoke_all(self, identity_id: UUID) -> int: ...
+    @abstractmethod
+    async def revoke_all_many(self, identity_ids: Sequence[UUID]) -> int: ...
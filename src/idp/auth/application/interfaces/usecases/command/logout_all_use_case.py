@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from idp.auth.application.dtos.commands.logout_all_command import LogoutAllCommand
+
+
+class ILogoutAllUseCase(ABC):
+    @abstractmethod
+    async def execute(self, command: LogoutAllCommand) -> None: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from idp.auth.application.dtos.commands.revoke_sessions_command import (
+    RevokeSessionsCommand,
+)
+
+
+class IRevokeSessionsUseCase(ABC):
+    @abstractmethod
+    async def execute(self, command: RevokeSessionsCommand) -> int: ...
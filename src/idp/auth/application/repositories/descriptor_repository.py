@@ -1,20 +1,51 @@
 from uuid import UUID
 
+from common.application.interfaces.loaders.data_loader import IDataLoader
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from idp.auth.application.interfaces.repositories.descriptor_repository import (
     IIdentityDescriptorRepository,
 )
+from idp.identity.application.exceptions import IdentityNotFoundError
 from idp.identity.application.interfaces.repositories.identity_repository import (
     IIdentityRepository,
 )
+from idp.identity.domain.entity.identity import Identity
 from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
 
 
 class IdentityDescriptorRepository(IIdentityDescriptorRepository):
-    def __init__(self, identity_repository: IIdentityRepository) -> None:
+    """Descriptors read through the identity repository.
+
+    With a `loader`, concurrent lookups are batched into `get_many_by_ids`
+    calls that run on their own connection. Lookups bound to the caller's
+    transaction or to the primary after a write bypass it and read through
+    `uow`.
+    """
+
+    def __init__(
+        self,
+        identity_repository: IIdentityRepository,
+        uow: IUnitOfWork | None = None,
+        loader: IDataLoader[UUID, Identity] | None = None,
+    ) -> None:
         self.identity_repository = identity_repository
+        self.uow = uow
+        self.loader = loader
 
     async def get_by_id(self, identity_id: UUID) -> IdentityDescriptor:
-        identity = await self.identity_repository.get_by_id(identity_id)
+        identity = await self._get_identity(identity_id)
         return IdentityDescriptor(
             identity_id=identity.identity_id, username=identity.username.value
         )
+
+    async def _get_identity(self, identity_id: UUID) -> Identity:
+        if self.loader is not None and not (self.uow and self.uow.is_bound()):
+            identity = await self.loader.load(identity_id)
+            if identity is None:
+                raise IdentityNotFoundError(identity_id)
+            return identity
+
+        if self.uow is None:
+            return await self.identity_repository.get_by_id(identity_id)
+        async with self.uow.read_only():
+            return await self.identity_repository.get_by_id(identity_id)
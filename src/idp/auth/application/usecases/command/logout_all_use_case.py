@@ -0,0 +1,15 @@
+from idp.auth.application.dtos.commands.logout_all_command import LogoutAllCommand
+from idp.auth.application.interfaces.services.token_service import (
+    ITokenRevoker,
+)
+from idp.auth.application.interfaces.usecases.command.logout_all_use_case import (
+    ILogoutAllUseCase,
+)
+
+
+class LogoutAllUseCase(ILogoutAllUseCase):
+    def __init__(self, token_revoker: ITokenRevoker) -> None:
+        self.token_revoker = token_revoker
+
+    async def execute(self, command: LogoutAllCommand) -> None:
+        await self.token_revoker.revoke_all(command.identity_id)
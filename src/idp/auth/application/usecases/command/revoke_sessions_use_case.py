@@ -0,0 +1,19 @@
+from idp.auth.application.dtos.commands.revoke_sessions_command import (
+    RevokeSessionsCommand,
+)
+from idp.auth.application.interfaces.services.token_service import (
+    ITokenRevoker,
+)
+from idp.auth.application.interfaces.usecases.command.revoke_sessions_use_case import (
+    IRevokeSessionsUseCase,
+)
+
+
+class RevokeSessionsUseCase(IRevokeSessionsUseCase):
+    """Revokes every refresh token of many identities at once, e.g. for admins."""
+
+    def __init__(self, token_revoker: ITokenRevoker) -> None:
+        self.token_revoker = token_revoker
+
+    async def execute(self, command: RevokeSessionsCommand) -> int:
+        return await self.token_revoker.revoke_all_many(command.identity_ids)
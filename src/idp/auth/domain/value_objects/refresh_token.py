@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import ClassVar, Self
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class RefreshTokenValue:
+    """Opaque refresh token shaped as `<token_id>-<expiry>.<secret>`.
+
+    `token_id` and `expires_at` (hex microseconds since the epoch) select the
+    stored token by its full primary key, so a lookup touches one partition,
+    and `secret` verifies it. Selectors without an expiry were issued before
+    it was added and resolve by `token_id` alone. Tokens issued before this
+    format are plain secrets without a separator.
+    """
+
+    SEPARATOR: ClassVar[str] = "."
+    EXPIRY_SEPARATOR: ClassVar[str] = "-"
+
+    token_id: UUID
+    secret: str
+    expires_at: DateTime | None = None
+
+    @property
+    def value(self) -> str:
+        selector = self.token_id.hex
+        if self.expires_at is not None:
+            expiry = (self.expires_at.value - EPOCH) // MICROSECOND
+            selector += f"{self.EXPIRY_SEPARATOR}{expiry:x}"
+        return f"{selector}{self.SEPARATOR}{self.secret}"
+
+    @classmethod
+    def parse(cls, value: str) -> Self | None:
+        selector, separator, secret = value.partition(cls.SEPARATOR)
+        if not separator or not secret:
+            return None
+        token_id, has_expiry, expiry = selector.partition(cls.EXPIRY_SEPARATOR)
+        try:
+            expires_at = None
+            if has_expiry:
+                expires_at = DateTime(EPOCH + int(expiry, 16) * MICROSECOND)
+            return cls(UUID(hex=token_id), secret, expires_at)
+        except (ValueError, OverflowError):
+            return None
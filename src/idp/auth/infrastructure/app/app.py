@@ -6,9 +6,15 @@ from common.infrastructure.server.fastapi.middleware.error_middleware import (
     ErrorHandlingMiddleware,
 )
 from common.infrastructure.server.fastapi.server import FastAPIServer
+from idp.auth.application.interfaces.services.public_key_set_provider import (
+    IPublicKeySetProvider,
+)
 from idp.auth.application.interfaces.usecases.command.login_use_case import (
     ILoginUseCase,
 )
+from idp.auth.application.interfaces.usecases.command.logout_all_use_case import (
+    ILogoutAllUseCase,
+)
 from idp.auth.application.interfaces.usecases.command.logout_use_case import (
     ILogoutUseCase,
 )
@@ -19,7 +25,10 @@ from idp.auth.infrastructure.di.container.container import AuthContainer, TokenC
 from idp.auth.infrastructure.server.fastapi.middleware.token_error_middleware import (
     TokenErrorHandler,
 )
-from idp.auth.presentation.http.fastapi.controllers import auth_router
+from idp.auth.presentation.http.fastapi.controllers import (
+    auth_router,
+    well_known_router,
+)
 from idp.identity.application.interfaces.services.token_intospector import (
     ITokenIntrospector,
 )
@@ -44,6 +53,9 @@ class AuthApp(IHTTPApp):
         self.server.override_dependency(
             ILogoutUseCase, self.auth_container.logout_use_case()
         )
+        self.server.override_dependency(
+            ILogoutAllUseCase, self.auth_container.logout_all_use_case()
+        )
         self.server.override_dependency(
             IRefreshTokenUseCase, self.auth_container.refresh_token_use_case()
         )
@@ -53,6 +65,8 @@ class AuthApp(IHTTPApp):
 
 
 class TokenApp(IHTTPApp):
+    tags: ClassVar[list[str | Enum]] = ["Keys"]
+
     def __init__(
         self,
         container: TokenContainer,
@@ -75,6 +89,9 @@ class TokenApp(IHTTPApp):
         self.server.override_dependency(
             ITokenIntrospector, self.container.token_introspector()
         )
+        self.server.override_dependency(
+            IPublicKeySetProvider, self.container.jwt_key_ring()
+        )
 
     def register_routers(self) -> None:
-        pass
+        self.server.register_router(well_known_router, "", self.tags)
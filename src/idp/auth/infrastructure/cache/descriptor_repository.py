@@ -0,0 +1,75 @@
+import asyncio
+import contextvars
+from dataclasses import dataclass
+from uuid import UUID
+
+from common.infrastructure.cache.ttl_cache import CacheMetrics, TTLCache
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+
+
+@dataclass(frozen=True)
+class DescriptorCacheMetrics:
+    cache: CacheMetrics
+    loads: int
+    coalesced: int
+
+
+class CachedIdentityDescriptorRepository(IIdentityDescriptorRepository):
+    """Read-through cache in front of an `IIdentityDescriptorRepository`.
+
+    Concurrent misses for the same identity share a single load, which runs
+    in its own task so a cancelled caller does not fail the others. The task
+    starts from an empty context, outside the first caller's transaction or
+    scope, so every caller gets a committed result. Descriptors never change
+    once an identity exists, so entries are only dropped by their TTL.
+    """
+
+    def __init__(
+        self, repository: IIdentityDescriptorRepository, config: AuthConfig
+    ) -> None:
+        self.repository = repository
+        self.ttl = config.descriptor_cache_ttl.total_seconds()
+        self.cache: TTLCache[UUID, IdentityDescriptor] = TTLCache(
+            config.descriptor_cache_size
+        )
+        self._loading: dict[UUID, asyncio.Task[IdentityDescriptor]] = {}
+        self._tasks: set[asyncio.Task[IdentityDescriptor]] = set()
+        self._loads = 0
+        self._coalesced = 0
+
+    async def get_by_id(self, identity_id: UUID) -> IdentityDescriptor:
+        descriptor = self.cache.get(identity_id)
+        if descriptor is not None:
+            return descriptor
+
+        loading = self._loading.get(identity_id)
+        if loading is None:
+            loading = asyncio.create_task(
+                self._load(identity_id), context=contextvars.Context()
+            )
+            self._loading[identity_id] = loading
+            self._tasks.add(loading)
+            loading.add_done_callback(self._tasks.discard)
+            self._loads += 1
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(loading)
+
+    def get_metrics(self) -> DescriptorCacheMetrics:
+        return DescriptorCacheMetrics(
+            cache=self.cache.get_metrics(),
+            loads=self._loads,
+            coalesced=self._coalesced,
+        )
+
+    async def _load(self, identity_id: UUID) -> IdentityDescriptor:
+        try:
+            descriptor = await self.repository.get_by_id(identity_id)
+            self.cache.set_for(identity_id, descriptor, self.ttl)
+            return descriptor
+        finally:
+            del self._loading[identity_id]
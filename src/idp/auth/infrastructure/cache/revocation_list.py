@@ -0,0 +1,131 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID
+
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.cache.bloom_filter import BloomFilter, BloomFilterMetrics
+from idp.auth.application.dtos.models.revoked_access_token import (
+    RevokedAccessToken,
+)
+from idp.auth.application.interfaces.repositories.access_token_revocation_repository import (
+    IAccessTokenRevocationRepository,
+)
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+
+
+@dataclass(frozen=True)
+class RevocationListMetrics:
+    checks: int
+    filter_hits: int
+    confirmed: int
+    refreshes: int
+    rebuilds: int
+    filter: BloomFilterMetrics
+
+
+class BloomFilterRevocationList(IAccessTokenRevocationList):
+    """Revoked `jti`s mirrored into a per-worker Bloom filter.
+
+    A jti missing from the filter was never revoked, so most checks never reach
+    the database; a filter hit is confirmed with the repository to rule out a
+    false positive. `refresh` pulls revocations made by other workers since
+    the last pull, and the filter is rebuilt from scratch every
+    `revocation_rebuild_interval` or once it is full, dropping expired entries.
+    """
+
+    # NOTE: created_at is set when the inserting transaction starts, so a late
+    # commit can carry a timestamp older than the watermark
+    REFRESH_OVERLAP = timedelta(seconds=30)
+
+    def __init__(
+        self,
+        clock: IClock,
+        repository: IAccessTokenRevocationRepository,
+        config: AuthConfig,
+    ) -> None:
+        self.clock = clock
+        self.repository = repository
+        self.ttl = config.access_token_ttl
+        self.capacity = config.revocation_filter_capacity
+        self.error_rate = config.revocation_filter_error_rate
+        self.rebuild_interval = config.revocation_rebuild_interval
+
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._watermark: DateTime | None = None
+        self._built_at: DateTime | None = None
+
+        self._checks = 0
+        self._filter_hits = 0
+        self._confirmed = 0
+        self._refreshes = 0
+        self._rebuilds = 0
+
+    async def revoke(self, jtis: Sequence[UUID]) -> None:
+        if not jtis:
+            return
+
+        await self.repository.add_many(jtis, self.clock.now() + self.ttl)
+        self._filter.update(jti.bytes for jti in jtis)
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        self._checks += 1
+        if jti.bytes not in self._filter:
+            return False
+
+        self._filter_hits += 1
+        revoked = await self.repository.exists(jti, self.clock.now())
+        if revoked:
+            self._confirmed += 1
+        return revoked
+
+    async def refresh(self) -> None:
+        now = self.clock.now()
+        if (
+            self._built_at is None
+            or self._watermark is None
+            or now - self._built_at >= self.rebuild_interval
+            or self._filter.is_saturated()
+        ):
+            await self.rebuild()
+            return
+
+        entries = await self.repository.get_active(
+            now, self._watermark - self.REFRESH_OVERLAP
+        )
+        self._add(entries)
+        self._refreshes += 1
+
+    async def rebuild(self) -> None:
+        now = self.clock.now()
+        entries = await self.repository.get_active(now)
+
+        self._filter = BloomFilter(
+            max(self.capacity, 2 * len(entries)), self.error_rate
+        )
+        self._watermark = now
+        self._built_at = now
+        self._add(entries)
+        self._rebuilds += 1
+
+    def get_metrics(self) -> RevocationListMetrics:
+        return RevocationListMetrics(
+            checks=self._checks,
+            filter_hits=self._filter_hits,
+            confirmed=self._confirmed,
+            refreshes=self._refreshes,
+            rebuilds=self._rebuilds,
+            filter=self._filter.get_metrics(),
+        )
+
+    def _add(self, entries: list[RevokedAccessToken]) -> None:
+        for entry in entries:
+            # NOTE: Refresh windows overlap; re-adding would only inflate len()
+            if entry.jti.bytes not in self._filter:
+                self._filter.add(entry.jti.bytes)
+            if self._watermark is None or entry.revoked_at > self._watermark:
+                self._watermark = entry.revoked_at
@@ -1,11 +1,55 @@
 from datetime import timedelta
+from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt, SecretStr
+
+
+class JWTBackendEnum(str, Enum):
+    JOSE = "jose"
+    HMAC = "hmac"  # NOTE: HS256/HS384/HS512 only
+
+
+class SigningKeyConfig(BaseModel):
+    kid: str
+    algorithm: str = "RS256"
+    # NOTE: PEM encoded; retiring keys only need the public half
+    private_key: SecretStr | None = None
+    public_key: str | None = None
 
 
 class AuthConfig(BaseModel):
     secret_key: str
     algorithm: str = "HS256"
+    jwt_backend: JWTBackendEnum = JWTBackendEnum.JOSE
+    # NOTE: When set, tokens are signed with the active key instead of secret_key
+    signing_keys: list[SigningKeyConfig] = []
+    active_kid: str | None = None
+    # NOTE: Keep accepting kid-less tokens signed with secret_key once signing
+    # keys are configured; enable only while migrating off the shared secret
+    secret_key_fallback: bool = False
+    jwks_max_age: timedelta = timedelta(hours=1)
     issuer: str
     access_token_ttl: timedelta = timedelta(minutes=15)
     refresh_token_ttl: timedelta = timedelta(days=7)
+    # NOTE: Embed descriptor fields into access tokens and trust them on introspection
+    stateless_descriptor: bool = False
+    token_cache_size: NonNegativeInt = 10_000
+    token_negative_cache_ttl: timedelta = timedelta(seconds=30)
+    descriptor_cache_size: NonNegativeInt = 10_000
+    descriptor_cache_ttl: timedelta = timedelta(minutes=5)
+    # NOTE: Concurrent descriptor misses are fetched together, up to this many
+    descriptor_batch_size: PositiveInt = 100
+    # NOTE: Deletes expired and revoked refresh tokens in the background
+    reaper_enabled: bool = True
+    reaper_interval: timedelta = timedelta(minutes=10)
+    reaper_batch_size: PositiveInt = 1000
+    reaper_batch_delay: timedelta = timedelta(milliseconds=100)
+    # NOTE: Revoked access tokens are mirrored into a per-worker Bloom filter
+    revocation_filter_capacity: PositiveInt = 100_000
+    revocation_filter_error_rate: float = Field(default=0.001, gt=0, lt=1)
+    revocation_refresh_interval: timedelta = timedelta(seconds=5)
+    revocation_rebuild_interval: timedelta = timedelta(minutes=10)
+    # NOTE: `tokens` is range partitioned by expires_at, one partition per period
+    token_partition_period: timedelta = timedelta(days=1)
+    token_partition_premake: timedelta = timedelta(days=2)
+    token_partition_maintenance_interval: timedelta = timedelta(hours=1)
@@ -0,0 +1,20 @@
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.driver_executor import Record
+from idp.auth.domain.entity.token import Token, TokenTypeEnum
+
+
+class TokenRecordMapper:
+    @classmethod
+    def to_domain(cls, record: Record, value: str) -> Token:
+        # NOTE: Only a digest of the secret is stored, so the caller provides
+        # the value the token was looked up by
+        return Token(
+            token_id=record["token_id"],
+            identity_id=record["identity_id"],
+            value=value,
+            token_type=TokenTypeEnum.REFRESH,
+            issued_at=DateTime(record["issued_at"]),
+            expires_at=DateTime(record["expires_at"]),
+            revoked=record["revoked"],
+            version=record["version"],
+        )
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.driver_executor import AsyncpgExecutor
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
+from idp.identity.application.exceptions import IdentityNotFoundError
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+
+
+GET_BY_ID = "SELECT identity_id, username FROM identities WHERE identity_id = $1"
+
+
+class AsyncpgIdentityDescriptorRepository(IIdentityDescriptorRepository):
+    """Reads only the descriptor columns, never the password hash."""
+
+    def __init__(self, driver: AsyncpgExecutor) -> None:
+        self.driver = driver
+
+    async def get_by_id(self, identity_id: UUID) -> IdentityDescriptor:
+        # NOTE: Descriptors tolerate replica lag, so they opt in to replicas
+        async with self.driver.uow.read_only():
+            record = await self.driver.fetchrow(GET_BY_ID, identity_id, read_only=True)
+        if not record:
+            raise IdentityNotFoundError(identity_id)
+        return IdentityDescriptor(
+            identity_id=record["identity_id"], username=record["username"]
+        )
@@ -0,0 +1,110 @@
+import hmac
+from typing import Any
+from uuid import UUID
+
+from common.application.exceptions import NotFoundError
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.driver_executor import (
+    AsyncpgExecutor,
+    Record,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.auth.domain.entity.token import Token
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
+from idp.auth.infrastructure.database.postgres.asyncpg.mappers.token_mapper import (
+    TokenRecordMapper,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.mappers.token_mapper import (
+    TokenMapper,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.refresh_token_repository import (
+    Match,
+    RefreshTokenRepository,
+)
+
+
+TOKEN_COLUMNS = (
+    "token_id, identity_id, secret_hash, issued_at, expires_at, revoked, version"
+)
+GET_BY_ID = f"SELECT {TOKEN_COLUMNS} FROM tokens WHERE token_id = $1"
+GET_BY_KEY = f"{GET_BY_ID} AND expires_at = $2"
+GET_BY_VALUE = f"SELECT {TOKEN_COLUMNS} FROM tokens WHERE value = $1"
+# NOTE: Mirrors the SQLAlchemy statements, including the updated_at onupdate
+REVOKE = "UPDATE tokens SET revoked = true, version = version + 1, updated_at = now()"
+MATCH = {
+    Match.KEY: "token_id = $1 AND secret_hash = $2 AND expires_at = $3",
+    Match.SECRET: "token_id = $1 AND secret_hash = $2",
+    Match.VALUE: "value = $1",
+}
+REVOKE_BY = {match: f"{REVOKE} WHERE {where}" for match, where in MATCH.items()}
+# NOTE: `now` is bound after the match parameters
+REVOKE_ACTIVE_BY = {
+    match: (
+        f"{REVOKE} WHERE {where} AND NOT revoked"
+        f" AND expires_at > ${where.count('$') + 1} RETURNING identity_id"
+    )
+    for match, where in MATCH.items()
+}
+
+
+class AsyncpgRefreshTokenRepository(RefreshTokenRepository):
+    """Runs lookups and rotation straight on asyncpg.
+
+    Bulk revocation, inserts and cleanup stay on SQLAlchemy.
+    """
+
+    def __init__(self, executor: QueryExecutor, driver: AsyncpgExecutor) -> None:
+        super().__init__(executor)
+        self.driver = driver
+
+    async def get(self, value: str) -> Token:
+        record = await self._find_record(value)
+        if not record:
+            raise NotFoundError(value)
+        return TokenRecordMapper.to_domain(record, value)
+
+    async def revoke(self, value: str) -> None:
+        match, args = self._match_args(value)
+        await self.driver.execute(REVOKE_BY[match], *args)
+
+    async def revoke_active(self, value: str, now: DateTime) -> UUID | None:
+        match, args = self._match_args(value)
+        identity_id: UUID | None = await self.driver.fetchval(
+            REVOKE_ACTIVE_BY[match], *args, now.value
+        )
+        return identity_id
+
+    async def _find_record(self, value: str) -> Record | None:
+        refresh_token = RefreshTokenValue.parse(value)
+        if refresh_token is None:
+            return await self.driver.fetchrow(GET_BY_VALUE, value, read_only=True)
+
+        if refresh_token.expires_at is None:
+            record = await self.driver.fetchrow(
+                GET_BY_ID, refresh_token.token_id, read_only=True
+            )
+        else:
+            record = await self.driver.fetchrow(
+                GET_BY_KEY,
+                refresh_token.token_id,
+                refresh_token.expires_at.value,
+                read_only=True,
+            )
+        if record is None or record["secret_hash"] is None:
+            return None
+
+        secret_hash = TokenMapper.hash_secret(refresh_token.secret)
+        if not hmac.compare_digest(record["secret_hash"], secret_hash):
+            return None
+        return record
+
+    def _match_args(self, value: str) -> tuple[Match, list[Any]]:
+        """Positional form of `_match`, in the order of `MATCH`."""
+        match, params = self._match(value)
+        if match is Match.VALUE:
+            return match, [params["match_value"]]
+
+        args = [params["match_token_id"], params["match_secret_hash"]]
+        if match is Match.KEY:
+            args.append(params["match_expires_at"])
+        return match, args
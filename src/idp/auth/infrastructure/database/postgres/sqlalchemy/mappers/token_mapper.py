@@ -1,30 +1,65 @@
+import hashlib
+from typing import Any
+
 from common.domain.value_objects.datetime import DateTime
 from idp.auth.domain.entity.token import Token, TokenTypeEnum
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
     TokenBase,
 )
+from sqlalchemy import Row
 
 
 class TokenMapper:
     @classmethod
-    def to_domain(cls, base: TokenBase) -> Token:
+    def to_domain(cls, base: TokenBase, value: str) -> Token:
+        # NOTE: Only a digest of the secret is stored, so the caller provides
+        # the value the token was looked up by
         return Token(
             token_id=base.token_id,
             identity_id=base.identity_id,
-            value=base.value,
+            value=value,
             token_type=TokenTypeEnum.REFRESH,
             issued_at=DateTime(base.issued_at),
             expires_at=DateTime(base.expires_at),
             revoked=base.revoked,
+            version=base.version,
+        )
+
+    @classmethod
+    def from_row(cls, row: Row[Any], value: str) -> Token:
+        return Token(
+            token_id=row.token_id,
+            identity_id=row.identity_id,
+            value=value,
+            token_type=TokenTypeEnum.REFRESH,
+            issued_at=DateTime(row.issued_at),
+            expires_at=DateTime(row.expires_at),
+            revoked=row.revoked,
+            version=row.version,
         )
 
     @classmethod
     def to_persistence(cls, token: Token) -> TokenBase:
+        value: str | None = token.value
+        secret_hash = None
+
+        refresh_token = RefreshTokenValue.parse(token.value)
+        if refresh_token is not None:
+            value = None
+            secret_hash = cls.hash_secret(refresh_token.secret)
+
         return TokenBase(
             token_id=token.token_id,
             identity_id=token.identity_id,
-            value=token.value,
+            value=value,
+            secret_hash=secret_hash,
             issued_at=token.issued_at.value,
             expires_at=token.expires_at.value,
             revoked=token.revoked,
+            version=token.version,
         )
+
+    @classmethod
+    def hash_secret(cls, secret: str) -> bytes:
+        return hashlib.sha256(secret.encode()).digest()
@@ -0,0 +1,19 @@
+from datetime import datetime
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.models.base import Base
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class RevokedAccessTokenBase(Base):
+    """Access tokens revoked before their `exp`, keyed by the `jti` claim."""
+
+    __tablename__ = "revoked_access_tokens"
+
+    jti: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
+    # NOTE: Entries are useless once every token with this jti has expired
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
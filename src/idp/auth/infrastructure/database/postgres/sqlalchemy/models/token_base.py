@@ -1,20 +1,64 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
 from common.infrastructure.database.sqlalchemy.models.base import Base
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 
 class TokenBase(Base):
+    """Refresh tokens, range partitioned by `expires_at`.
+
+    Postgres requires the partition key in every unique constraint, so the
+    table key is (token_id, expires_at) while the ORM identity stays token_id.
+    """
+
     __tablename__ = "tokens"
+    __table_args__: Any = (
+        PrimaryKeyConstraint("token_id", "expires_at"),
+        UniqueConstraint("value", "expires_at"),
+        {"postgresql_partition_by": "RANGE (expires_at)"},
+    )
 
-    token_id: Mapped[UUID] = mapped_column(PGUUID, primary_key=True)
-    identity_id: Mapped[UUID] = mapped_column(PGUUID, nullable=False)  # NOTE: No FK
-    value: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    token_id: Mapped[UUID] = mapped_column(PGUUID, nullable=False)
+    identity_id: Mapped[UUID] = mapped_column(
+        PGUUID, nullable=False, index=True
+    )  # NOTE: No FK
+    # NOTE: Plaintext value of legacy tokens, new tokens only store secret_hash
+    value: Mapped[str | None] = mapped_column(String, nullable=True)
+    secret_hash: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
     revoked: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
+    __mapper_args__: Any = {  # noqa: RUF012
+        "primary_key": [token_id],
+        "version_id_col": version,
+    }
+
+
+# NOTE: Catches rows outside the partitions created by TokenPartitionManager
+event.listen(
+    TokenBase.__table__,
+    "after_create",
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE TABLE IF NOT EXISTS tokens_default PARTITION OF tokens DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
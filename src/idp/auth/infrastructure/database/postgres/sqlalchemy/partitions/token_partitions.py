@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Self
+
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.domain.interfaces.clock import IClock
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
+    TokenBase,
+)
+from sqlalchemy import text
+
+
+TABLE = TokenBase.__tablename__
+PARTITION_PREFIX = f"{TABLE}_p"
+NAME_FORMAT = "%Y%m%d%H%M"
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# NOTE: Transaction-scoped, so it is released on commit or rollback
+LOCK = text("SELECT pg_advisory_xact_lock(hashtext(:name))").bindparams(
+    name=f"{TABLE} partitions"
+)
+
+
+@dataclass(frozen=True)
+class TokenPartition:
+    """Range partition of `tokens` holding rows with start <= expires_at < end.
+
+    Both bounds are encoded in the name, so retention needs no catalog parsing.
+    """
+
+    start: datetime
+    end: datetime
+
+    @property
+    def name(self) -> str:
+        return (
+            f"{PARTITION_PREFIX}{self.start.strftime(NAME_FORMAT)}"
+            f"_{self.end.strftime(NAME_FORMAT)}"
+        )
+
+    @classmethod
+    def containing(cls, moment: datetime, period: timedelta) -> Self:
+        start = EPOCH + (moment - EPOCH) // period * period
+        return cls(start, start + period)
+
+    @classmethod
+    def from_name(cls, name: str) -> Self | None:
+        if not name.startswith(PARTITION_PREFIX):
+            return None
+        start, _, end = name.removeprefix(PARTITION_PREFIX).partition("_")
+        try:
+            return cls(
+                datetime.strptime(start, NAME_FORMAT).replace(tzinfo=UTC),
+                datetime.strptime(end, NAME_FORMAT).replace(tzinfo=UTC),
+            )
+        except ValueError:
+            return None
+
+    def overlaps(self, other: "TokenPartition") -> bool:
+        return self.start < other.end and other.start < self.end
+
+    def next(self) -> Self:
+        return type(self)(self.end, self.end + (self.end - self.start))
+
+    def create_sql(self) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{self.start.isoformat()}') "
+            f"TO ('{self.end.isoformat()}')"
+        )
+
+    def detach_sql(self) -> str:
+        return f"ALTER TABLE {TABLE} DETACH PARTITION {self.name}"
+
+    def drop_sql(self) -> str:
+        return f"DROP TABLE IF EXISTS {self.name}"
+
+
+class TokenPartitionManager:
+    """Keeps `tokens` partitions ahead of the clock and drops expired ones.
+
+    Partitions are created up to `refresh_token_ttl + token_partition_premake`
+    from now, so new tokens never fall into the default partition. A partition
+    whose upper bound has passed only holds expired tokens and is detached and
+    dropped instead of deleting its rows.
+
+    Every worker runs this at startup, so changes are serialised with an
+    advisory lock. Ranges already covered by a partition, e.g. one created
+    with a different `token_partition_period`, are skipped instead of
+    failing on the overlap.
+    """
+
+    def __init__(
+        self,
+        clock: IClock,
+        uow: IUnitOfWork,
+        executor: QueryExecutor,
+        config: AuthConfig,
+    ) -> None:
+        if config.token_partition_period < timedelta(minutes=1):
+            raise ValueError("Token partition period must be at least one minute")
+
+        self.clock = clock
+        self.uow = uow
+        self.executor = executor
+        self.period = config.token_partition_period
+        self.horizon = config.refresh_token_ttl + config.token_partition_premake
+
+    async def maintain(self) -> None:
+        now = self.clock.now().value
+        await self.create_partitions(now)
+        await self.drop_expired_partitions(now)
+
+    async def create_partitions(self, now: datetime) -> list[str]:
+        created: list[str] = []
+        async with self.uow:
+            await self.executor.execute(LOCK)
+            existing = [
+                partition
+                for name in await self.list_partitions()
+                if (partition := TokenPartition.from_name(name)) is not None
+            ]
+
+            partition = TokenPartition.containing(now, self.period)
+            while partition.start <= now + self.horizon:
+                if not any(partition.overlaps(other) for other in existing):
+                    await self.executor.execute(text(partition.create_sql()))
+                    created.append(partition.name)
+                partition = partition.next()
+        return created
+
+    async def drop_expired_partitions(self, now: datetime) -> list[str]:
+        dropped: list[str] = []
+        for name in await self.list_partitions():
+            partition = TokenPartition.from_name(name)
+            if partition is None or partition.end > now:
+                continue
+            async with self.uow:
+                await self.executor.execute(LOCK)
+                # NOTE: Another worker may have dropped it while we waited
+                if name not in await self.list_partitions():
+                    continue
+                await self.executor.execute(text(partition.detach_sql()))
+                await self.executor.execute(text(partition.drop_sql()))
+            dropped.append(name)
+        return dropped
+
+    async def list_partitions(self) -> list[str]:
+        stmt = text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:table AS regclass) "
+            "ORDER BY c.relname"
+        ).bindparams(table=TABLE)
+        result = await self.executor.execute(stmt)
+        return list(result.scalars().all())
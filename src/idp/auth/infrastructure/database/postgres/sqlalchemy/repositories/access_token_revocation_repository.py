@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.auth.application.dtos.models.revoked_access_token import (
+    RevokedAccessToken,
+)
+from idp.auth.application.interfaces.repositories.access_token_revocation_repository import (
+    IAccessTokenRevocationRepository,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.models.revoked_access_token_base import (
+    RevokedAccessTokenBase,
+)
+from sqlalchemy import delete, select
+
+
+class AccessTokenRevocationRepository(IAccessTokenRevocationRepository):
+    def __init__(self, executor: QueryExecutor):
+        self.executor = executor
+
+    async def add_many(self, jtis: Sequence[UUID], expires_at: DateTime) -> None:
+        if not jtis:
+            return
+
+        await self.executor.upsert_many(
+            RevokedAccessTokenBase,
+            [{"jti": jti, "expires_at": expires_at.value} for jti in jtis],
+            index_elements=["jti"],
+        )
+
+    async def exists(self, jti: UUID, now: DateTime) -> bool:
+        stmt = select(RevokedAccessTokenBase.jti).where(
+            RevokedAccessTokenBase.jti == jti,
+            RevokedAccessTokenBase.expires_at > now.value,
+        )
+        return await self.executor.execute_scalar_one(stmt) is not None
+
+    async def get_active(
+        self, now: DateTime, since: DateTime | None = None
+    ) -> list[RevokedAccessToken]:
+        stmt = select(
+            RevokedAccessTokenBase.jti, RevokedAccessTokenBase.created_at
+        ).where(RevokedAccessTokenBase.expires_at > now.value)
+        if since is not None:
+            stmt = stmt.where(RevokedAccessTokenBase.created_at >= since.value)
+
+        rows = await self.executor.execute_many(stmt)
+        return [
+            RevokedAccessToken(jti, DateTime(created_at)) for jti, created_at in rows
+        ]
+
+    async def delete_expired(self, now: DateTime) -> int:
+        stmt = delete(RevokedAccessTokenBase).where(
+            RevokedAccessTokenBase.expires_at <= now.value
+        )
+        return await self.executor.execute_rowcount(stmt)
@@ -1,33 +1,180 @@
+import hmac
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
 from common.application.exceptions import NotFoundError
+from common.domain.value_objects.datetime import DateTime
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
 from idp.auth.domain.entity.token import Token
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.database.postgres.sqlalchemy.mappers.token_mapper import (
     TokenMapper,
 )
 from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
     TokenBase,
 )
-from sqlalchemy import select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    delete,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+
+
+class Match(Enum):
+    """How a refresh token value selects its row, see `RefreshTokenValue`."""
+
+    KEY = "key"
+    SECRET = "secret"
+    VALUE = "value"
+
+
+# NOTE: Built once so every call reuses the memoized cache key and compiled SQL.
+# Parameter names differ from columns, which UPDATE reserves for SET values.
+# Reads select table columns so rows skip the ORM and map with `from_row`.
+TOKENS = TokenBase.__table__
+GET_BY_ID = select(TOKENS).where(TOKENS.c.token_id == bindparam("match_token_id"))
+# NOTE: The full primary key; expires_at lets Postgres prune to one partition
+GET_BY_KEY = GET_BY_ID.where(TOKENS.c.expires_at == bindparam("match_expires_at"))
+GET_BY_VALUE = select(TOKENS).where(TOKENS.c.value == bindparam("match_value"))
+MATCH_SECRET = and_(
+    TokenBase.token_id == bindparam("match_token_id"),
+    TokenBase.secret_hash == bindparam("match_secret_hash"),
+)
+MATCH_KEY = and_(MATCH_SECRET, TokenBase.expires_at == bindparam("match_expires_at"))
+MATCH_VALUE = TokenBase.value == bindparam("match_value")
+# Bulk UPDATEs bump version themselves, so stale versioned writes still conflict
+REVOKE = update(TokenBase).values(revoked=True, version=TokenBase.version + 1)
+REVOKE_BY = {
+    Match.KEY: REVOKE.where(MATCH_KEY),
+    Match.SECRET: REVOKE.where(MATCH_SECRET),
+    Match.VALUE: REVOKE.where(MATCH_VALUE),
+}
+REVOKE_ACTIVE_BY = {
+    match: stmt.where(
+        TokenBase.revoked.is_(False), TokenBase.expires_at > bindparam("now")
+    ).returning(TokenBase.identity_id)
+    for match, stmt in REVOKE_BY.items()
+}
 
 
 class RefreshTokenRepository(IRefreshTokenRepository):
+    """Looks tokens up by primary key and verifies the secret against its digest.
+
+    Selectors without `expires_at` fall back to `token_id` alone, and legacy
+    plaintext tokens are still found by `value`, until they expire.
+    """
+
     def __init__(self, executor: QueryExecutor):
         self.executor = executor
 
     async def get(self, value: str) -> Token:
-        stmt = select(TokenBase).where(TokenBase.value == value)
-        result = await self.executor.execute_scalar_one(stmt)
-        if not result:
+        row = await self._find(value)
+        if not row:
             raise NotFoundError(value)
-        return TokenMapper.to_domain(result)
+        return TokenMapper.from_row(row, value)
 
     async def revoke(self, value: str) -> None:
-        stmt = update(TokenBase).where(TokenBase.value == value).values(revoked=True)
-        await self.executor.execute(stmt)
+        match, params = self._match(value)
+        await self.executor.execute(REVOKE_BY[match], params)
+
+    async def revoke_active(self, value: str, now: DateTime) -> UUID | None:
+        match, params = self._match(value)
+        return await self.executor.execute_scalar_one(
+            REVOKE_ACTIVE_BY[match], {**params, "now": now.value}
+        )
+
+    async def revoke_all(self, identity_id: UUID, now: DateTime) -> list[UUID]:
+        return await self.revoke_all_many([identity_id], now)
+
+    async def revoke_all_many(
+        self, identity_ids: Sequence[UUID], now: DateTime
+    ) -> list[UUID]:
+        if not identity_ids:
+            return []
+
+        # NOTE: Served by ix_tokens_identity_id; expires_at prunes old partitions
+        stmt = REVOKE.where(
+            TokenBase.identity_id.in_(identity_ids),
+            TokenBase.revoked.is_(False),
+            TokenBase.expires_at > now.value,
+        ).returning(TokenBase.token_id)
+        return list(await self.executor.execute_scalar_many(stmt))
 
     async def add(self, token: Token) -> None:
         base = TokenMapper.to_persistence(token)
         await self.executor.add(base)
+
+    async def delete_stale(self, now: DateTime, limit: int) -> int:
+        # NOTE: Bounded by ctid so a batch holds locks on at most `limit` rows;
+        # rows locked by a concurrent rotation are left for the next batch.
+        # ctid is only unique within a partition, hence the tableoid.
+        row: ColumnElement[Any] = tuple_(
+            literal_column("tableoid"), literal_column("ctid")
+        )
+        stale: Select[tuple[Any, Any]] = (
+            select(literal_column("tableoid"), literal_column("ctid"))
+            .select_from(TokenBase)
+            .where(or_(TokenBase.expires_at <= now.value, TokenBase.revoked.is_(True)))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(TokenBase).where(row.in_(stale))
+        return await self.executor.execute_rowcount(stmt)
+
+    async def _find(self, value: str) -> Row[Any] | None:
+        refresh_token = RefreshTokenValue.parse(value)
+        if refresh_token is None:
+            return await self.executor.execute_core_one(
+                GET_BY_VALUE, {"match_value": value}
+            )
+
+        if refresh_token.expires_at is None:
+            row = await self.executor.execute_core_one(
+                GET_BY_ID, {"match_token_id": refresh_token.token_id}
+            )
+        else:
+            row = await self.executor.execute_core_one(
+                GET_BY_KEY,
+                {
+                    "match_token_id": refresh_token.token_id,
+                    "match_expires_at": refresh_token.expires_at.value,
+                },
+            )
+        if row is None or row.secret_hash is None:
+            return None
+
+        secret_hash = TokenMapper.hash_secret(refresh_token.secret)
+        if not hmac.compare_digest(row.secret_hash, secret_hash):
+            return None
+        return row
+
+    def _match(self, value: str) -> tuple[Match, dict[str, Any]]:
+        """Return how `value` selects its row, and the match parameters."""
+        refresh_token = RefreshTokenValue.parse(value)
+        if refresh_token is None:
+            return Match.VALUE, {"match_value": value}
+
+        # NOTE: Comparing digests in SQL leaks no usable timing about the secret
+        params: dict[str, Any] = {
+            "match_token_id": refresh_token.token_id,
+            "match_secret_hash": TokenMapper.hash_secret(refresh_token.secret),
+        }
+        if refresh_token.expires_at is None:
+            return Match.SECRET, params
+        return Match.KEY, {
+            **params,
+            "match_expires_at": refresh_token.expires_at.value,
+        }
@@ -1,21 +1,48 @@
+from operator import attrgetter
 from typing import Any
 
+from common.infrastructure.loaders.data_loader import DataLoader
 from dependency_injector import containers, providers
 from idp.auth.application.repositories.descriptor_repository import (
     IdentityDescriptorRepository,
 )
 from idp.auth.application.usecases.command.login_use_case import LoginUseCase
+from idp.auth.application.usecases.command.logout_all_use_case import (
+    LogoutAllUseCase,
+)
 from idp.auth.application.usecases.command.logout_use_case import LogoutUseCase
 from idp.auth.application.usecases.command.refresh_token_use_case import (
     RefreshTokenUseCase,
 )
+from idp.auth.application.usecases.command.revoke_sessions_use_case import (
+    RevokeSessionsUseCase,
+)
+from idp.auth.infrastructure.cache.descriptor_repository import (
+    CachedIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.cache.revocation_list import BloomFilterRevocationList
+from idp.auth.infrastructure.database.postgres.asyncpg.repositories.descriptor_repository import (
+    AsyncpgIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.database.postgres.asyncpg.repositories.refresh_token_repository import (
+    AsyncpgRefreshTokenRepository,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.partitions.token_partitions import (
+    TokenPartitionManager,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.access_token_revocation_repository import (
+    AccessTokenRevocationRepository,
+)
 from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.refresh_token_repository import (
     RefreshTokenRepository,
 )
+from idp.auth.infrastructure.di.container.providers import provide_jwt_codec
+from idp.auth.infrastructure.services.jose.key_ring import JWTKeyRing
 from idp.auth.infrastructure.services.jwt.token_introspector import JWTTokenIntrospector
 from idp.auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
 from idp.auth.infrastructure.services.jwt.token_refresher import JWTTokenRefresher
 from idp.auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
+from idp.auth.infrastructure.tasks.token_reaper import TokenReaper
 
 
 class TokenContainer(containers.DeclarativeContainer):
@@ -25,41 +52,101 @@ class TokenContainer(containers.DeclarativeContainer):
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     token_generator: providers.Dependency[Any] = providers.Dependency()
 
+    unit_of_work: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
+    driver_executor: providers.Dependency[Any] = providers.Dependency()
+    repository_driver: providers.Dependency[Any] = providers.Dependency()
     identity_repository: providers.Dependency[Any] = providers.Dependency()
 
-    refresh_token_repository = providers.Singleton(
-        RefreshTokenRepository, query_executor
+    refresh_token_repository = providers.Selector(
+        repository_driver,
+        sqlalchemy=providers.Singleton(RefreshTokenRepository, query_executor),
+        asyncpg=providers.Singleton(
+            AsyncpgRefreshTokenRepository, query_executor, driver_executor
+        ),
+    )
+    identity_loader = providers.Singleton(
+        DataLoader,
+        identity_repository.provided.get_many_by_ids,
+        attrgetter("identity_id"),
+        auth_config.provided.descriptor_batch_size,
     )
     identity_descriptor_repository = providers.Singleton(
-        IdentityDescriptorRepository, identity_repository
+        CachedIdentityDescriptorRepository,
+        providers.Selector(
+            repository_driver,
+            sqlalchemy=providers.Singleton(
+                IdentityDescriptorRepository,
+                identity_repository,
+                unit_of_work,
+                identity_loader,
+            ),
+            asyncpg=providers.Singleton(
+                AsyncpgIdentityDescriptorRepository, driver_executor
+            ),
+        ),
+        auth_config,
     )
 
+    jwt_key_ring = providers.Singleton(JWTKeyRing.from_config, auth_config)
+    jwt_codec = providers.Singleton(provide_jwt_codec, auth_config, jwt_key_ring)
+
     token_issuer = providers.Singleton(
         JWTTokenIssuer,
         config=auth_config,
+        codec=jwt_codec,
         token_generator=token_generator,
         uuid_generator=uuid_generator,
         clock=clock,
         refresh_token_repository=refresh_token_repository,
+        descriptor_repository=identity_descriptor_repository,
+    )
+
+    access_token_revocation_repository = providers.Singleton(
+        AccessTokenRevocationRepository, query_executor
     )
+    access_token_revocation_list = providers.Singleton(
+        BloomFilterRevocationList,
+        clock=clock,
+        repository=access_token_revocation_repository,
+        config=auth_config,
+    )
+
     token_revoker = providers.Singleton(
         JWTTokenRevoker,
         clock=clock,
         refresh_token_repository=refresh_token_repository,
+        revocation_list=access_token_revocation_list,
     )
     token_refresher = providers.Singleton(
         JWTTokenRefresher,
         token_issuer=token_issuer,
-        token_revoker=token_revoker,
         clock=clock,
         refresh_token_repository=refresh_token_repository,
+        uow=unit_of_work,
+        revocation_list=access_token_revocation_list,
     )
     token_introspector = providers.Singleton(
         JWTTokenIntrospector,
         config=auth_config,
+        codec=jwt_codec,
         descriptor_repository=identity_descriptor_repository,
         clock=clock,
+        revocation_list=access_token_revocation_list,
+    )
+    token_partition_manager = providers.Singleton(
+        TokenPartitionManager,
+        clock=clock,
+        uow=unit_of_work,
+        executor=query_executor,
+        config=auth_config,
+    )
+    token_reaper = providers.Singleton(
+        TokenReaper,
+        clock=clock,
+        refresh_token_repository=refresh_token_repository,
+        config=auth_config,
+        revocation_repository=access_token_revocation_repository,
     )
 
 
@@ -77,3 +164,5 @@ class AuthContainer(containers.DeclarativeContainer):
     )
     refresh_token_use_case = providers.Singleton(RefreshTokenUseCase, token_refresher)
     logout_use_case = providers.Singleton(LogoutUseCase, token_revoker)
+    logout_all_use_case = providers.Singleton(LogoutAllUseCase, token_revoker)
+    revoke_sessions_use_case = providers.Singleton(RevokeSessionsUseCase, token_revoker)
@@ -0,0 +1,15 @@
+from idp.auth.infrastructure.config.auth_config import AuthConfig, JWTBackendEnum
+from idp.auth.infrastructure.services.hmac.jwt_codec import HMACJWTCodec
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
+from idp.auth.infrastructure.services.jose.key_ring import JWTKeyRing
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+
+
+def provide_jwt_codec(config: AuthConfig, key_ring: JWTKeyRing) -> IJWTCodec:
+    match config.jwt_backend:
+        case JWTBackendEnum.JOSE:
+            return JoseJWTCodec(config, key_ring)
+        case JWTBackendEnum.HMAC:
+            if key_ring.keys:
+                raise ValueError("hmac JWT backend does not support signing_keys")
+            return HMACJWTCodec(config)
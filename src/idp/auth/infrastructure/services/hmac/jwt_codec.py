@@ -0,0 +1,122 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+from idp.identity.application.exceptions import InvalidTokenError, TokenExpiredError
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _is_numeric_date(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+class HMACJWTCodec(IJWTCodec):
+    """Stdlib-only HS256/HS384/HS512 codec.
+
+    The keyed MAC, the encoded header and the expected header segment are built
+    once, so signing and verifying is a MAC copy plus base64/JSON work. Tokens
+    are accepted with the same rules as `JoseJWTCodec`; claim types are checked
+    strictly instead of being coerced.
+    """
+
+    DIGESTS: ClassVar[dict[str, Callable[[], Any]]] = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+    REQUIRED_CLAIMS = ("exp", "iat", "sub")
+
+    def __init__(
+        self, config: AuthConfig, timer: Callable[[], float] = time.time
+    ) -> None:
+        digest = self.DIGESTS.get(config.algorithm)
+        if digest is None:
+            raise ValueError(f"Unsupported HMAC algorithm: {config.algorithm}")
+
+        self.algorithm = config.algorithm
+        self.issuer = config.issuer
+        self.timer = timer
+        self._mac = hmac.new(config.secret_key.encode(), digestmod=digest)
+
+        header = json.dumps(
+            {"alg": config.algorithm, "typ": "JWT"}, separators=(",", ":")
+        )
+        self._header = _b64encode(header.encode())
+        self._header_segment = self._header.decode()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            header, payload, signature = token.split(".")
+        except ValueError as e:
+            raise InvalidTokenError from e
+
+        if header != self._header_segment:
+            self._check_header(header)
+
+        try:
+            expected = self._sign(f"{header}.{payload}".encode())
+            if not hmac.compare_digest(expected, _b64decode(signature)):
+                raise InvalidTokenError("Signature verification failed")
+            claims = json.loads(_b64decode(payload))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise InvalidTokenError from e
+
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("Invalid payload")
+        self._check_claims(claims)
+        return claims
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def _check_header(self, segment: str) -> None:
+        # NOTE: Slow path for headers we did not produce ourselves
+        try:
+            header = json.loads(_b64decode(segment))
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise InvalidTokenError from e
+        if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+            raise InvalidTokenError("Invalid token algorithm")
+
+    def _check_claims(self, claims: dict[str, Any]) -> None:
+        for claim in self.REQUIRED_CLAIMS:
+            if claim not in claims:
+                raise InvalidTokenError(f"Missing required claim: {claim}")
+
+        exp, iat = claims["exp"], claims["iat"]
+        if not _is_numeric_date(exp) or not _is_numeric_date(iat):
+            raise InvalidTokenError("Invalid claim format in token")
+        if not isinstance(claims["sub"], str):
+            raise InvalidTokenError("Invalid claim format in token")
+        if claims.get("iss") != self.issuer:
+            raise InvalidTokenError("Invalid issuer")
+        if "aud" in claims:
+            raise InvalidTokenError("Invalid audience")
+
+        now = self.timer()
+        nbf = claims.get("nbf")
+        if nbf is not None and (not _is_numeric_date(nbf) or nbf > now):
+            raise InvalidTokenError("The token is not yet valid (nbf)")
+        if exp < now:
+            raise TokenExpiredError
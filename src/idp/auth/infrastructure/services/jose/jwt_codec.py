@@ -0,0 +1,60 @@
+from typing import Any
+
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.jose.key_ring import JWTKeyRing
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+from idp.identity.application.exceptions import InvalidTokenError, TokenExpiredError
+from jose import ExpiredSignatureError, JWTError, jwt
+from jose.backends.base import Key
+
+
+class JoseJWTCodec(IJWTCodec):
+    def __init__(self, config: AuthConfig, key_ring: JWTKeyRing | None = None) -> None:
+        self.key = config.secret_key
+        self.algorithm = config.algorithm
+        self.issuer = config.issuer
+        self.algorithms = [config.algorithm]
+        self.options = {"require_exp": True, "require_iat": True, "require_sub": True}
+        self.key_ring = key_ring
+        self.secret_key_fallback = config.secret_key_fallback
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        active = self.key_ring.active if self.key_ring else None
+        if active is None or active.signing_key is None:
+            return jwt.encode(claims, self.key, algorithm=self.algorithm)
+
+        return jwt.encode(
+            claims,
+            active.signing_key,
+            algorithm=active.algorithm,
+            headers={"kid": active.kid},
+        )
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            key, algorithms = self._get_verification_key(token)
+            return jwt.decode(
+                token,
+                key=key,
+                algorithms=algorithms,
+                issuer=self.issuer,
+                options=self.options,
+            )
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError from e
+        except JWTError as e:
+            raise InvalidTokenError from e
+
+    def _get_verification_key(self, token: str) -> tuple[str | Key, list[str]]:
+        if not self.key_ring or not self.key_ring.keys:
+            return self.key, self.algorithms
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None and self.secret_key_fallback:
+            # NOTE: Issued with secret_key before signing keys were configured
+            return self.key, self.algorithms
+        if not isinstance(kid, str):
+            raise InvalidTokenError("Missing or malformed signing key id")
+
+        key = self.key_ring.get(kid)
+        return key.verification_key, [key.algorithm]
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Any, Self
+
+from idp.auth.application.dtos.models.public_key_set import PublicKeySet
+from idp.auth.application.interfaces.services.public_key_set_provider import (
+    IPublicKeySetProvider,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig, SigningKeyConfig
+from idp.identity.application.exceptions import InvalidTokenError
+from jose import jwk
+from jose.backends.base import Key
+
+
+ASYMMETRIC_ALGORITHMS = frozenset(
+    {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+)
+
+
+@dataclass(frozen=True)
+class JWTKey:
+    kid: str
+    algorithm: str
+    verification_key: Key
+    signing_key: Key | None = None
+
+
+class JWTKeyRing(IPublicKeySetProvider):
+    """Asymmetric keys addressed by `kid`.
+
+    The active key signs new tokens; every other key in the ring is retiring
+    and only verifies tokens issued before the rotation. An empty ring means
+    tokens are signed with the shared `secret_key`.
+    """
+
+    def __init__(
+        self, keys: list[JWTKey], active_kid: str | None, max_age: int
+    ) -> None:
+        self.keys = {key.kid: key for key in keys}
+        self.max_age = max_age
+        self.active = self.keys.get(active_kid) if active_kid else None
+
+        if active_kid and self.active is None:
+            raise ValueError(f"Unknown active signing key: {active_kid}")
+        if self.active is not None and self.active.signing_key is None:
+            raise ValueError(f"Active signing key {active_kid} has no private key")
+
+        self._public_key_set = PublicKeySet(
+            keys=[self._to_jwk(key) for key in self.keys.values()],
+            max_age=max_age,
+        )
+
+    @classmethod
+    def from_config(cls, config: AuthConfig) -> Self:
+        keys = [cls._load(key) for key in config.signing_keys]
+        active_kid = config.active_kid
+        if active_kid is None:
+            active_kid = next(
+                (key.kid for key in keys if key.signing_key is not None), None
+            )
+        return cls(keys, active_kid, int(config.jwks_max_age.total_seconds()))
+
+    def get(self, kid: str) -> JWTKey:
+        key = self.keys.get(kid)
+        if key is None:
+            raise InvalidTokenError("Unknown signing key")
+        return key
+
+    def get_public_key_set(self) -> PublicKeySet:
+        return self._public_key_set
+
+    @classmethod
+    def _load(cls, config: SigningKeyConfig) -> JWTKey:
+        if config.algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported signing key algorithm: {config.algorithm}")
+
+        signing_key = None
+        if config.private_key is not None:
+            signing_key = jwk.construct(
+                config.private_key.get_secret_value(), config.algorithm
+            )
+
+        if config.public_key is not None:
+            verification_key = jwk.construct(config.public_key, config.algorithm)
+        elif signing_key is not None:
+            verification_key = signing_key.public_key()
+        else:
+            raise ValueError(f"Signing key {config.kid} has no key material")
+
+        return JWTKey(config.kid, config.algorithm, verification_key, signing_key)
+
+    def _to_jwk(self, key: JWTKey) -> dict[str, Any]:
+        data: dict[str, Any] = key.verification_key.to_dict()
+        return {**data, "kid": key.kid, "alg": key.algorithm, "use": "sig"}
@@ -10,17 +10,28 @@ class TokenClaims:
     iss: str
     iat: datetime
     exp: datetime
+    username: str | None = None
+    jti: UUID | None = None
 
     @property
     def identity_id(self) -> UUID:
         return self.sub
 
     @classmethod
-    def create(
+    def create(  # noqa: PLR0913
         cls,
         identity_id: UUID,
         issuer: str,
         issued_at: datetime,
         expires_at: datetime,
+        username: str | None = None,
+        jti: UUID | None = None,
     ) -> Self:
-        return cls(sub=identity_id, iss=issuer, iat=issued_at, exp=expires_at)
+        return cls(
+            sub=identity_id,
+            iss=issuer,
+            iat=issued_at,
+            exp=expires_at,
+            username=username,
+            jti=jti,
+        )
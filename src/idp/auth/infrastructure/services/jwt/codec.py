@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IJWTCodec(ABC):
+    """Signs and verifies JWTs for the configured issuer.
+
+    `decode` verifies the signature, requires `exp`, `iat` and `sub`, checks
+    `iss` and expiry, and raises `TokenExpiredError` or `InvalidTokenError`.
+    """
+
+    @abstractmethod
+    def encode(self, claims: dict[str, Any]) -> str: ...
+    @abstractmethod
+    def decode(self, token: str) -> dict[str, Any]: ...
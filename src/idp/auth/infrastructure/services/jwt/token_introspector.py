@@ -1,19 +1,32 @@
+import hashlib
 from typing import Any
 from uuid import UUID
 
-from common.application.exceptions import NotFoundError, RepositoryError
+from common.application.exceptions import (
+    ApplicationError,
+    NotFoundError,
+    RepositoryError,
+)
 from common.domain.interfaces.clock import IClock
+from common.infrastructure.cache.ttl_cache import CacheMetrics, TTLCache
 from idp.auth.application.interfaces.repositories.descriptor_repository import (
     IIdentityDescriptorRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
 from idp.auth.infrastructure.config.auth_config import AuthConfig
 from idp.auth.infrastructure.services.jwt.claims import TokenClaims
-from idp.identity.application.exceptions import InvalidTokenError, TokenExpiredError
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+from idp.identity.application.exceptions import (
+    InvalidTokenError,
+    TokenExpiredError,
+    TokenRevokedError,
+)
 from idp.identity.application.interfaces.services.token_intospector import (
     ITokenIntrospector,
 )
 from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
-from jose import ExpiredSignatureError, JWTError, jwt
 
 
 class JWTTokenIntrospector(ITokenIntrospector):
@@ -22,13 +35,25 @@ class JWTTokenIntrospector(ITokenIntrospector):
         config: AuthConfig,
         clock: IClock,
         descriptor_repository: IIdentityDescriptorRepository,
+        codec: IJWTCodec,
+        revocation_list: IAccessTokenRevocationList | None = None,
     ) -> None:
         self.config = config
         self.clock = clock
         self.descriptor_repository = descriptor_repository
+        self.codec = codec
+        self.revocation_list = revocation_list
+        # NOTE: Rejected tokens are cached as the error type to raise
+        self.cache: TTLCache[bytes, TokenClaims | type[ApplicationError]] = TTLCache(
+            config.token_cache_size
+        )
 
     async def extract_user(self, token: str) -> IdentityDescriptor:
         claims = self.decode(token)
+        await self._check_revocation(claims)
+        if self.config.stateless_descriptor and claims.username is not None:
+            return IdentityDescriptor(claims.identity_id, claims.username)
+
         try:
             return await self.descriptor_repository.get_by_id(claims.identity_id)
         except NotFoundError as e:
@@ -44,24 +69,39 @@ class JWTTokenIntrospector(ITokenIntrospector):
             return False
 
     async def validate(self, token: str) -> UUID:
-        return self.decode(token).identity_id
+        claims = self.decode(token)
+        await self._check_revocation(claims)
+        return claims.identity_id
 
     def decode(self, token: str) -> TokenClaims:
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self.cache.get(key)
+        if isinstance(cached, TokenClaims):
+            return cached
+        if cached is not None:
+            raise cached
+
         try:
-            payload = jwt.decode(
-                token,
-                key=self.config.secret_key,
-                algorithms=[self.config.algorithm],
-                issuer=self.config.issuer,
-                options={"require": ["exp", "iat", "sub"]},
+            payload = self.codec.decode(token)
+            claims = self._parse_claims(payload)
+        except (InvalidTokenError, TokenExpiredError) as e:
+            self.cache.set_for(
+                key, type(e), self.config.token_negative_cache_ttl.total_seconds()
             )
+            raise
+
+        self.cache.set(key, claims, float(payload["exp"]))
+        return claims
 
-            return self._parse_claims(payload)
+    def get_metrics(self) -> CacheMetrics:
+        return self.cache.get_metrics()
 
-        except ExpiredSignatureError as e:
-            raise TokenExpiredError from e
-        except JWTError as e:
-            raise InvalidTokenError from e
+    async def _check_revocation(self, claims: TokenClaims) -> None:
+        # NOTE: Not cached with the claims, revocation can happen at any time
+        if self.revocation_list is None or claims.jti is None:
+            return
+        if await self.revocation_list.is_revoked(claims.jti):
+            raise TokenRevokedError()
 
     def _parse_claims(self, payload: dict[str, Any]) -> TokenClaims:
         try:
@@ -70,6 +110,8 @@ class JWTTokenIntrospector(ITokenIntrospector):
                 iss=payload["iss"],
                 iat=self.clock.from_timestamp(payload["iat"]).value,
                 exp=self.clock.from_timestamp(payload["exp"]).value,
+                username=payload.get("preferred_username"),
+                jti=UUID(payload["jti"]) if "jti" in payload else None,
             )
         except Exception as e:
             raise InvalidTokenError("Malformed token claims") from e
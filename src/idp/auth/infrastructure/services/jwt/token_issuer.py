@@ -7,50 +7,75 @@ from common.domain.interfaces.token_generator import ITokenGenerator
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.datetime import DateTime
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
 from idp.auth.application.interfaces.services.token_service import ITokenIssuer
 from idp.auth.domain.entity.token import Token, TokenTypeEnum
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.config.auth_config import AuthConfig
 from idp.auth.infrastructure.services.jwt.claims import TokenClaims
-from jose import jwt
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
 
 
 class JWTTokenIssuer(ITokenIssuer):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         clock: IClock,
         config: AuthConfig,
         token_generator: ITokenGenerator,
         uuid_generator: IUUIDGenerator,
         refresh_token_repository: IRefreshTokenRepository,
+        descriptor_repository: IIdentityDescriptorRepository,
+        codec: IJWTCodec,
     ) -> None:
         self.config = config
         self.clock = clock
         self.token_generator = token_generator
         self.uuid_generator = uuid_generator
         self.refresh_token_repository = refresh_token_repository
+        self.descriptor_repository = descriptor_repository
+        self.codec = codec
 
     async def issue_tokens(self, identity_id: UUID) -> AuthTokens:
-        access = self.issue_access_token(identity_id)
+        descriptor = None
+        if self.config.stateless_descriptor:
+            descriptor = await self.descriptor_repository.get_by_id(identity_id)
+
         refresh = self.issue_refresh_token(identity_id)
+        # NOTE: The pair shares an id, so revoking the session revokes both
+        access = self.issue_access_token(identity_id, descriptor, refresh.token_id)
 
         await self.refresh_token_repository.add(refresh)
 
         return AuthTokens.create(identity_id, access.value, refresh.value)
 
-    def issue_access_token(self, identity_id: UUID) -> Token:
+    def issue_access_token(
+        self,
+        identity_id: UUID,
+        descriptor: IdentityDescriptor | None = None,
+        jti: UUID | None = None,
+    ) -> Token:
         issued_at = self.clock.now()
         expires_at = self.expires_at(issued_at, self.config.access_token_ttl)
+        token_id = jti or self.uuid_generator.create()
 
         claims = TokenClaims.create(
-            identity_id, self.config.issuer, issued_at.value, expires_at.value
+            identity_id,
+            self.config.issuer,
+            issued_at.value,
+            expires_at.value,
+            username=descriptor.username if descriptor else None,
+            jti=token_id,
         )
         token_str = self.create_jwt_token(claims)
 
         return Token.create(
-            token_id=self.uuid_generator.create(),
+            token_id=token_id,
             identity_id=identity_id,
             value=token_str,
             token_type=TokenTypeEnum.ACCESS,
@@ -62,12 +87,15 @@ class JWTTokenIssuer(ITokenIssuer):
         issued_at = self.clock.now()
         expires_at = self.expires_at(issued_at, self.config.refresh_token_ttl)
 
-        token_value = self.token_generator.secure(64)
+        token_id = self.uuid_generator.create()
+        token_value = RefreshTokenValue(
+            token_id, self.token_generator.secure(32), expires_at
+        )
 
         refresh_token = Token.create(
-            token_id=self.uuid_generator.create(),
+            token_id=token_id,
             identity_id=user_id,
-            value=token_value,
+            value=token_value.value,
             token_type=TokenTypeEnum.REFRESH,
             issued_at=issued_at,
             expires_at=expires_at,
@@ -82,11 +110,11 @@ class JWTTokenIssuer(ITokenIssuer):
             "iat": int(claims.iat.timestamp()),
             "exp": int(claims.exp.timestamp()),
         }
-        return jwt.encode(
-            payload,
-            self.config.secret_key,
-            algorithm=self.config.algorithm,
-        )
+        if claims.jti is not None:
+            payload["jti"] = str(claims.jti)
+        if claims.username is not None:
+            payload["preferred_username"] = claims.username
+        return self.codec.encode(payload)
 
     def expires_at(self, issued_at: DateTime, ttl: timedelta) -> DateTime:
         return issued_at + ttl
@@ -1,12 +1,17 @@
 from common.application.exceptions import NotFoundError
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.application.transactions.transactional import transactional
 from common.domain.interfaces.clock import IClock
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
 from idp.auth.application.interfaces.services.token_service import ITokenRefresher
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
-from idp.auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
 from idp.identity.application.exceptions import (
     InvalidTokenError,
     TokenExpiredError,
@@ -19,23 +24,44 @@ class JWTTokenRefresher(ITokenRefresher):
         self,
         clock: IClock,
         token_issuer: JWTTokenIssuer,
-        token_revoker: JWTTokenRevoker,
         refresh_token_repository: IRefreshTokenRepository,
+        uow: IUnitOfWork,
+        revocation_list: IAccessTokenRevocationList | None = None,
     ) -> None:
         self.clock = clock
         self.token_issuer = token_issuer
-        self.token_revoker = token_revoker
         self.refresh_token_repository = refresh_token_repository
+        self.uow = uow
+        self.revocation_list = revocation_list
 
+    @transactional()
     async def refresh_tokens(self, refresh_token: str) -> AuthTokens:
+        identity_id = await self.refresh_token_repository.revoke_active(
+            refresh_token, self.clock.now()
+        )
+        if identity_id is None:
+            raise await self._rejection(refresh_token)
+
+        await self._revoke_access_token(refresh_token)
+        return await self.token_issuer.issue_tokens(identity_id)
+
+    async def _revoke_access_token(self, refresh_token: str) -> None:
+        # NOTE: The access token issued with the rotated refresh token carries
+        # its id as `jti`. Revoked here, in the rotation transaction, since a
+        # later log-out only reaches tokens that are still active.
+        # Tokens without a selector predate `jti` and have nothing to revoke.
+        value = RefreshTokenValue.parse(refresh_token)
+        if self.revocation_list is not None and value is not None:
+            await self.revocation_list.revoke([value.token_id])
+
+    async def _rejection(self, refresh_token: str) -> Exception:
+        # NOTE: Only reached on failure, so the happy path stays at one statement
         try:
             token = await self.refresh_token_repository.get(refresh_token)
-        except NotFoundError as e:
-            raise InvalidTokenError from e
+        except NotFoundError:
+            return InvalidTokenError()
         if token.is_expired(self.clock.now()):
-            raise TokenExpiredError()
-        if token.is_revoked():
-            raise TokenRevokedError()
-
-        await self.token_revoker.revoke_refresh_token(refresh_token)
-        return await self.token_issuer.issue_tokens(token.identity_id)
+            return TokenExpiredError()
+        # NOTE: Also covers losing the race to a concurrent refresh whose
+        # revocation is not yet visible to this transaction
+        return TokenRevokedError()
@@ -1,18 +1,28 @@
+from collections.abc import Sequence
+from uuid import UUID
+
 from common.application.exceptions import NotFoundError
 from common.domain.interfaces.clock import IClock
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
 from idp.auth.application.interfaces.services.token_service import ITokenRevoker
 from idp.identity.application.exceptions import InvalidTokenError
 
 
 class JWTTokenRevoker(ITokenRevoker):
     def __init__(
-        self, clock: IClock, refresh_token_repository: IRefreshTokenRepository
+        self,
+        clock: IClock,
+        refresh_token_repository: IRefreshTokenRepository,
+        revocation_list: IAccessTokenRevocationList | None = None,
     ) -> None:
         self.clock = clock
         self.refresh_token_repository = refresh_token_repository
+        self.revocation_list = revocation_list
 
     async def revoke_refresh_token(self, refresh_token: str) -> None:
         try:
@@ -25,3 +35,23 @@ class JWTTokenRevoker(ITokenRevoker):
             return
 
         await self.refresh_token_repository.revoke(refresh_token)
+        await self._revoke_access_tokens([token.token_id])
+
+    async def revoke_all(self, identity_id: UUID) -> int:
+        token_ids = await self.refresh_token_repository.revoke_all(
+            identity_id, self.clock.now()
+        )
+        await self._revoke_access_tokens(token_ids)
+        return len(token_ids)
+
+    async def revoke_all_many(self, identity_ids: Sequence[UUID]) -> int:
+        token_ids = await self.refresh_token_repository.revoke_all_many(
+            identity_ids, self.clock.now()
+        )
+        await self._revoke_access_tokens(token_ids)
+        return len(token_ids)
+
+    async def _revoke_access_tokens(self, token_ids: Sequence[UUID]) -> None:
+        # NOTE: Access tokens carry the id of their refresh token as `jti`
+        if self.revocation_list is not None:
+            await self.revocation_list.revoke(token_ids)
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from idp.auth.application.interfaces.repositories.access_token_revocation_repository import (
+    IAccessTokenRevocationRepository,
+)
+from idp.auth.application.interfaces.repositories.token_repository import (
+    IRefreshTokenRepository,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+
+
+@dataclass(frozen=True)
+class TokenReaperMetrics:
+    runs: int
+    batches: int
+    reaped: int
+    last_batch_latency: float
+    max_batch_latency: float
+    total_batch_latency: float
+    revocations_reaped: int
+
+
+class TokenReaper:
+    """Deletes expired and revoked refresh tokens in bounded batches.
+
+    Each batch is its own short transaction; the reaper sleeps
+    `reaper_batch_delay` between full batches so a large backlog does not
+    monopolise the database. Expired access-token revocations are purged in
+    the same run.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        clock: IClock,
+        refresh_token_repository: IRefreshTokenRepository,
+        config: AuthConfig,
+        revocation_repository: IAccessTokenRevocationRepository | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.clock = clock
+        self.refresh_token_repository = refresh_token_repository
+        self.revocation_repository = revocation_repository
+        self.batch_size = config.reaper_batch_size
+        self.batch_delay = config.reaper_batch_delay.total_seconds()
+        self.sleep = sleep
+        self.timer = timer
+
+        self._runs = 0
+        self._batches = 0
+        self._reaped = 0
+        self._last_batch_latency = 0.0
+        self._max_batch_latency = 0.0
+        self._total_batch_latency = 0.0
+        self._revocations_reaped = 0
+
+    async def reap(self) -> int:
+        self._runs += 1
+        now = self.clock.now()
+        reaped = 0
+
+        if self.revocation_repository is not None:
+            self._revocations_reaped += await self.revocation_repository.delete_expired(
+                now
+            )
+
+        while True:
+            deleted = await self._reap_batch(now)
+            reaped += deleted
+            if deleted < self.batch_size:
+                return reaped
+            await self.sleep(self.batch_delay)
+
+    def get_metrics(self) -> TokenReaperMetrics:
+        return TokenReaperMetrics(
+            runs=self._runs,
+            batches=self._batches,
+            reaped=self._reaped,
+            last_batch_latency=self._last_batch_latency,
+            max_batch_latency=self._max_batch_latency,
+            total_batch_latency=self._total_batch_latency,
+            revocations_reaped=self._revocations_reaped,
+        )
+
+    async def _reap_batch(self, now: DateTime) -> int:
+        started_at = self.timer()
+        deleted = await self.refresh_token_repository.delete_stale(now, self.batch_size)
+        latency = self.timer() - started_at
+
+        self._batches += 1
+        self._reaped += deleted
+        self._last_batch_latency = latency
+        self._max_batch_latency = max(self._max_batch_latency, latency)
+        self._total_batch_latency += latency
+        return deleted
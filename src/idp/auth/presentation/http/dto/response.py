@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -7,3 +8,7 @@ class AuthTokensResponse(BaseModel):
     user_id: UUID
     access_token: str
     refresh_token: str
+
+
+class JWKSResponse(BaseModel):
+    keys: list[dict[str, Any]]
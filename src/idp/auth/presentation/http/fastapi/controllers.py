@@ -1,28 +1,40 @@
 from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Form, HTTPException, status
+from common.infrastructure.server.fastapi.dependencies.transaction import (
+    request_transaction,
+)
+from fastapi import APIRouter, Depends, Form, HTTPException, Response, status
 from fastapi_utils.cbv import cbv
 from idp.auth.application.dtos.commands.login_command import LoginCommand
+from idp.auth.application.dtos.commands.logout_all_command import LogoutAllCommand
 from idp.auth.application.dtos.commands.logout_command import LogoutCommand
 from idp.auth.application.dtos.commands.refresh_token_command import (
     RefreshTokenCommand,
 )
+from idp.auth.application.interfaces.services.public_key_set_provider import (
+    IPublicKeySetProvider,
+)
 from idp.auth.application.interfaces.usecases.command.login_use_case import (
     ILoginUseCase,
 )
+from idp.auth.application.interfaces.usecases.command.logout_all_use_case import (
+    ILogoutAllUseCase,
+)
 from idp.auth.application.interfaces.usecases.command.logout_use_case import (
     ILogoutUseCase,
 )
 from idp.auth.application.interfaces.usecases.command.refresh_token_use_case import (
     IRefreshTokenUseCase,
 )
-from idp.auth.presentation.http.dto.response import AuthTokensResponse
+from idp.auth.presentation.http.dto.response import AuthTokensResponse, JWKSResponse
 from idp.identity.application.exceptions import (
     InvalidPasswordError,
     InvalidUsernameError,
 )
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
 from idp.identity.presentation.http.fastapi.auth import (
+    get_descriptor,
     get_token,
     require_authenticated,
     require_unauthenticated,
@@ -30,12 +42,14 @@ from idp.identity.presentation.http.fastapi.auth import (
 
 
 auth_router = APIRouter()
+well_known_router = APIRouter()
 
 
 @cbv(auth_router)
 class AuthController:
     login_use_case: ILoginUseCase = Depends()
     logout_use_case: ILogoutUseCase = Depends()
+    logout_all_use_case: ILogoutAllUseCase = Depends()
     refresh_token_use_case: IRefreshTokenUseCase = Depends()
 
     @auth_router.post("/login", dependencies=[Depends(require_unauthenticated)])
@@ -71,14 +85,38 @@ class AuthController:
     @auth_router.post(
         "/logout",
         status_code=status.HTTP_204_NO_CONTENT,
-        dependencies=[Depends(require_authenticated)],
+        dependencies=[Depends(request_transaction), Depends(require_authenticated)],
     )
     async def logout(self, token: Annotated[str, Depends(get_token)]) -> None:
         await self.logout_use_case.execute(LogoutCommand(refresh_token=token))
 
+    @auth_router.post(
+        "/logout-all",
+        status_code=status.HTTP_204_NO_CONTENT,
+        dependencies=[Depends(request_transaction)],
+    )
+    async def logout_all(
+        self, descriptor: Annotated[IdentityDescriptor, Depends(get_descriptor)]
+    ) -> None:
+        await self.logout_all_use_case.execute(
+            LogoutAllCommand(identity_id=descriptor.identity_id)
+        )
+
+    # NOTE: No request_transaction, the refresher owns its transaction so
+    # rotation conflicts are retried
     @auth_router.post("/refresh", dependencies=[Depends(require_authenticated)])
     async def refresh(
         self, token: Annotated[str, Depends(get_token)]
     ) -> AuthTokensResponse:
         result = await self.refresh_token_use_case.execute(RefreshTokenCommand(token))
         return AuthTokensResponse(**asdict(result))
+
+
+@well_known_router.get("/.well-known/jwks.json")
+async def jwks(
+    response: Response,
+    key_set_provider: Annotated[IPublicKeySetProvider, Depends()],
+) -> JWKSResponse:
+    key_set = key_set_provider.get_public_key_set()
+    response.headers["Cache-Control"] = f"public, max-age={key_set.max_age}"
+    return JWKSResponse(keys=key_set.keys)
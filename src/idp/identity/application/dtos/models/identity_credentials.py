@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class IdentityCredentials:
+    identity_id: UUID
+    password_hash: str
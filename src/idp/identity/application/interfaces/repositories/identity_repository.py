@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
 from idp.identity.domain.entity.identity import Identity
 
 
@@ -8,8 +12,14 @@ class IIdentityRepository(ABC):
     @abstractmethod
     async def get_by_id(self, identity_id: UUID) -> Identity: ...
     @abstractmethod
+    async def get_many_by_ids(self, identity_ids: Sequence[UUID]) -> list[Identity]: ...
+    @abstractmethod
     async def exists_by_username(self, username: str) -> bool: ...
     @abstractmethod
     async def get_by_username(self, username: str) -> Identity: ...
     @abstractmethod
+    async def get_credentials_by_username(
+        self, username: str
+    ) -> IdentityCredentials: ...
+    @abstractmethod
     async def add(self, entity: Identity) -> None: ...
@@ -6,3 +6,25 @@ class IPasswordHasher(ABC):
     def hash(self, password: str) -> str: ...
     @abstractmethod
     def verify(self, password: str, hashed_password: str) -> bool: ...
+    @abstractmethod
+    def dummy_hash(self) -> str:
+        """Return a valid hash of the same cost as `hash` produces.
+
+        Verifying against it lets callers spend the same time on unknown
+        usernames as on wrong passwords.
+        """
+
+
+class IAsyncPasswordHasher(ABC):
+    """Non-blocking counterpart of `IPasswordHasher`.
+
+    Implementations must not block the event loop while hashing, since password
+    hashing is deliberately slow (hundreds of milliseconds per call).
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str: ...
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool: ...
+    @abstractmethod
+    def dummy_hash(self) -> str: ...
@@ -8,6 +8,7 @@ from idp.identity.application.dtos.commands.verify_password_command import (
     VerifyPasswordCommand,
 )
 from idp.identity.application.exceptions import (
+    IdentityNotFoundError,
     InvalidPasswordError,
     InvalidUsernameError,
     UsernameAlreadyTakenError,
@@ -19,7 +20,7 @@ from idp.identity.application.interfaces.services.identity_service import (
     IIdentityService,
 )
 from idp.identity.application.interfaces.services.password_hash_service import (
-    IPasswordHasher,
+    IAsyncPasswordHasher,
 )
 from idp.identity.domain.entity.identity import Identity
 from idp.identity.domain.interfaces.identity_factory import IIdentityFactory
@@ -30,7 +31,7 @@ class IdentityService(IIdentityService):
         self,
         identity_repository: IIdentityRepository,
         identity_factory: IIdentityFactory,
-        password_hasher: IPasswordHasher,
+        password_hasher: IAsyncPasswordHasher,
     ) -> None:
         self.identity_repository = identity_repository
         self.identity_factory = identity_factory
@@ -46,7 +47,7 @@ class IdentityService(IIdentityService):
         if await self.exists_by_username(command.username):
             raise UsernameAlreadyTakenError(command.username)
 
-        password_hash = self.password_hasher.hash(command.password)
+        password_hash = await self.password_hasher.hash(command.password)
         identity = self.identity_factory.create(command.username, password_hash)
 
         try:
@@ -57,11 +58,20 @@ class IdentityService(IIdentityService):
         return identity.identity_id
 
     async def verify_password(self, command: VerifyPasswordCommand) -> UUID:
-        if not await self.exists_by_username(command.username):
-            raise InvalidUsernameError(command.username)
+        try:
+            credentials = await self.identity_repository.get_credentials_by_username(
+                command.username
+            )
+        except IdentityNotFoundError as exc:
+            # NOTE: Verify anyway so unknown usernames take as long as wrong passwords
+            await self.password_hasher.verify(
+                command.password, self.password_hasher.dummy_hash()
+            )
+            raise InvalidUsernameError(command.username) from exc
 
-        identity = await self.get_by_username(command.username)
-        if not self.password_hasher.verify(command.password, identity.password.value):
-            raise InvalidPasswordError(identity.identity_id)
+        if not await self.password_hasher.verify(
+            command.password, credentials.password_hash
+        ):
+            raise InvalidPasswordError(credentials.identity_id)
 
-        return identity.identity_id
+        return credentials.identity_id
@@ -0,0 +1,15 @@
+from enum import Enum
+
+from pydantic import BaseModel, PositiveInt
+
+
+class PasswordHasherExecutorEnum(str, Enum):
+    INLINE = "inline"  # NOTE: Blocks the event loop, intended for tests and benchmarks
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class PasswordHasherConfig(BaseModel):
+    executor: PasswordHasherExecutorEnum = PasswordHasherExecutorEnum.THREAD
+    max_workers: PositiveInt = 4
+    max_queue_depth: PositiveInt = 64
@@ -0,0 +1,14 @@
+from common.infrastructure.database.sqlalchemy.driver_executor import Record
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.domain.value_objects.password import Password
+from idp.identity.domain.value_objects.username import Username
+
+
+class IdentityRecordMapper:
+    @classmethod
+    def to_domain(cls, record: Record) -> Identity:
+        return Identity(
+            identity_id=record["identity_id"],
+            username=Username(record["username"]),
+            password=Password(record["password"]),
+        )
@@ -0,0 +1,74 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from common.infrastructure.database.sqlalchemy.driver_executor import AsyncpgExecutor
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
+from idp.identity.application.exceptions import IdentityNotFoundError
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.infrastructure.database.postgres.asyncpg.mappers.identity_mapper import (
+    IdentityRecordMapper,
+)
+from idp.identity.infrastructure.database.postgres.sqlalchemy.repositories.identity_repository import (
+    IdentityRepository,
+)
+
+
+GET_BY_ID = (
+    "SELECT identity_id, username, password FROM identities WHERE identity_id = $1"
+)
+GET_MANY_BY_IDS = (
+    "SELECT identity_id, username, password FROM identities"
+    " WHERE identity_id = ANY($1::uuid[])"
+)
+GET_BY_USERNAME = (
+    "SELECT identity_id, username, password FROM identities WHERE username = $1"
+)
+EXISTS_BY_USERNAME = "SELECT EXISTS (SELECT 1 FROM identities WHERE username = $1)"
+GET_CREDENTIALS_BY_USERNAME = (
+    "SELECT identity_id, password FROM identities WHERE username = $1"
+)
+
+
+class AsyncpgIdentityRepository(IdentityRepository):
+    """Runs the lookups straight on asyncpg; writes stay on SQLAlchemy."""
+
+    def __init__(self, executor: QueryExecutor, driver: AsyncpgExecutor) -> None:
+        super().__init__(executor)
+        self.driver = driver
+
+    async def get_by_id(self, identity_id: UUID) -> Identity:
+        record = await self.driver.fetchrow(GET_BY_ID, identity_id, read_only=True)
+        if not record:
+            raise IdentityNotFoundError(identity_id)
+        return IdentityRecordMapper.to_domain(record)
+
+    async def get_many_by_ids(self, identity_ids: Sequence[UUID]) -> list[Identity]:
+        records = await self.driver.fetch(
+            GET_MANY_BY_IDS, list(identity_ids), read_only=True
+        )
+        return [IdentityRecordMapper.to_domain(record) for record in records]
+
+    async def exists_by_username(self, username: str) -> bool:
+        exists: bool = await self.driver.fetchval(
+            EXISTS_BY_USERNAME, username, read_only=True
+        )
+        return exists
+
+    async def get_by_username(self, username: str) -> Identity:
+        record = await self.driver.fetchrow(GET_BY_USERNAME, username, read_only=True)
+        if not record:
+            raise IdentityNotFoundError(username)
+        return IdentityRecordMapper.to_domain(record)
+
+    async def get_credentials_by_username(self, username: str) -> IdentityCredentials:
+        record = await self.driver.fetchrow(
+            GET_CREDENTIALS_BY_USERNAME, username, read_only=True
+        )
+        if not record:
+            raise IdentityNotFoundError(username)
+        return IdentityCredentials(
+            identity_id=record["identity_id"], password_hash=record["password"]
+        )
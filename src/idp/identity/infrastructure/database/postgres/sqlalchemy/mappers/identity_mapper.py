@@ -1,9 +1,12 @@
+from typing import Any
+
 from idp.identity.domain.entity.identity import Identity
 from idp.identity.domain.value_objects.password import Password
 from idp.identity.domain.value_objects.username import Username
 from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
     IdentityBase,
 )
+from sqlalchemy import Row
 
 
 class IdentityMapper:
@@ -15,6 +18,14 @@ class IdentityMapper:
             password=Password(base.password),
         )
 
+    @classmethod
+    def from_row(cls, row: Row[Any]) -> Identity:
+        return Identity(
+            identity_id=row.identity_id,
+            username=Username(row.username),
+            password=Password(row.password),
+        )
+
     @classmethod
     def to_persistence(cls, user: Identity) -> IdentityBase:
         return IdentityBase(
@@ -1,6 +1,10 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
 from idp.identity.application.exceptions import IdentityNotFoundError
 from idp.identity.application.interfaces.repositories.identity_repository import (
     IIdentityRepository,
@@ -12,7 +16,29 @@ from idp.identity.infrastructure.database.postgres.sqlalchemy.mappers.identity_m
 from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
     IdentityBase,
 )
-from sqlalchemy import exists, select
+from sqlalchemy import any_, bindparam, exists, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID
+
+
+# NOTE: Built once so every call reuses the memoized cache key and compiled SQL.
+# Reads select table columns so rows skip the ORM and map with `from_row`.
+IDENTITIES = IdentityBase.__table__
+GET_BY_ID = select(IDENTITIES).where(
+    IDENTITIES.c.identity_id == bindparam("identity_id")
+)
+# NOTE: One array parameter, so every batch size shares the prepared statement
+GET_MANY_BY_IDS = select(IDENTITIES).where(
+    IDENTITIES.c.identity_id == any_(bindparam("identity_ids", type_=ARRAY(PGUUID)))
+)
+GET_BY_USERNAME = select(IDENTITIES).where(
+    IDENTITIES.c.username == bindparam("username")
+)
+EXISTS_BY_USERNAME = select(
+    exists().where(IDENTITIES.c.username == bindparam("username"))
+)
+GET_CREDENTIALS_BY_USERNAME = select(
+    IDENTITIES.c.identity_id, IDENTITIES.c.password
+).where(IDENTITIES.c.username == bindparam("username"))
 
 
 class IdentityRepository(IIdentityRepository):
@@ -20,22 +46,41 @@ class IdentityRepository(IIdentityRepository):
         self.executor = executor
 
     async def get_by_id(self, identity_id: UUID) -> Identity:
-        stmt = select(IdentityBase).where(IdentityBase.identity_id == identity_id)
-        identity = await self.executor.execute_scalar_one(stmt)
-        if not identity:
+        row = await self.executor.execute_core_one(
+            GET_BY_ID, {"identity_id": identity_id}
+        )
+        if not row:
             raise IdentityNotFoundError(identity_id)
-        return IdentityMapper.to_domain(identity)
+        return IdentityMapper.from_row(row)
+
+    async def get_many_by_ids(self, identity_ids: Sequence[UUID]) -> list[Identity]:
+        rows = await self.executor.execute_core_many(
+            GET_MANY_BY_IDS, {"identity_ids": list(identity_ids)}
+        )
+        return [IdentityMapper.from_row(row) for row in rows]
 
     async def exists_by_username(self, username: str) -> bool:
-        stmt = select(exists().where(IdentityBase.username == username))
-        return await self.executor.execute_scalar(stmt)
+        return await self.executor.execute_scalar(
+            EXISTS_BY_USERNAME, {"username": username}
+        )
 
     async def get_by_username(self, username: str) -> Identity:
-        stmt = select(IdentityBase).where(IdentityBase.username == username)
-        identity = await self.executor.execute_scalar_one(stmt)
-        if not identity:
+        row = await self.executor.execute_core_one(
+            GET_BY_USERNAME, {"username": username}
+        )
+        if not row:
+            raise IdentityNotFoundError(username)
+        return IdentityMapper.from_row(row)
+
+    async def get_credentials_by_username(self, username: str) -> IdentityCredentials:
+        row = await self.executor.execute_core_one(
+            GET_CREDENTIALS_BY_USERNAME, {"username": username}
+        )
+        if not row:
             raise IdentityNotFoundError(username)
-        return IdentityMapper.to_domain(identity)
+        return IdentityCredentials(
+            identity_id=row.identity_id, password_hash=row.password
+        )
 
     async def add(self, entity: Identity) -> None:
         model = IdentityMapper.to_persistence(entity)
@@ -6,30 +6,49 @@ from idp.identity.application.usecases.command.create_identity_use_case import (
     CreateIdentityUseCase,
 )
 from idp.identity.domain.factories.identity_factory import IdentityFactory
+from idp.identity.infrastructure.database.postgres.asyncpg.repositories.identity_repository import (
+    AsyncpgIdentityRepository,
+)
 from idp.identity.infrastructure.database.postgres.sqlalchemy.repositories.identity_repository import (
     IdentityRepository,
 )
+from idp.identity.infrastructure.di.container.providers import (
+    provide_async_password_hasher,
+)
 from idp.identity.infrastructure.services.bcrypt.password_hasher import (
     BcryptPasswordHasher,
 )
 
 
 class IdentityContainer(containers.DeclarativeContainer):
+    password_hasher_config: providers.Dependency[Any] = providers.Dependency()
+
     uuid_generator: providers.Dependency[Any] = providers.Dependency()
     query_executor: providers.Dependency[Any] = providers.Dependency()
+    driver_executor: providers.Dependency[Any] = providers.Dependency()
+    repository_driver: providers.Dependency[Any] = providers.Dependency()
     # NOTE: token_introspector is for semantics only, not used but needed for presentation layer
     token_introspector: providers.Dependency[Any] = providers.Dependency()
 
     identity_factory = providers.Singleton(IdentityFactory, uuid_generator)
-    identity_repository = providers.Singleton(IdentityRepository, query_executor)
+    identity_repository = providers.Selector(
+        repository_driver,
+        sqlalchemy=providers.Singleton(IdentityRepository, query_executor),
+        asyncpg=providers.Singleton(
+            AsyncpgIdentityRepository, query_executor, driver_executor
+        ),
+    )
 
     password_hasher = providers.Singleton(BcryptPasswordHasher)
+    async_password_hasher = providers.Singleton(
+        provide_async_password_hasher, password_hasher, password_hasher_config
+    )
 
     identity_service = providers.Singleton(
         IdentityService,
         identity_repository=identity_repository,
         identity_factory=identity_factory,
-        password_hasher=password_hasher,
+        password_hasher=async_password_hasher,
     )
     create_identity_use_case = providers.Singleton(
         CreateIdentityUseCase, identity_service
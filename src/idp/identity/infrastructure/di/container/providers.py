@@ -0,0 +1,15 @@
+from idp.identity.application.interfaces.services.password_hash_service import (
+    IPasswordHasher,
+)
+from idp.identity.infrastructure.config.password_hasher_config import (
+    PasswordHasherConfig,
+)
+from idp.identity.infrastructure.services.executor.password_hasher import (
+    ExecutorPasswordHasher,
+)
+
+
+def provide_async_password_hasher(
+    hasher: IPasswordHasher, config: PasswordHasherConfig
+) -> ExecutorPasswordHasher:
+    return ExecutorPasswordHasher.create(hasher, config)
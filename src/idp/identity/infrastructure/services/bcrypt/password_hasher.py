@@ -4,9 +4,16 @@ from idp.identity.application.interfaces.services.password_hash_service import (
 )
 
 
+# NOTE: Cost must match bcrypt.gensalt() default so that verification takes as long
+DUMMY_HASH = "$2b$12$NNO/nMewBH8Srt4v1DktGuKCXGvQyye7LiQZFSr0.QFszBcdo/CyK"
+
+
 class BcryptPasswordHasher(IPasswordHasher):
     def hash(self, password: str) -> str:
         return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
 
     def verify(self, password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+    def dummy_hash(self) -> str:
+        return DUMMY_HASH
@@ -0,0 +1,133 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Self, TypeVar
+
+from common.application.exceptions import ServiceUnavailableError
+from idp.identity.application.interfaces.services.password_hash_service import (
+    IAsyncPasswordHasher,
+    IPasswordHasher,
+)
+from idp.identity.infrastructure.config.password_hasher_config import (
+    PasswordHasherConfig,
+    PasswordHasherExecutorEnum,
+)
+
+
+RESULT = TypeVar("RESULT")
+
+
+def _run_timed(func: Callable[..., RESULT], *args: str) -> tuple[RESULT, float]:
+    # NOTE: Module level so that it can be pickled by ProcessPoolExecutor
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+@dataclass(frozen=True)
+class PasswordHasherMetrics:
+    in_flight: int
+    max_in_flight: int
+    completed: int
+    rejected: int
+    failed: int
+    queue_wait_seconds_total: float
+    run_seconds_total: float
+
+
+class ExecutorPasswordHasher(IAsyncPasswordHasher):
+    """Runs a blocking `IPasswordHasher` in a bounded worker pool.
+
+    At most `max_queue_depth` operations may be in flight (queued or running);
+    further calls are rejected with `ServiceUnavailableError` instead of piling
+    up behind the pool. Without an executor the hasher runs inline.
+    """
+
+    def __init__(
+        self,
+        hasher: IPasswordHasher,
+        executor: Executor | None,
+        max_queue_depth: int,
+    ) -> None:
+        self.hasher = hasher
+        self.executor = executor
+        self.max_queue_depth = max_queue_depth
+
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._failed = 0
+        self._queue_wait_seconds_total = 0.0
+        self._run_seconds_total = 0.0
+
+    @classmethod
+    def create(cls, hasher: IPasswordHasher, config: PasswordHasherConfig) -> Self:
+        executor: Executor | None
+        match config.executor:
+            case PasswordHasherExecutorEnum.THREAD:
+                executor = ThreadPoolExecutor(
+                    max_workers=config.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+            case PasswordHasherExecutorEnum.PROCESS:
+                executor = ProcessPoolExecutor(max_workers=config.max_workers)
+            case PasswordHasherExecutorEnum.INLINE:
+                executor = None
+
+        return cls(hasher, executor, config.max_queue_depth)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.hasher.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(self.hasher.verify, password, hashed_password)
+
+    def dummy_hash(self) -> str:
+        return self.hasher.dummy_hash()
+
+    def get_metrics(self) -> PasswordHasherMetrics:
+        return PasswordHasherMetrics(
+            in_flight=self._in_flight,
+            max_in_flight=self._max_in_flight,
+            completed=self._completed,
+            rejected=self._rejected,
+            failed=self._failed,
+            queue_wait_seconds_total=self._queue_wait_seconds_total,
+            run_seconds_total=self._run_seconds_total,
+        )
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _submit(self, func: Callable[..., RESULT], *args: str) -> RESULT:
+        if self._in_flight >= self.max_queue_depth:
+            self._rejected += 1
+            raise ServiceUnavailableError("Password hasher queue is full")
+
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        submitted_at = time.perf_counter()
+        try:
+            if self.executor is None:
+                result, run_seconds = _run_timed(func, *args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, run_seconds = await loop.run_in_executor(
+                    self.executor, _run_timed, func, *args
+                )
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+        self._completed += 1
+        self._run_seconds_total += run_seconds
+        self._queue_wait_seconds_total += max(
+            time.perf_counter() - submitted_at - run_seconds, 0.0
+        )
+        return result
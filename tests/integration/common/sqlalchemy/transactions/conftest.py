@@ -5,7 +5,7 @@ from uuid import UUID
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Integer, String, func
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
@@ -34,6 +34,16 @@ class MockModel(MockBase):
     name: Mapped[str] = mapped_column(String, nullable=False)
 
 
+class VersionedMockModel(MockBase):
+    __tablename__ = "versioned_model"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __mapper_args__: Any = {"version_id_col": version}  # noqa: RUF012
+
+
 @pytest_asyncio.fixture(scope="session")
 async def async_engine() -> AsyncGenerator[AsyncEngine, Any]:
     engine = create_async_engine(
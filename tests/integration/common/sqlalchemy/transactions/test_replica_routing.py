@@ -0,0 +1,115 @@
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.replicas import Replica, ReplicaSet
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+
+@pytest_asyncio.fixture
+async def replica_engine() -> AsyncGenerator[AsyncEngine, Any]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestReplicaRouting:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        async_engine: AsyncEngine,
+        async_session_maker: async_sessionmaker[AsyncSession],
+        replica_engine: AsyncEngine,
+    ):
+        self.primary = async_engine
+        self.replica = Replica(
+            "replica",
+            replica_engine,
+            async_sessionmaker(replica_engine, expire_on_commit=False),
+        )
+        self.replicas = ReplicaSet([self.replica], logging.getLogger())
+        self.factory = MakerSessionFactory(async_session_maker, self.replicas)
+        self.uow = UnitOfWork(self.factory)
+
+    def _bind(self) -> Any:
+        return self.uow._get_session().bind  # noqa: SLF001
+
+    async def test_read_only_uses_replica(self) -> None:
+        async with self.uow.read_only():
+            assert self._bind() is self.replica.engine
+
+    async def test_implicit_select_uses_primary(self) -> None:
+        executor = QueryExecutor(self.uow)
+
+        with patch.object(self.factory, "create", wraps=self.factory.create) as create:
+            await executor.execute(select(literal(1)))
+
+        create.assert_called_once_with(read_only=True, allow_replica=False)
+        assert self.replicas.get_metrics().routed == 0
+
+    async def test_implicit_session_uses_primary(self) -> None:
+        async with self.uow.get_session(read_only=True) as session:
+            assert session.bind is self.primary
+
+    async def test_read_write_uses_primary(self) -> None:
+        async with self.uow:
+            assert self._bind() is self.primary
+
+    async def test_read_only_joins_outer_transaction(self) -> None:
+        async with self.uow:
+            async with self.uow.read_only():
+                assert self._bind() is self.primary
+
+    async def test_read_only_falls_back_to_primary(self) -> None:
+        self.replicas.eject(self.replica)
+
+        async with self.uow.read_only():
+            assert self._bind() is self.primary
+
+    async def test_reads_pinned_to_primary_after_write(self) -> None:
+        async with self.uow:
+            pass
+
+        assert self.uow.is_pinned()
+        async with self.uow.read_only():
+            assert self._bind() is self.primary
+
+    async def test_bound_inside_transaction_or_once_pinned(self) -> None:
+        assert not self.uow.is_bound()
+        async with self.uow.read_only():
+            assert self.uow.is_bound()
+        assert not self.uow.is_bound()
+
+        async with self.uow:
+            pass
+
+        assert self.uow.is_bound()
+
+    async def test_read_only_does_not_pin(self) -> None:
+        async with self.uow.read_only():
+            pass
+
+        assert not self.uow.is_pinned()
+
+    async def test_no_pinning_without_read_your_writes(self) -> None:
+        uow = UnitOfWork(self.factory, read_your_writes=False)
+        async with uow:
+            pass
+
+        async with uow.read_only():
+            assert uow._get_session().bind is self.replica.engine  # noqa: SLF001
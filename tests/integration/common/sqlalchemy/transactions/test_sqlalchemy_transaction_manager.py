@@ -1,12 +1,30 @@
-from uuid import uuid4
+from typing import Any
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
+from common.application.exceptions import (
+    DeadlockDetectedError,
+    OptimisticLockError,
+    RepositoryError,
+    SerializationFailureError,
+)
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.session_factory import (
     MakerSessionFactory,
+    ReadOnlySession,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import (
+    UnitOfWork,
+    UnitOfWorkMetrics,
+)
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from tests.integration.common.sqlalchemy.transactions.conftest import (
+    MockModel,
+    VersionedMockModel,
 )
-from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from tests.integration.common.sqlalchemy.transactions.conftest import MockModel
 
 
 @pytest.mark.asyncio
@@ -182,3 +200,487 @@ class TestSQLAlchemyTransactionManager:
 
         assert await self._is_saved(model1)
         assert await self._is_saved(model2)
+
+
+@pytest.mark.asyncio
+class TestReadOnlyTransaction:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        async_engine: AsyncEngine,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ):
+        self.async_session_maker = async_session_maker
+        self.read_only_maker = async_sessionmaker(
+            async_engine.execution_options(isolation_level="AUTOCOMMIT"),
+            expire_on_commit=False,
+            sync_session_class=ReadOnlySession,
+        )
+        self.factory = MakerSessionFactory(
+            async_session_maker, read_only_maker=self.read_only_maker
+        )
+        self.uow = UnitOfWork(self.factory)
+        self.executor = QueryExecutor(self.uow)
+
+    async def _isolation_level(self) -> Any:
+        session = self.uow._get_session()  # noqa: SLF001
+        connection = await session.connection()
+        options = await connection.run_sync(lambda conn: conn.get_execution_options())
+        return options.get("isolation_level")
+
+    async def test_read_only_is_autocommit(self) -> None:
+        async with self.uow.read_only():
+            assert await self._isolation_level() == "AUTOCOMMIT"
+
+    async def test_read_write_is_transactional(self) -> None:
+        async with self.uow:
+            assert await self._isolation_level() is None
+
+    async def test_read_only_skips_commit(self) -> None:
+        with patch.object(AsyncSession, "commit") as commit:
+            async with self.uow.read_only():
+                await self.executor.execute(select(MockModel))
+
+        commit.assert_not_awaited()
+
+    async def test_read_only_rejects_writes(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+
+        with pytest.raises(RepositoryError):
+            async with self.uow.read_only():
+                await self.executor.execute(
+                    insert(MockModel).values(id=model.id, name=model.name)
+                )
+
+        assert (
+            await self.executor.execute_scalar_one(
+                select(MockModel.name).where(MockModel.id == model.id)
+            )
+            is None
+        )
+
+    async def test_select_outside_transaction_is_read_only(self) -> None:
+        with patch.object(AsyncSession, "commit") as commit:
+            await self.executor.execute(select(MockModel))
+
+        commit.assert_not_awaited()
+
+    async def test_write_outside_transaction_commits(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+
+        await self.executor.execute(
+            insert(MockModel).values(id=model.id, name=model.name)
+        )
+
+        assert (
+            await self.executor.execute_scalar_one(
+                select(MockModel.name).where(MockModel.id == model.id)
+            )
+            == model.name
+        )
+
+    async def test_execute_binds_params(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+        await self.executor.execute(
+            insert(MockModel).values(id=model.id, name=model.name)
+        )
+        stmt = select(MockModel.name).where(MockModel.id == bindparam("model_id"))
+
+        assert (
+            await self.executor.execute_scalar_one(stmt, {"model_id": model.id})
+            == model.name
+        )
+        assert (
+            await self.executor.execute_scalar_one(stmt, {"model_id": uuid4()}) is None
+        )
+
+    async def test_execute_core_skips_identity_map(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+        await self.executor.execute(
+            insert(MockModel).values(id=model.id, name=model.name)
+        )
+        table = MockModel.__table__
+        stmt = select(table).where(table.c.id == bindparam("model_id"))
+
+        async with self.uow.read_only():
+            row = await self.executor.execute_core_one(stmt, {"model_id": model.id})
+            rows = await self.executor.execute_core_many(stmt, {"model_id": model.id})
+            session = self.uow._get_session()  # noqa: SLF001
+
+            assert row is not None
+            assert (row.id, row.name) == (model.id, model.name)
+            assert rows == [row]
+            assert not session.identity_map
+
+
+@pytest.mark.asyncio
+class TestTransactionScope:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session_maker: async_sessionmaker[AsyncSession]):
+        self.async_session_maker = async_session_maker
+        self.factory = MakerSessionFactory(async_session_maker)
+        self.uow = UnitOfWork(self.factory)
+        self.executor = QueryExecutor(self.uow)
+
+    async def _is_saved(self, model: MockModel) -> bool:
+        async with self.async_session_maker() as session:
+            return await session.get(MockModel, model.id) is not None
+
+    async def _insert(self, model: MockModel) -> None:
+        await self.executor.execute(
+            insert(MockModel).values(id=model.id, name=model.name)
+        )
+
+    async def test_scope_without_queries_opens_no_session(self) -> None:
+        with patch.object(self.factory, "create") as create:
+            async with self.uow.scope():
+                pass
+
+        create.assert_not_called()
+
+    async def test_scope_is_bound(self) -> None:
+        async with self.uow.scope():
+            assert self.uow.is_bound()
+
+    async def test_scope_shares_one_session(self) -> None:
+        async with self.uow.scope():
+            async with self.uow:
+                first = self.uow._get_session()  # noqa: SLF001
+            async with self.uow.read_only():
+                second = self.uow._get_session()  # noqa: SLF001
+            async with self.uow.get_session() as third:
+                pass
+
+        assert first is second is third
+
+    async def test_scope_commits_once_on_exit(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+
+        with patch.object(AsyncSession, "commit") as commit:
+            async with self.uow.scope():
+                await self._insert(model)
+                await self.executor.execute(select(MockModel))
+                commit.assert_not_awaited()
+
+        commit.assert_awaited_once()
+
+    async def test_scope_persists_writes(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+
+        async with self.uow.scope():
+            await self._insert(model)
+
+        assert await self._is_saved(model)
+        assert not self.uow._transaction_exists()  # noqa: SLF001
+
+    async def test_scope_rolls_back_on_error(self) -> None:
+        model = MockModel(id=uuid4(), name="mock")
+
+        async def run() -> None:
+            async with self.uow.scope():
+                await self._insert(model)
+                raise ValueError("Rollback")
+
+        with pytest.raises(ValueError, match="Rollback"):
+            await run()
+
+        assert not await self._is_saved(model)
+        assert not self.uow._transaction_exists()  # noqa: SLF001
+
+    async def test_scope_inside_transaction_joins_it(self) -> None:
+        async with self.uow:
+            outer = self.uow._get_session()  # noqa: SLF001
+            async with self.uow.scope(), self.uow:
+                assert self.uow._get_session() is outer  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+class TestQueryExecutorStream:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session_maker: async_sessionmaker[AsyncSession]):
+        self.uow = UnitOfWork(MakerSessionFactory(async_session_maker))
+        self.executor = QueryExecutor(self.uow)
+        self.name = f"stream-{uuid4()}"
+        self.ids = {uuid4() for _ in range(5)}
+
+    async def _seed(self) -> None:
+        await self.executor.execute(
+            insert(MockModel).values(
+                [{"id": model_id, "name": self.name} for model_id in self.ids]
+            )
+        )
+
+    async def test_stream_scalars_yields_every_row(self) -> None:
+        await self._seed()
+        stmt = select(MockModel).where(MockModel.name == self.name)
+
+        models = [
+            model async for model in self.executor.stream_scalars(stmt, yield_per=2)
+        ]
+
+        assert {model.id for model in models} == self.ids
+
+    async def test_stream_scalars_releases_partitions(self) -> None:
+        await self._seed()
+        stmt = select(MockModel).where(MockModel.name == self.name)
+
+        async with self.uow:
+            session = self.uow._get_session()  # noqa: SLF001
+            models = [
+                model async for model in self.executor.stream_scalars(stmt, yield_per=2)
+            ]
+
+            assert len(models) == len(self.ids)
+            assert all(model not in session for model in models)
+
+    async def test_stream_rows_binds_params(self) -> None:
+        await self._seed()
+        stmt = select(MockModel.id).where(MockModel.name == bindparam("name"))
+
+        rows = [
+            row
+            async for row in self.executor.stream_rows(
+                stmt, {"name": self.name}, yield_per=2
+            )
+        ]
+
+        assert {row.id for row in rows} == self.ids
+
+
+@pytest.mark.asyncio
+class TestQueryExecutorBulk:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session_maker: async_sessionmaker[AsyncSession]):
+        self.uow = UnitOfWork(MakerSessionFactory(async_session_maker))
+        self.executor = QueryExecutor(self.uow)
+        self.name = f"bulk-{uuid4()}"
+
+    async def _names(self, ids: list[UUID]) -> list[str]:
+        stmt = select(MockModel.name).where(MockModel.id.in_(ids))
+        return list(await self.executor.execute_scalar_many(stmt))
+
+    async def test_insert_many_returns_rows_in_order(self) -> None:
+        ids = [uuid4() for _ in range(5)]
+
+        rows = await self.executor.insert_many(
+            MockModel,
+            [{"id": model_id, "name": self.name} for model_id in ids],
+            MockModel.id,
+            chunk_size=2,
+        )
+
+        assert [row.id for row in rows] == ids
+
+    async def test_insert_many_commits_each_chunk(self) -> None:
+        ids = [uuid4() for _ in range(5)]
+
+        with patch.object(AsyncSession, "commit", autospec=True) as commit:
+            await self.executor.insert_many(
+                MockModel,
+                [{"id": model_id, "name": self.name} for model_id in ids],
+                chunk_size=2,
+            )
+
+        assert commit.await_count == 3  # noqa: PLR2004
+
+    async def test_insert_many_joins_transaction(self) -> None:
+        ids = [uuid4() for _ in range(5)]
+
+        async def run() -> None:
+            async with self.uow:
+                await self.executor.insert_many(
+                    MockModel,
+                    [{"id": model_id, "name": self.name} for model_id in ids],
+                    chunk_size=2,
+                )
+                raise ValueError("Test rollback")
+
+        with pytest.raises(ValueError, match="Test rollback"):
+            await run()
+        assert await self._names(ids) == []
+
+    async def test_upsert_many(self) -> None:
+        model_id = uuid4()
+        await self.executor.insert_many(MockModel, [{"id": model_id, "name": "old"}])
+
+        await self.executor.upsert_many(
+            MockModel, [{"id": model_id, "name": "new"}], index_elements=["id"]
+        )
+        assert await self._names([model_id]) == ["old"]
+
+        await self.executor.upsert_many(
+            MockModel,
+            [{"id": model_id, "name": "new"}],
+            index_elements=["id"],
+            update=["name"],
+        )
+        assert await self._names([model_id]) == ["new"]
+
+
+@pytest.mark.asyncio
+class TestQueryExecutorVersionedUpdate:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session_maker: async_sessionmaker[AsyncSession]):
+        self.uow = UnitOfWork(MakerSessionFactory(async_session_maker))
+        self.executor = QueryExecutor(self.uow)
+        self.id = uuid4()
+
+    async def _add(self) -> None:
+        await self.executor.insert_many(
+            VersionedMockModel, [{"id": self.id, "name": "old", "version": 1}]
+        )
+
+    async def _get(self) -> tuple[str, int]:
+        stmt = select(VersionedMockModel.name, VersionedMockModel.version).where(
+            VersionedMockModel.id == self.id
+        )
+        row = await self.executor.execute_one(stmt)
+        assert row is not None
+        return row.name, row.version
+
+    async def test_update_versioned(self) -> None:
+        await self._add()
+
+        version = await self.executor.update_versioned(
+            VersionedMockModel, {"id": self.id}, {"name": "new"}, 1
+        )
+
+        assert version == 2  # noqa: PLR2004
+        assert await self._get() == ("new", 2)
+
+    async def test_update_versioned_stale(self) -> None:
+        await self._add()
+        await self.executor.update_versioned(
+            VersionedMockModel, {"id": self.id}, {"name": "new"}, 1
+        )
+
+        with pytest.raises(OptimisticLockError):
+            await self.executor.update_versioned(
+                VersionedMockModel, {"id": self.id}, {"name": "stale"}, 1
+            )
+        assert await self._get() == ("new", 2)
+
+    async def test_save_versioned(self) -> None:
+        await self._add()
+        model = VersionedMockModel(id=self.id, name="new", version=1)
+
+        with patch.object(AsyncSession, "merge") as merge:
+            await self.executor.save(model)
+
+        merge.assert_not_called()
+        assert model.version == 2  # noqa: PLR2004
+        assert await self._get() == ("new", 2)
+
+    async def test_save_versioned_stale(self) -> None:
+        await self._add()
+        await self.executor.save(VersionedMockModel(id=self.id, name="new", version=1))
+
+        with pytest.raises(OptimisticLockError):
+            await self.executor.save(
+                VersionedMockModel(id=self.id, name="stale", version=1)
+            )
+        assert await self._get() == ("new", 2)
+
+    async def test_update_versioned_without_version_column(self) -> None:
+        with pytest.raises(ValueError, match="no version_id_col"):
+            await self.executor.update_versioned(
+                MockModel, {"id": self.id}, {"name": "new"}, 1
+            )
+
+
+class SQLStateError(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkRun:
+    @pytest.fixture(autouse=True)
+    def setup(self, async_session_maker: async_sessionmaker[AsyncSession]):
+        self.uow = UnitOfWork(MakerSessionFactory(async_session_maker))
+        self.executor = QueryExecutor(self.uow)
+        self.calls = 0
+
+    async def _conflict_once(self) -> int:
+        self.calls += 1
+        if self.calls == 1:
+            raise OptimisticLockError()
+        return self.calls
+
+    async def _always_conflict(self) -> None:
+        self.calls += 1
+        raise OptimisticLockError()
+
+    async def test_run_returns_result(self) -> None:
+        async def func() -> str:
+            return "result"
+
+        assert await self.uow.run(func) == "result"
+        assert self.uow.get_metrics() == UnitOfWorkMetrics(
+            runs=1, conflicts=0, retries=0, exhausted=0, propagated=0
+        )
+
+    async def test_run_retries_conflict(self) -> None:
+        assert await self.uow.run(self._conflict_once, backoff=0) == 2  # noqa: PLR2004
+        assert self.uow.get_metrics() == UnitOfWorkMetrics(
+            runs=1, conflicts=1, retries=1, exhausted=0, propagated=0
+        )
+
+    async def test_run_gives_up_after_retries(self) -> None:
+        with pytest.raises(OptimisticLockError):
+            await self.uow.run(self._always_conflict, retries=2, backoff=0)
+
+        assert self.calls == 3  # noqa: PLR2004
+        assert self.uow.get_metrics() == UnitOfWorkMetrics(
+            runs=1, conflicts=3, retries=2, exhausted=1, propagated=0
+        )
+
+    async def test_run_inside_transaction_does_not_retry(self) -> None:
+        async def run() -> None:
+            async with self.uow:
+                await self.uow.run(self._always_conflict, backoff=0)
+
+        with pytest.raises(OptimisticLockError):
+            await run()
+        assert self.calls == 1
+        assert self.uow.get_metrics() == UnitOfWorkMetrics(
+            runs=1, conflicts=1, retries=0, exhausted=0, propagated=1
+        )
+
+    async def test_run_rolls_back_each_attempt(self) -> None:
+        model_id = uuid4()
+
+        async def func() -> None:
+            await self.executor.execute(
+                insert(MockModel).values(id=model_id, name="mock")
+            )
+            await self._always_conflict()
+
+        with pytest.raises(OptimisticLockError):
+            await self.uow.run(func, retries=1, backoff=0)
+
+        stmt = select(MockModel.id).where(MockModel.id == model_id)
+        assert await self.executor.execute_scalar_one(stmt) is None
+
+    @pytest.mark.parametrize(
+        ("sqlstate", "error"),
+        [("40001", SerializationFailureError), ("40P01", DeadlockDetectedError)],
+    )
+    async def test_run_translates_commit_conflict(
+        self, sqlstate: str, error: type[Exception]
+    ) -> None:
+        failure = OperationalError("COMMIT", {}, SQLStateError(sqlstate))
+
+        async def func() -> None:
+            await self.executor.execute(
+                insert(MockModel).values(id=uuid4(), name="mock")
+            )
+
+        with (
+            patch.object(AsyncSession, "commit", side_effect=failure) as commit,
+            pytest.raises(error),
+        ):
+            await self.uow.run(func, retries=1, backoff=0)
+
+        assert commit.await_count == 2  # noqa: PLR2004
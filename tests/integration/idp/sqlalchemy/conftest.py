@@ -5,12 +5,17 @@ from common.infrastructure.config.database_config import (
     DatabaseDriverEnum,
     DatabaseExtensionEnum,
 )
+from common.infrastructure.database.sqlalchemy.database import Database
+from common.infrastructure.database.sqlalchemy.driver_executor import AsyncpgExecutor
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from common.infrastructure.database.sqlalchemy.models.base import Base
 from common.infrastructure.database.sqlalchemy.session_factory import (
     ISessionFactory,
 )
 from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from idp.auth.infrastructure.database.postgres.sqlalchemy.models.revoked_access_token_base import (
+    RevokedAccessTokenBase,
+)
 from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base import (
     TokenBase,
 )
@@ -21,13 +26,12 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 from testcontainers.postgres import PostgresContainer
 
 
 # Needed for proper database configuration, e.g. fkeys and tables
-__models__: list[type[Base]] = [IdentityBase, TokenBase]
+__models__: list[type[Base]] = [IdentityBase, TokenBase, RevokedAccessTokenBase]
 
 
 class StaticSessionFactory(ISessionFactory):
@@ -36,7 +40,9 @@ class StaticSessionFactory(ISessionFactory):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    def create(self) -> AsyncSession:
+    def create(
+        self, read_only: bool = False, allow_replica: bool = True
+    ) -> AsyncSession:
         return self._session
 
 
@@ -63,7 +69,7 @@ def database_config(pg_container: PostgresContainer) -> DatabaseConfig:
 async def engine(database_config: DatabaseConfig):
     print("uri", database_config.database_url)
 
-    engine = create_async_engine(database_config.database_url, echo=False)
+    engine = Database.create_engine(database_config)
 
     yield engine
     await engine.dispose()
@@ -101,3 +107,8 @@ def uow(session_factory: ISessionFactory):
 @pytest.fixture
 def query_executor(uow: UnitOfWork):
     return QueryExecutor(uow)
+
+
+@pytest.fixture
+def driver_executor(uow: UnitOfWork):
+    return AsyncpgExecutor(uow)
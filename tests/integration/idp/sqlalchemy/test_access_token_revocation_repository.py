@@ -0,0 +1,70 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.access_token_revocation_repository import (
+    AccessTokenRevocationRepository,
+)
+
+
+@pytest.mark.asyncio
+class TestAccessTokenRevocationRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self, query_executor: QueryExecutor):
+        self.now = DateTime(datetime.now(UTC))
+        self.repository = AccessTokenRevocationRepository(query_executor)
+
+    async def test_add_many_and_exists(self):
+        jti = uuid4()
+
+        await self.repository.add_many([jti], self.now + timedelta(minutes=15))
+
+        assert await self.repository.exists(jti, self.now) is True
+        assert await self.repository.exists(uuid4(), self.now) is False
+
+    async def test_add_many_is_idempotent(self):
+        jti = uuid4()
+        expires_at = self.now + timedelta(minutes=15)
+
+        await self.repository.add_many([jti], expires_at)
+        await self.repository.add_many([jti], expires_at)
+
+        assert await self.repository.exists(jti, self.now) is True
+
+    async def test_expired_revocation_does_not_exist(self):
+        jti = uuid4()
+
+        await self.repository.add_many([jti], self.now - timedelta(seconds=1))
+
+        assert await self.repository.exists(jti, self.now) is False
+
+    async def test_get_active(self):
+        active, expired = uuid4(), uuid4()
+        await self.repository.add_many([active], self.now + timedelta(minutes=15))
+        await self.repository.add_many([expired], self.now - timedelta(seconds=1))
+
+        jtis = {revoked.jti for revoked in await self.repository.get_active(self.now)}
+
+        assert active in jtis
+        assert expired not in jtis
+
+    async def test_get_active_since(self):
+        jti = uuid4()
+        await self.repository.add_many([jti], self.now + timedelta(minutes=15))
+
+        future = self.now + timedelta(minutes=1)
+        recent = await self.repository.get_active(self.now, since=future)
+
+        assert jti not in {revoked.jti for revoked in recent}
+
+    async def test_delete_expired(self):
+        active, expired = uuid4(), uuid4()
+        await self.repository.add_many([active], self.now + timedelta(minutes=15))
+        await self.repository.add_many([expired], self.now - timedelta(seconds=1))
+
+        assert await self.repository.delete_expired(self.now) >= 1
+        assert await self.repository.exists(active, self.now) is True
+        jtis = {revoked.jti for revoked in await self.repository.get_active(self.now)}
+        assert expired not in jtis
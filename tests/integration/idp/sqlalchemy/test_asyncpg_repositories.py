@@ -0,0 +1,105 @@
+from uuid import uuid4
+
+import pytest
+from common.infrastructure.database.sqlalchemy.driver_executor import AsyncpgExecutor
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.session_factory import (
+    MakerSessionFactory,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from idp.auth.infrastructure.database.postgres.asyncpg.repositories.descriptor_repository import (
+    AsyncpgIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.database.postgres.asyncpg.repositories.refresh_token_repository import (
+    AsyncpgRefreshTokenRepository,
+)
+from idp.identity.application.exceptions import IdentityNotFoundError
+from idp.identity.domain.entity.identity import Identity
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+from idp.identity.domain.value_objects.password import Password
+from idp.identity.domain.value_objects.username import Username
+from idp.identity.infrastructure.database.postgres.asyncpg.repositories.identity_repository import (
+    AsyncpgIdentityRepository,
+)
+from idp.identity.infrastructure.database.postgres.sqlalchemy.mappers.identity_mapper import (
+    IdentityMapper,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from tests.integration.idp.sqlalchemy import test_token_repository, test_user_repository
+
+
+# NOTE: Reruns the SQLAlchemy repository suites against the asyncpg versions
+
+
+class TestAsyncpgIdentityRepository(test_user_repository.TestIdentityRepository):
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        query_executor: QueryExecutor,
+        driver_executor: AsyncpgExecutor,
+    ):
+        self.maker = maker
+        self.identity_repository = AsyncpgIdentityRepository(
+            query_executor, driver_executor
+        )
+
+
+class TestAsyncpgRefreshTokenRepository(
+    test_token_repository.TestRefreshTokenRepository
+):
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        query_executor: QueryExecutor,
+        driver_executor: AsyncpgExecutor,
+    ):
+        self.maker = maker
+        self.token_repository = AsyncpgRefreshTokenRepository(
+            query_executor, driver_executor
+        )
+
+    async def test_revoke_active_joins_transaction(self):
+        token = await self._add_token()
+        uow = UnitOfWork(MakerSessionFactory(self.maker))
+        repository = AsyncpgRefreshTokenRepository(
+            QueryExecutor(uow), AsyncpgExecutor(uow)
+        )
+
+        async def run() -> None:
+            async with uow:
+                await repository.revoke_active(token.value, token.issued_at)
+                raise ValueError("Test rollback")
+
+        with pytest.raises(ValueError, match="Test rollback"):
+            await run()
+        assert await self._is_revoked(token) is False
+
+
+@pytest.mark.asyncio
+class TestAsyncpgIdentityDescriptorRepository:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        driver_executor: AsyncpgExecutor,
+    ):
+        self.maker = maker
+        self.repository = AsyncpgIdentityDescriptorRepository(driver_executor)
+
+    async def test_get_by_id(self):
+        identity = Identity(uuid4(), Username("test identity"), Password("hash"))
+        async with self.maker() as session:
+            session.add(IdentityMapper.to_persistence(identity))
+            await session.commit()
+
+        result = await self.repository.get_by_id(identity.identity_id)
+
+        assert result == IdentityDescriptor(
+            identity.identity_id, identity.username.value
+        )
+
+    async def test_get_by_id_not_found(self):
+        with pytest.raises(IdentityNotFoundError):
+            await self.repository.get_by_id(uuid4())
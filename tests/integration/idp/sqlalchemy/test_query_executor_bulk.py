@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+import pytest
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.identity.infrastructure.database.postgres.sqlalchemy.models.identity_base import (
+    IdentityBase,
+)
+from sqlalchemy import select
+
+
+@pytest.mark.asyncio
+class TestQueryExecutorBulk:
+    @pytest.fixture(autouse=True)
+    def setup(self, query_executor: QueryExecutor):
+        self.executor = query_executor
+
+    async def _usernames(self) -> set[str]:
+        return set(
+            await self.executor.execute_scalar_many(select(IdentityBase.username))
+        )
+
+    async def test_copy_records(self):
+        records = [(uuid4(), f"user-{i}", "hash") for i in range(5)]
+
+        await self.executor.copy_records(
+            IdentityBase,
+            ["identity_id", "username", "password"],
+            records,
+            chunk_size=2,
+        )
+
+        assert await self._usernames() == {username for _, username, _ in records}
+
+    async def test_upsert_many_skips_conflicts(self):
+        identity_id = uuid4()
+        await self.executor.insert_many(
+            IdentityBase,
+            [{"identity_id": identity_id, "username": "user", "password": "hash"}],
+        )
+
+        await self.executor.upsert_many(
+            IdentityBase,
+            [
+                {"identity_id": identity_id, "username": "user", "password": "new"},
+                {"identity_id": uuid4(), "username": "other", "password": "hash"},
+            ],
+            index_elements=["identity_id"],
+        )
+
+        assert await self._usernames() == {"user", "other"}
@@ -0,0 +1,113 @@
+import re
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from idp.auth.domain.entity.token import Token, TokenTypeEnum
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.database.postgres.sqlalchemy.partitions.token_partitions import (
+    TokenPartitionManager,
+)
+from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.refresh_token_repository import (
+    RefreshTokenRepository,
+)
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+@pytest.mark.asyncio
+class TestTokenPartitionManager:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        maker: async_sessionmaker[AsyncSession],
+        uow: UnitOfWork,
+        query_executor: QueryExecutor,
+    ):
+        self.maker = maker
+        self.now = datetime.now(UTC)
+        self.clock = Mock(spec=IClock)
+        self.clock.now.return_value = DateTime(self.now)
+        self.config = AuthConfig(secret_key="secret", issuer="test")
+        self.manager = TokenPartitionManager(
+            self.clock, uow, query_executor, self.config
+        )
+        self.repository = RefreshTokenRepository(query_executor)
+
+    def _get_token(self, expires_at: datetime) -> Token:
+        token_id = uuid4()
+        return Token(
+            token_id=token_id,
+            identity_id=uuid4(),
+            value=RefreshTokenValue(token_id, str(uuid4()), DateTime(expires_at)).value,
+            token_type=TokenTypeEnum.REFRESH,
+            issued_at=DateTime(expires_at - timedelta(days=7)),
+            expires_at=DateTime(expires_at),
+            revoked=False,
+        )
+
+    async def _partition_of(self, token: Token) -> str:
+        async with self.maker() as session:
+            result = await session.execute(
+                text(
+                    "SELECT tableoid::regclass::text FROM tokens WHERE token_id = :id"
+                ),
+                {"id": token.token_id},
+            )
+            return str(result.scalar_one())
+
+    async def test_new_tokens_land_in_range_partition(self):
+        await self.manager.maintain()
+        token = self._get_token(self.now + self.config.refresh_token_ttl)
+
+        await self.repository.add(token)
+
+        assert (await self._partition_of(token)).startswith("tokens_p")
+        assert await self.repository.get(token.value) == token
+
+    async def test_get_prunes_to_one_partition(self):
+        await self.manager.maintain()
+        token = self._get_token(self.now + self.config.refresh_token_ttl)
+        await self.repository.add(token)
+
+        async with self.maker() as session:
+            plan = await session.execute(
+                text(
+                    "EXPLAIN SELECT * FROM tokens "
+                    "WHERE token_id = :id AND expires_at = :expires_at"
+                ),
+                {"id": token.token_id, "expires_at": token.expires_at.value},
+            )
+            scanned = {
+                name
+                for line in plan.scalars()
+                for name in re.findall(r" on (tokens_\w+)", line)
+            }
+
+        assert scanned == {await self._partition_of(token)}
+
+    async def test_maintain_is_idempotent(self):
+        await self.manager.maintain()
+        partitions = await self.manager.list_partitions()
+
+        await self.manager.maintain()
+
+        assert await self.manager.list_partitions() == partitions
+
+    async def test_drops_expired_partitions(self):
+        past = self.now - timedelta(days=3)
+        await self.manager.create_partitions(past)
+        expired = self._get_token(past)
+        await self.repository.add(expired)
+
+        dropped = await self.manager.drop_expired_partitions(self.now)
+
+        assert dropped
+        assert "tokens_default" in await self.manager.list_partitions()
+        assert all(name not in dropped for name in await self.manager.list_partitions())
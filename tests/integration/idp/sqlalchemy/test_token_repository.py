@@ -2,10 +2,11 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
-from common.application.exceptions import NotFoundError
+from common.application.exceptions import NotFoundError, OptimisticLockError
 from common.domain.value_objects.datetime import DateTime
 from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
 from idp.auth.domain.entity.token import Token, TokenTypeEnum
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.database.postgres.sqlalchemy.mappers.token_mapper import (
     TokenMapper,
 )
@@ -15,7 +16,6 @@ from idp.auth.infrastructure.database.postgres.sqlalchemy.models.token_base impo
 from idp.auth.infrastructure.database.postgres.sqlalchemy.repositories.refresh_token_repository import (
     RefreshTokenRepository,
 )
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
@@ -28,6 +28,7 @@ class TestRefreshTokenRepository:
         query_executor: QueryExecutor,
     ):
         self.maker = maker
+        self.executor = query_executor
         self.token_repository = RefreshTokenRepository(query_executor)
 
     async def _add_token(self) -> Token:
@@ -37,30 +38,55 @@ class TestRefreshTokenRepository:
             await session.commit()
         return token
 
-    def _get_token(self) -> Token:
+    async def _add_legacy_token(self) -> Token:
+        token = self._get_token(value=f"legacy-{uuid4().hex}")
+        async with self.maker() as session:
+            session.add(TokenMapper.to_persistence(token))
+            await session.commit()
+        return token
+
+    async def _add_unkeyed_token(self) -> Token:
+        token = self._get_token()
+        token.value = RefreshTokenValue(token.token_id, str(uuid4())).value
+        async with self.maker() as session:
+            session.add(TokenMapper.to_persistence(token))
+            await session.commit()
+        return token
+
+    def _get_token(self, value: str | None = None) -> Token:
+        token_id = uuid4()
+        expires_at = DateTime(
+            datetime(2025, 7, 22, tzinfo=UTC) + timedelta(days=7, microseconds=1)
+        )
         return Token(
-            token_id=uuid4(),
+            token_id=token_id,
             identity_id=uuid4(),
-            value=str(uuid4()),
+            value=value or RefreshTokenValue(token_id, str(uuid4()), expires_at).value,
             token_type=TokenTypeEnum.REFRESH,
             issued_at=DateTime(datetime(2025, 7, 22, tzinfo=UTC)),
-            expires_at=DateTime(datetime(2025, 7, 22, tzinfo=UTC) + timedelta(days=7)),
+            expires_at=expires_at,
             revoked=False,
         )
 
-    async def _get(self, value: str) -> Token | None:
+    async def _get(self, token: Token) -> Token | None:
         async with self.maker() as session:
-            stmt = await session.execute(
-                select(TokenBase).where(TokenBase.value == value)
-            )
-            base = stmt.scalar_one_or_none()
-            return TokenMapper.to_domain(base) if base else None
+            base = await session.get(TokenBase, token.token_id)
+            return TokenMapper.to_domain(base, token.value) if base else None
+
+    async def _is_revoked(self, token: Token) -> bool:
+        stored = await self._get(token)
+        assert stored
+        return stored.revoked
+
+    async def _get_base(self, token: Token) -> TokenBase | None:
+        async with self.maker() as session:
+            return await session.get(TokenBase, token.token_id)
 
     async def test_add_success(self):
         new_token = self._get_token()
         await self.token_repository.add(new_token)
 
-        stored = await self._get(new_token.value)
+        stored = await self._get(new_token)
         assert stored == new_token
 
     async def test_get_success(self):
@@ -77,7 +103,204 @@ class TestRefreshTokenRepository:
         token = await self._add_token()
 
         await self.token_repository.revoke(token.value)
-        updated = await self._get(token.value)
+        updated = await self._get(token)
+
+        assert updated
+        assert updated.revoked is True
+
+    async def test_revoke_bumps_version(self):
+        token = await self._add_token()
+
+        await self.token_repository.revoke(token.value)
+        updated = await self._get(token)
+
+        assert updated
+        assert updated.version == token.version + 1
+
+    async def test_save_stale_version(self):
+        token = await self._add_token()
+        stale = await self.token_repository.get(token.value)
+        await self.token_repository.revoke(token.value)
 
+        stale.revoke()
+        with pytest.raises(OptimisticLockError):
+            await self.executor.save(TokenMapper.to_persistence(stale))
+
+    async def test_revoke_active_success(self):
+        token = await self._add_token()
+
+        result = await self.token_repository.revoke_active(token.value, token.issued_at)
+        updated = await self._get(token)
+
+        assert result == token.identity_id
         assert updated
         assert updated.revoked is True
+
+    async def test_revoke_active_only_once(self):
+        token = await self._add_token()
+
+        first = await self.token_repository.revoke_active(token.value, token.issued_at)
+        second = await self.token_repository.revoke_active(token.value, token.issued_at)
+
+        assert first == token.identity_id
+        assert second is None
+
+    async def test_revoke_active_expired(self):
+        token = await self._add_token()
+
+        result = await self.token_repository.revoke_active(
+            token.value, token.expires_at
+        )
+        updated = await self._get(token)
+
+        assert result is None
+        assert updated
+        assert updated.revoked is False
+
+    async def test_revoke_active_not_found(self):
+        result = await self.token_repository.revoke_active(
+            "absent_token", DateTime(datetime(2025, 7, 22, tzinfo=UTC))
+        )
+
+        assert result is None
+
+    async def test_add_stores_only_secret_hash(self):
+        new_token = self._get_token()
+        await self.token_repository.add(new_token)
+
+        base = await self._get_base(new_token)
+
+        assert base
+        assert base.value is None
+        assert base.secret_hash is not None
+        assert new_token.value.split(".", 1)[1].encode() not in base.secret_hash
+
+    async def test_get_wrong_expiry_not_found(self):
+        token = await self._add_token()
+        refresh_token = RefreshTokenValue.parse(token.value)
+        assert refresh_token
+        moved = RefreshTokenValue(
+            token.token_id,
+            refresh_token.secret,
+            DateTime(token.expires_at.value + timedelta(microseconds=1)),
+        )
+
+        with pytest.raises(NotFoundError):
+            await self.token_repository.get(moved.value)
+
+    async def test_get_unkeyed_token(self):
+        token = await self._add_unkeyed_token()
+
+        result = await self.token_repository.get(token.value)
+
+        assert result == token
+
+    async def test_revoke_active_unkeyed_token(self):
+        token = await self._add_unkeyed_token()
+
+        result = await self.token_repository.revoke_active(token.value, token.issued_at)
+
+        assert result == token.identity_id
+
+    async def test_get_wrong_secret_not_found(self):
+        token = await self._add_token()
+        forged = RefreshTokenValue(token.token_id, "forged-secret", token.expires_at)
+
+        with pytest.raises(NotFoundError):
+            await self.token_repository.get(forged.value)
+
+    async def test_revoke_active_wrong_secret(self):
+        token = await self._add_token()
+        forged = RefreshTokenValue(token.token_id, "forged-secret")
+
+        result = await self.token_repository.revoke_active(
+            forged.value, token.issued_at
+        )
+        updated = await self._get(token)
+
+        assert result is None
+        assert updated
+        assert updated.revoked is False
+
+    async def test_get_legacy_token(self):
+        token = await self._add_legacy_token()
+
+        result = await self.token_repository.get(token.value)
+
+        assert result == token
+
+    async def test_revoke_active_legacy_token(self):
+        token = await self._add_legacy_token()
+
+        result = await self.token_repository.revoke_active(token.value, token.issued_at)
+
+        assert result == token.identity_id
+
+    async def test_delete_stale(self):
+        active = await self._add_token()
+        expired = await self._add_token()
+        revoked = await self._add_token()
+        await self.token_repository.revoke(revoked.value)
+
+        deleted = await self.token_repository.delete_stale(active.issued_at, 100)
+        assert deleted == 1
+        assert await self._get(revoked) is None
+
+        deleted = await self.token_repository.delete_stale(expired.expires_at, 100)
+        assert deleted == 2  # noqa: PLR2004
+        assert await self._get(active) is None
+        assert await self._get(expired) is None
+
+    async def test_delete_stale_respects_limit(self):
+        for _ in range(3):
+            token = await self._add_token()
+            await self.token_repository.revoke(token.value)
+
+        assert await self.token_repository.delete_stale(token.issued_at, 2) == 2  # noqa: PLR2004
+        assert await self.token_repository.delete_stale(token.issued_at, 2) == 1
+
+    async def test_revoke_all(self):
+        token = await self._add_token()
+        other = self._get_token()
+        other.identity_id = token.identity_id
+        await self.token_repository.add(other)
+        foreign = await self._add_token()
+
+        revoked = await self.token_repository.revoke_all(
+            token.identity_id, token.issued_at
+        )
+
+        assert sorted(revoked) == sorted([token.token_id, other.token_id])
+        assert await self._is_revoked(token) is True
+        assert await self._is_revoked(other) is True
+        assert await self._is_revoked(foreign) is False
+
+    async def test_revoke_all_skips_revoked_and_expired(self):
+        token = await self._add_token()
+        await self.token_repository.revoke(token.value)
+
+        assert (
+            await self.token_repository.revoke_all(token.identity_id, token.issued_at)
+            == []
+        )
+
+    async def test_revoke_all_many(self):
+        first = await self._add_token()
+        second = await self._add_token()
+        foreign = await self._add_token()
+
+        revoked = await self.token_repository.revoke_all_many(
+            [first.identity_id, second.identity_id], first.issued_at
+        )
+
+        assert sorted(revoked) == sorted([first.token_id, second.token_id])
+        assert await self._is_revoked(first) is True
+        assert await self._is_revoked(foreign) is False
+
+    async def test_revoke_all_many_empty(self):
+        assert (
+            await self.token_repository.revoke_all_many(
+                [], DateTime(datetime(2025, 7, 22, tzinfo=UTC))
+            )
+            == []
+        )
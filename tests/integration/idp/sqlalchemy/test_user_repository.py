@@ -59,6 +59,27 @@ class TestIdentityRepository:
         with pytest.raises(IdentityNotFoundError):
             await self.identity_repository.get_by_id(uuid4())
 
+    async def test_get_many_by_ids_skips_missing(self):
+        identities = [
+            Identity(uuid4(), Username(f"identity {i}"), Password("hash"))
+            for i in range(3)
+        ]
+        async with self.maker() as session:
+            session.add_all(IdentityMapper.to_persistence(i) for i in identities)
+            await session.commit()
+
+        result = await self.identity_repository.get_many_by_ids(
+            [identities[0].identity_id, uuid4(), identities[2].identity_id]
+        )
+
+        assert sorted(result, key=lambda i: i.username.value) == [
+            identities[0],
+            identities[2],
+        ]
+
+    async def test_get_many_by_ids_empty(self):
+        assert await self.identity_repository.get_many_by_ids([]) == []
+
     async def test_exists_by_username_true(self):
         identity = await self._add_user()
         assert await self.identity_repository.exists_by_username(
@@ -79,6 +100,20 @@ class TestIdentityRepository:
         with pytest.raises(IdentityNotFoundError):
             await self.identity_repository.get_by_username("nonexistent")
 
+    async def test_get_credentials_by_username_success(self):
+        identity = await self._add_user()
+
+        result = await self.identity_repository.get_credentials_by_username(
+            identity.username.value
+        )
+
+        assert result.identity_id == identity.identity_id
+        assert result.password_hash == identity.password.value
+
+    async def test_get_credentials_by_username_nonexistent_fails(self):
+        with pytest.raises(IdentityNotFoundError):
+            await self.identity_repository.get_credentials_by_username("nonexistent")
+
     async def test_add_success(self):
         identity = self._get_user()
 
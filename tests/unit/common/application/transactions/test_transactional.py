@@ -0,0 +1,42 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.application.transactions.transactional import transactional
+
+
+class Service:
+    def __init__(self, uow: IUnitOfWork) -> None:
+        self.uow = uow
+
+    @transactional(retries=5, backoff=0.5)
+    async def handle(self, value: int, *, offset: int = 0) -> int:
+        return value + offset
+
+
+@pytest.mark.asyncio
+class TestTransactional:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.uow = AsyncMock(spec=IUnitOfWork)
+        self.uow.run.side_effect = self._run
+        self.service = Service(self.uow)
+
+    async def _run(self, func: Callable[[], Awaitable[Any]], *args: Any) -> Any:
+        return await func()
+
+    async def test_runs_method_in_unit_of_work(self) -> None:
+        assert await self.service.handle(1, offset=2) == 3  # noqa: PLR2004
+
+        self.uow.run.assert_awaited_once()
+
+    async def test_passes_retry_policy(self) -> None:
+        await self.service.handle(1)
+
+        _, retries, backoff = self.uow.run.await_args.args
+        assert (retries, backoff) == (5, 0.5)
+
+    async def test_keeps_method_metadata(self) -> None:
+        assert Service.handle.__name__ == "handle"
@@ -0,0 +1,56 @@
+from uuid import uuid4
+
+import pytest
+from common.infrastructure.cache.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    def test_added_items_are_members(self) -> None:
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [uuid4().bytes for _ in range(1000)]
+
+        bloom.update(items)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == len(items)
+
+    def test_empty_filter_has_no_members(self) -> None:
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+
+        assert uuid4().bytes not in bloom
+
+    def test_false_positive_rate_is_bounded(self) -> None:
+        error_rate = 0.01
+        bloom = BloomFilter(capacity=2000, error_rate=error_rate)
+        bloom.update(uuid4().bytes for _ in range(2000))
+
+        probes = 20_000
+        false_positives = sum(uuid4().bytes in bloom for _ in range(probes))
+
+        assert false_positives / probes < error_rate * 3
+
+    def test_saturation(self) -> None:
+        bloom = BloomFilter(capacity=2, error_rate=0.01)
+
+        bloom.add(b"a")
+        assert not bloom.is_saturated()
+        bloom.add(b"b")
+        assert bloom.is_saturated()
+
+    def test_metrics(self) -> None:
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+        bloom.add(b"item")
+
+        metrics = bloom.get_metrics()
+
+        assert metrics.size == 1
+        assert metrics.capacity == 100  # noqa: PLR2004
+        assert metrics.bits == bloom.bits
+        assert 0 < metrics.fill_ratio <= metrics.hashes / metrics.bits
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"), [(0, 0.01), (10, 0), (10, 1), (-1, 0.5)]
+    )
+    def test_rejects_invalid_parameters(self, capacity: int, error_rate: float) -> None:
+        with pytest.raises(ValueError, match="must be"):
+            BloomFilter(capacity, error_rate)
@@ -0,0 +1,68 @@
+import pytest
+from common.infrastructure.cache.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = 1000.0
+        self.cache: TTLCache[str, int] = TTLCache(max_size=2, timer=lambda: self.now)
+
+    def test_get_returns_value_before_deadline(self):
+        self.cache.set("a", 1, expires_at=self.now + 10)
+
+        assert self.cache.get("a") == 1
+
+    def test_get_expired_entry_returns_none(self):
+        self.cache.set("a", 1, expires_at=self.now + 10)
+        self.now += 10
+
+        assert self.cache.get("a") is None
+        assert len(self.cache) == 0
+
+    def test_set_already_expired_is_ignored(self):
+        self.cache.set("a", 1, expires_at=self.now)
+
+        assert len(self.cache) == 0
+
+    def test_set_for_uses_relative_ttl(self):
+        self.cache.set_for("a", 1, ttl=5)
+        self.now += 4
+
+        assert self.cache.get("a") == 1
+
+        self.now += 1
+
+        assert self.cache.get("a") is None
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.set("a", 1, expires_at=self.now + 10)
+        self.cache.set("b", 2, expires_at=self.now + 10)
+        self.cache.get("a")
+
+        self.cache.set("c", 3, expires_at=self.now + 10)
+
+        assert self.cache.get("a") == 1
+        assert self.cache.get("b") is None
+        assert self.cache.get("c") == 3  # noqa: PLR2004
+
+    def test_zero_size_stores_nothing(self):
+        cache: TTLCache[str, int] = TTLCache(max_size=0)
+
+        cache.set_for("a", 1, ttl=10)
+
+        assert cache.get("a") is None
+
+    def test_metrics(self):
+        self.cache.set("a", 1, expires_at=self.now + 10)
+        self.cache.set("b", 2, expires_at=self.now + 10)
+        self.cache.set("c", 3, expires_at=self.now + 10)
+        self.cache.get("c")
+        self.cache.get("a")
+
+        metrics = self.cache.get_metrics()
+
+        assert metrics.hits == 1
+        assert metrics.misses == 1
+        assert metrics.evictions == 1
+        assert metrics.size == self.cache.max_size
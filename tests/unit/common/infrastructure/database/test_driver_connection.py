@@ -0,0 +1,84 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from common.infrastructure.database.sqlalchemy.driver_executor import (
+    AsyncpgExecutor,
+    get_driver_connection,
+)
+from common.infrastructure.database.sqlalchemy.unit_of_work import UnitOfWork
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+@pytest.mark.asyncio
+class TestGetDriverConnection:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.driver = Mock()
+        self.driver.is_in_transaction.return_value = False
+        self.connection = AsyncMock(spec=AsyncConnection)
+        self.connection.get_raw_connection.return_value = Mock(
+            driver_connection=self.driver
+        )
+
+    async def test_starts_transaction(self):
+        assert await get_driver_connection(self.connection) is self.driver
+
+        self.connection.exec_driver_sql.assert_awaited_once_with("SELECT 1")
+
+    async def test_joins_started_transaction(self):
+        self.driver.is_in_transaction.return_value = True
+
+        assert await get_driver_connection(self.connection) is self.driver
+
+        self.connection.exec_driver_sql.assert_not_awaited()
+
+    async def test_without_begin(self):
+        assert await get_driver_connection(self.connection, begin=False) is self.driver
+
+        self.connection.exec_driver_sql.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestAsyncpgExecutor:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.driver = Mock()
+        self.driver.is_in_transaction.return_value = False
+        self.driver.fetchval = AsyncMock(return_value="driver")
+        self.connection = AsyncMock(spec=AsyncConnection)
+        self.connection.get_raw_connection.return_value = Mock(
+            driver_connection=self.driver
+        )
+        self.connection.exec_driver_sql.return_value = Mock(
+            scalar=Mock(return_value="sqlalchemy")
+        )
+        session = AsyncMock(spec=AsyncSession)
+        session.connection.return_value = self.connection
+
+        @asynccontextmanager
+        async def get_session(read_only: bool = False) -> AsyncIterator[AsyncSession]:
+            yield session
+
+        self.uow = Mock(spec=UnitOfWork)
+        self.uow.get_session.side_effect = get_session
+        self.executor = AsyncpgExecutor(self.uow)
+
+    async def test_first_statement_begins_through_sqlalchemy(self):
+        assert await self.executor.fetchval("SELECT $1", 1) == "sqlalchemy"
+
+        self.connection.exec_driver_sql.assert_awaited_once_with("SELECT $1", (1,))
+        self.driver.fetchval.assert_not_awaited()
+
+    async def test_begun_transaction_uses_driver(self):
+        self.driver.is_in_transaction.return_value = True
+
+        assert await self.executor.fetchval("SELECT $1", 1) == "driver"
+
+        self.connection.exec_driver_sql.assert_not_awaited()
+
+    async def test_read_only_uses_driver(self):
+        assert await self.executor.fetchval("SELECT $1", 1, read_only=True) == "driver"
+
+        self.connection.exec_driver_sql.assert_not_awaited()
@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from common.infrastructure.database.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMonitor,
+)
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestPoolMonitor:
+    @pytest.fixture(autouse=True)
+    def setup(self, engine: AsyncEngine):
+        self.engine = engine
+        self.monitor = PoolMonitor(engine)
+
+    async def test_counts_checkouts(self):
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            metrics = self.monitor.get_metrics()
+            assert metrics.checked_out == 1
+
+        metrics = self.monitor.get_metrics()
+        assert metrics.size == 1
+        assert metrics.checked_out == 0
+        assert metrics.overflow == 0
+        assert metrics.connects == 1
+        assert metrics.checkouts == 1
+        assert metrics.checkins == 1
+
+    async def test_tracks_waiters(self):
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with self.engine.connect():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0.01)
+
+        async def wait() -> None:
+            async with self.engine.connect():
+                pass
+
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0.01)
+        assert self.monitor.get_metrics().waiters == 1
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+
+        metrics = self.monitor.get_metrics()
+        assert metrics.waiters == 0
+        assert metrics.checkouts == 2  # noqa: PLR2004
+        assert metrics.checkout_wait_max > 0
+
+    async def test_free_checkout_is_not_a_waiter(self):
+        pool = self.engine.sync_engine.pool
+        assert isinstance(pool, InstrumentedAsyncAdaptedQueuePool)
+        seen: list[int] = []
+
+        # NOTE: "checkout" fires while the checkout is still in progress
+        @event.listens_for(self.engine.sync_engine, "checkout")
+        def record_waiters(*args: Any) -> None:
+            seen.append(pool.waiters)
+
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert seen == [0]
+
+    async def test_counts_timeouts(self):
+        async with self.engine.connect():
+            with pytest.raises(exc.TimeoutError, match="QueuePool limit"):
+                async with self.engine.connect():
+                    pass
+
+        metrics = self.monitor.get_metrics()
+        assert metrics.timeouts == 1
+        assert metrics.checkout_wait_total >= 0.05  # noqa: PLR2004
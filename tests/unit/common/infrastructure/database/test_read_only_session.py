@@ -0,0 +1,67 @@
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from common.application.exceptions import RepositoryError
+from common.infrastructure.database.sqlalchemy.session_factory import ReadOnlySession
+from sqlalchemy import MetaData, Table, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Model(DeclarativeBase):
+    metadata = MetaData()
+
+
+class Item(Model):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+ITEMS: Table = Item.__table__  # type: ignore[assignment]
+
+
+@pytest_asyncio.fixture
+async def maker(
+    tmp_path: Path,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], Any]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Model.metadata.create_all)
+        await conn.execute(insert(ITEMS).values(id=1))
+    yield async_sessionmaker(engine, sync_session_class=ReadOnlySession)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestReadOnlySession:
+    @pytest.fixture(autouse=True)
+    def setup(self, maker: async_sessionmaker[AsyncSession]):
+        self.maker = maker
+
+    async def test_select_is_allowed(self):
+        async with self.maker() as session:
+            assert (await session.execute(select(ITEMS.c.id))).scalars().all() == [1]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            insert(ITEMS).values(id=2),
+            update(ITEMS).values(id=2),
+            delete(ITEMS),
+        ],
+    )
+    async def test_dml_is_rejected(self, statement: Any):
+        async with self.maker() as session:
+            with pytest.raises(RepositoryError):
+                await session.execute(statement)
+
+    async def test_flush_is_rejected(self):
+        async with self.maker() as session:
+            session.add(Item(id=2))
+
+            with pytest.raises(RepositoryError):
+                await session.flush()
@@ -0,0 +1,102 @@
+import logging
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from common.infrastructure.database.sqlalchemy.replicas import Replica, ReplicaSet
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+
+def replica(name: str, url: str) -> Replica:
+    engine = create_async_engine(url)
+    return Replica(name, engine, async_sessionmaker(engine))
+
+
+@pytest_asyncio.fixture
+async def replicas(tmp_path: Path) -> AsyncGenerator[list[Replica], Any]:
+    items = [
+        replica("first", f"sqlite+aiosqlite:///{tmp_path / 'first.db'}"),
+        replica("second", f"sqlite+aiosqlite:///{tmp_path / 'second.db'}"),
+    ]
+    yield items
+    for item in items:
+        await item.engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestReplicaSet:
+    @pytest.fixture(autouse=True)
+    def setup(self, replicas: list[Replica]):
+        self.first, self.second = replicas
+        self.replica_set = ReplicaSet(replicas, logging.getLogger())
+
+    async def test_next_is_round_robin(self):
+        assert self.replica_set.next() is self.first
+        assert self.replica_set.next() is self.second
+        assert self.replica_set.next() is self.first
+
+    async def test_next_skips_ejected(self):
+        self.replica_set.eject(self.first)
+
+        assert self.replica_set.next() is self.second
+        assert self.replica_set.next() is self.second
+
+    async def test_next_without_healthy_replicas(self):
+        self.replica_set.eject(self.first)
+        self.replica_set.eject(self.second)
+
+        assert self.replica_set.next() is None
+        assert self.replica_set.get_metrics().unavailable == 1
+
+    async def test_check_readmits_healthy(self):
+        self.replica_set.eject(self.first)
+
+        await self.replica_set.check()
+
+        assert self.first.healthy
+
+    async def test_check_ejects_unreachable(self, tmp_path: Path):
+        broken = replica("broken", f"sqlite+aiosqlite:///{tmp_path / 'missing/x.db'}")
+        replica_set = ReplicaSet([self.first, broken], logging.getLogger())
+
+        await replica_set.check()
+
+        assert self.first.healthy
+        assert not broken.healthy
+        metrics = replica_set.get_metrics()
+        assert metrics.healthy == 1
+        assert metrics.ejections == 1
+        await broken.engine.dispose()
+
+    async def test_connection_failure_ejects(self, tmp_path: Path):
+        broken = replica("broken", f"sqlite+aiosqlite:///{tmp_path / 'missing/x.db'}")
+        replica_set = ReplicaSet([self.first, broken], logging.getLogger())
+
+        with pytest.raises(OperationalError):
+            async with broken.maker() as session:
+                await session.execute(text("SELECT 1"))
+
+        assert not broken.healthy
+        assert replica_set.get_metrics().ejections == 1
+        await broken.engine.dispose()
+
+    async def test_statement_error_does_not_eject(self):
+        with pytest.raises(OperationalError):
+            async with self.first.maker() as session:
+                await session.execute(text("SELECT * FROM missing"))
+
+        assert self.first.healthy
+
+    async def test_metrics(self):
+        self.replica_set.next()
+        self.replica_set.eject(self.second)
+        self.replica_set.eject(self.second)
+
+        metrics = self.replica_set.get_metrics()
+        assert metrics.replicas == 2  # noqa: PLR2004
+        assert metrics.routed == 1
+        assert metrics.ejections == 1
@@ -0,0 +1,107 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+from common.infrastructure.loaders.data_loader import DataLoader, DataLoaderMetrics
+
+
+REQUEST: ContextVar[str | None] = ContextVar("REQUEST", default=None)
+
+
+@pytest.mark.asyncio
+class TestDataLoader:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.batches: list[list[int]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.loader: DataLoader[int, str] = DataLoader(
+            self._load_many, key=int, max_batch_size=3
+        )
+
+    async def _load_many(self, keys: list[int]) -> list[str]:
+        self.batches.append(keys)
+        await self.release.wait()
+        return [str(key) for key in keys if key >= 0]
+
+    async def test_same_tick_keys_share_one_batch(self):
+        result = await asyncio.gather(self.loader.load(1), self.loader.load(2))
+
+        assert list(result) == ["1", "2"]
+        assert self.batches == [[1, 2]]
+
+    async def test_batch_runs_in_callers_context(self):
+        seen: list[str | None] = []
+
+        async def load_many(keys: list[int]) -> list[str]:
+            seen.append(REQUEST.get())
+            return [str(key) for key in keys]
+
+        loader: DataLoader[int, str] = DataLoader(load_many, key=int)
+        REQUEST.set("request")
+
+        assert await loader.load(1) == "1"
+        assert seen == ["request"]
+
+    async def test_duplicate_keys_are_coalesced(self):
+        result = await asyncio.gather(*(self.loader.load(1) for _ in range(3)))
+
+        assert result == ["1", "1", "1"]
+        assert self.batches == [[1]]
+        assert self.loader.get_metrics() == DataLoaderMetrics(
+            loads=3, coalesced=2, batches=1, keys=1
+        )
+
+    async def test_in_flight_key_is_joined(self):
+        self.release.clear()
+        first = asyncio.create_task(self.loader.load(1))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        second = asyncio.create_task(self.loader.load(1))
+        await asyncio.sleep(0)
+        self.release.set()
+
+        assert list(await asyncio.gather(first, second)) == ["1", "1"]
+        assert self.batches == [[1]]
+
+    async def test_missing_key_loads_none(self):
+        assert await self.loader.load(-1) is None
+
+    async def test_batches_are_capped(self):
+        result = await asyncio.gather(*(self.loader.load(i) for i in range(5)))
+
+        assert result == ["0", "1", "2", "3", "4"]
+        assert self.batches == [[0, 1, 2], [3, 4]]
+
+    async def test_completed_keys_are_loaded_again(self):
+        await self.loader.load(1)
+        await self.loader.load(1)
+
+        assert self.batches == [[1], [1]]
+
+    async def test_failure_reaches_every_caller(self):
+        async def fail(keys: list[int]) -> list[str]:
+            raise RuntimeError("boom")
+
+        loader: DataLoader[int, str] = DataLoader(fail, key=int)
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+
+        loader.load_many = self._load_many
+
+        assert await loader.load(1) == "1"
+
+    async def test_cancelled_caller_does_not_cancel_batch(self):
+        self.release.clear()
+        first = asyncio.create_task(self.loader.load(1))
+        second = asyncio.create_task(self.loader.load(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.release.set()
+
+        assert await second == "1"
+        assert first.cancelled()
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from common.infrastructure.tasks.periodic_task import PeriodicTask
+
+
+INTERVAL = 0.001
+
+
+@pytest.mark.asyncio
+class TestPeriodicTask:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.func = AsyncMock()
+        self.logger = Mock(spec=logging.Logger)
+        self.task = PeriodicTask("test", self.func, INTERVAL, self.logger)
+
+    async def wait_for_calls(self, count: int) -> None:
+        async with asyncio.timeout(1):
+            while self.func.await_count < count:
+                await asyncio.sleep(INTERVAL)
+
+    async def test_runs_periodically(self):
+        await self.task.start()
+        await self.wait_for_calls(3)
+        await self.task.stop()
+
+        assert not self.task.is_running()
+
+    async def test_stop_halts_runs(self):
+        await self.task.start()
+        await self.wait_for_calls(1)
+        await self.task.stop()
+        calls = self.func.await_count
+
+        await asyncio.sleep(INTERVAL * 10)
+
+        assert self.func.await_count == calls
+
+    async def test_failure_is_logged_and_retried(self):
+        self.func.side_effect = [RuntimeError("boom"), None]
+
+        await self.task.start()
+        await self.wait_for_calls(2)
+        await self.task.stop()
+
+        self.logger.exception.assert_called_once()
+
+    async def test_start_is_idempotent(self):
+        await self.task.start()
+        task = self.task._task  # noqa: SLF001
+        await self.task.start()
+
+        assert self.task._task is task  # noqa: SLF001
+        await self.task.stop()
+
+    async def test_stop_without_start(self):
+        await self.task.stop()
+
+        assert not self.task.is_running()
+
+    async def test_rejects_non_positive_interval(self):
+        with pytest.raises(ValueError, match="Interval"):
+            PeriodicTask("test", self.func, 0, self.logger)
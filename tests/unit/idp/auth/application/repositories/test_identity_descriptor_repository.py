@@ -1,10 +1,13 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 import pytest
+from common.application.interfaces.loaders.data_loader import IDataLoader
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from idp.auth.application.repositories.descriptor_repository import (
     IdentityDescriptorRepository,
 )
+from idp.identity.application.exceptions import IdentityNotFoundError
 from idp.identity.application.interfaces.repositories.identity_repository import (
     IIdentityRepository,
 )
@@ -33,3 +36,63 @@ class TestIdentityDescriptorRepository:
             identity_id=self.identity.identity_id, username=self.identity.username.value
         )
         self.identity_repository.get_by_id.assert_awaited_once_with(self.identity_id)
+
+    async def test_get_by_id_reads_in_read_only_transaction(self):
+        # Arrange
+        uow = Mock(spec=IUnitOfWork)
+        transaction = MagicMock()
+        uow.read_only.return_value = transaction
+        repository = IdentityDescriptorRepository(self.identity_repository, uow)
+
+        # Act
+        await repository.get_by_id(self.identity_id)
+
+        # Assert
+        uow.read_only.assert_called_once_with()
+        transaction.__aenter__.assert_awaited_once()
+        transaction.__aexit__.assert_awaited_once()
+
+    async def test_get_by_id_uses_loader(self):
+        # Arrange
+        uow = Mock(spec=IUnitOfWork)
+        uow.is_bound.return_value = False
+        loader = Mock(spec=IDataLoader)
+        loader.load = AsyncMock(return_value=self.identity)
+        repository = IdentityDescriptorRepository(self.identity_repository, uow, loader)
+
+        # Act
+        result = await repository.get_by_id(self.identity_id)
+
+        # Assert
+        assert result.identity_id == self.identity.identity_id
+        loader.load.assert_awaited_once_with(self.identity_id)
+        self.identity_repository.get_by_id.assert_not_called()
+        uow.read_only.assert_not_called()
+
+    async def test_get_by_id_loader_miss_fails(self):
+        # Arrange
+        loader = Mock(spec=IDataLoader)
+        loader.load = AsyncMock(return_value=None)
+        repository = IdentityDescriptorRepository(
+            self.identity_repository, loader=loader
+        )
+
+        # Act & Assert
+        with pytest.raises(IdentityNotFoundError):
+            await repository.get_by_id(self.identity_id)
+
+    async def test_get_by_id_bound_uow_bypasses_loader(self):
+        # Arrange
+        uow = Mock(spec=IUnitOfWork)
+        uow.is_bound.return_value = True
+        uow.read_only.return_value = MagicMock()
+        loader = Mock(spec=IDataLoader)
+        repository = IdentityDescriptorRepository(self.identity_repository, uow, loader)
+
+        # Act
+        await repository.get_by_id(self.identity_id)
+
+        # Assert
+        loader.load.assert_not_called()
+        uow.read_only.assert_called_once_with()
+        self.identity_repository.get_by_id.assert_awaited_once_with(self.identity_id)
@@ -0,0 +1,57 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from common.domain.value_objects.datetime import DateTime
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
+
+
+class TestRefreshTokenValue:
+    def test_value_round_trip(self) -> None:
+        token = RefreshTokenValue(uuid4(), "secret")
+
+        assert RefreshTokenValue.parse(token.value) == token
+
+    def test_value_format(self) -> None:
+        token_id = uuid4()
+
+        token = RefreshTokenValue(token_id, "secret")
+
+        assert token.value == f"{token_id.hex}.secret"
+
+    def test_value_with_expiry_round_trip(self) -> None:
+        expires_at = DateTime(datetime(2025, 7, 29, 12, 30, 1, 123456, tzinfo=UTC))
+        token = RefreshTokenValue(uuid4(), "secret", expires_at)
+
+        parsed = RefreshTokenValue.parse(token.value)
+
+        assert parsed == token
+        assert parsed.expires_at.value == expires_at.value  # type: ignore[union-attr]
+
+    def test_value_with_expiry_format(self) -> None:
+        token_id = uuid4()
+        expires_at = DateTime(datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC))
+
+        token = RefreshTokenValue(token_id, "secret", expires_at)
+
+        assert token.value == f"{token_id.hex}-f4240.secret"
+
+    def test_secret_may_contain_separator(self) -> None:
+        token = RefreshTokenValue(uuid4(), "sec.ret")
+
+        assert RefreshTokenValue.parse(token.value) == token
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "legacy-plaintext-token_without-separator",
+            "not-a-uuid.secret",
+            f"{uuid4().hex}.",
+            f"{uuid4().hex}-.secret",
+            f"{uuid4().hex}-not-hex.secret",
+            f"{uuid4().hex}-{'f' * 40}.secret",
+            "",
+        ],
+    )
+    def test_parse_rejects_other_values(self, value: str) -> None:
+        assert RefreshTokenValue.parse(value) is None
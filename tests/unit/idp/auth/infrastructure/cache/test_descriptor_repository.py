@@ -0,0 +1,114 @@
+import asyncio
+from contextvars import ContextVar
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from common.application.exceptions import NotFoundError
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.cache.descriptor_repository import (
+    CachedIdentityDescriptorRepository,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+
+
+TRANSACTION: ContextVar[str | None] = ContextVar("TRANSACTION", default=None)
+
+
+@pytest.mark.asyncio
+class TestCachedIdentityDescriptorRepository:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.identity_id = uuid4()
+        self.descriptor = IdentityDescriptor(self.identity_id, "username")
+
+        self.inner = Mock(spec=IIdentityDescriptorRepository)
+        self.inner.get_by_id = AsyncMock(return_value=self.descriptor)
+
+        self.config = AuthConfig(secret_key="secret", issuer="issuer")
+        self.repository = CachedIdentityDescriptorRepository(self.inner, self.config)
+
+    async def test_get_by_id_is_cached(self):
+        first = await self.repository.get_by_id(self.identity_id)
+        second = await self.repository.get_by_id(self.identity_id)
+
+        assert first == second == self.descriptor
+        self.inner.get_by_id.assert_awaited_once_with(self.identity_id)
+
+    async def test_load_runs_outside_callers_context(self):
+        seen: list[str | None] = []
+
+        async def get_by_id(identity_id):
+            seen.append(TRANSACTION.get())
+            return self.descriptor
+
+        self.inner.get_by_id.side_effect = get_by_id
+        TRANSACTION.set("caller")
+
+        assert await self.repository.get_by_id(self.identity_id) == self.descriptor
+        assert seen == [None]
+
+    async def test_concurrent_misses_share_one_load(self):
+        release = asyncio.Event()
+
+        async def get_by_id(identity_id):
+            await release.wait()
+            return self.descriptor
+
+        self.inner.get_by_id.side_effect = get_by_id
+
+        pending = [
+            asyncio.create_task(self.repository.get_by_id(self.identity_id))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert all(result == self.descriptor for result in results)
+        self.inner.get_by_id.assert_awaited_once()
+        metrics = self.repository.get_metrics()
+        assert metrics.loads == 1
+        assert metrics.coalesced == len(pending) - 1
+
+    async def test_cancelled_leader_does_not_fail_waiters(self):
+        release = asyncio.Event()
+
+        async def get_by_id(identity_id):
+            await release.wait()
+            return self.descriptor
+
+        self.inner.get_by_id.side_effect = get_by_id
+
+        leader = asyncio.create_task(self.repository.get_by_id(self.identity_id))
+        waiter = asyncio.create_task(self.repository.get_by_id(self.identity_id))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await waiter == self.descriptor
+        assert leader.cancelled()
+        assert self.repository.get_metrics().cache.size == 1
+
+    async def test_errors_are_shared_and_not_cached(self):
+        release = asyncio.Event()
+
+        async def get_by_id(identity_id):
+            await release.wait()
+            raise NotFoundError(identity_id)
+
+        self.inner.get_by_id.side_effect = get_by_id
+
+        pending = [
+            asyncio.create_task(self.repository.get_by_id(self.identity_id))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+
+        assert all(isinstance(result, NotFoundError) for result in results)
+        assert self.repository.get_metrics().cache.size == 0
@@ -0,0 +1,135 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from idp.auth.application.dtos.models.revoked_access_token import (
+    RevokedAccessToken,
+)
+from idp.auth.application.interfaces.repositories.access_token_revocation_repository import (
+    IAccessTokenRevocationRepository,
+)
+from idp.auth.infrastructure.cache.revocation_list import BloomFilterRevocationList
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+
+
+@pytest.mark.asyncio
+class TestBloomFilterRevocationList:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = DateTime(datetime(2025, 7, 22, tzinfo=UTC))
+        self.clock = Mock(spec=IClock)
+        self.clock.now.return_value = self.now
+        self.config = AuthConfig(
+            secret_key="secret",
+            issuer="test",
+            access_token_ttl=timedelta(minutes=15),
+            revocation_filter_capacity=100,
+            revocation_rebuild_interval=timedelta(minutes=10),
+        )
+
+        self.repository = Mock(spec=IAccessTokenRevocationRepository)
+        self.repository.get_active.return_value = []
+        self.repository.exists.return_value = True
+
+        self.revocations = BloomFilterRevocationList(
+            self.clock, self.repository, self.config
+        )
+
+    async def test_unrevoked_jti_skips_repository(self):
+        assert await self.revocations.is_revoked(uuid4()) is False
+
+        self.repository.exists.assert_not_awaited()
+
+    async def test_revoke_persists_and_is_visible_locally(self):
+        jti = uuid4()
+
+        await self.revocations.revoke([jti])
+
+        self.repository.add_many.assert_awaited_once_with(
+            [jti], self.now + self.config.access_token_ttl
+        )
+        assert await self.revocations.is_revoked(jti) is True
+        self.repository.exists.assert_awaited_once_with(jti, self.now)
+
+    async def test_filter_hit_is_confirmed_with_repository(self):
+        jti = uuid4()
+        await self.revocations.revoke([jti])
+        self.repository.exists.return_value = False  # NOTE: e.g. already expired
+
+        assert await self.revocations.is_revoked(jti) is False
+
+        metrics = self.revocations.get_metrics()
+        assert metrics.filter_hits == 1
+        assert metrics.confirmed == 0
+
+    async def test_revoke_nothing(self):
+        await self.revocations.revoke([])
+
+        self.repository.add_many.assert_not_awaited()
+
+    async def test_rebuild_loads_active_revocations(self):
+        jti = uuid4()
+        self.repository.get_active.return_value = [RevokedAccessToken(jti, self.now)]
+
+        await self.revocations.rebuild()
+
+        self.repository.get_active.assert_awaited_once_with(self.now)
+        assert await self.revocations.is_revoked(jti) is True
+
+    async def test_first_refresh_rebuilds(self):
+        await self.revocations.refresh()
+
+        assert self.revocations.get_metrics().rebuilds == 1
+
+    async def test_refresh_is_incremental(self):
+        await self.revocations.rebuild()
+        jti = uuid4()
+        revoked_at = self.now + timedelta(seconds=1)
+        self.repository.get_active.return_value = [RevokedAccessToken(jti, revoked_at)]
+
+        await self.revocations.refresh()
+        await self.revocations.refresh()
+
+        calls = self.repository.get_active.await_args_list
+        assert calls[1].args == (
+            self.now,
+            self.now - BloomFilterRevocationList.REFRESH_OVERLAP,
+        )
+        assert calls[2].args == (
+            self.now,
+            revoked_at - BloomFilterRevocationList.REFRESH_OVERLAP,
+        )
+        assert await self.revocations.is_revoked(jti) is True
+
+        metrics = self.revocations.get_metrics()
+        assert metrics.refreshes == 2  # noqa: PLR2004
+        assert metrics.filter.size == 1
+
+    async def test_refresh_rebuilds_after_interval(self):
+        await self.revocations.rebuild()
+        self.clock.now.return_value = self.now + self.config.revocation_rebuild_interval
+
+        await self.revocations.refresh()
+
+        assert self.revocations.get_metrics().rebuilds == 2  # noqa: PLR2004
+
+    async def test_rebuild_drops_expired_entries(self):
+        jti = uuid4()
+        await self.revocations.revoke([jti])
+
+        await self.revocations.rebuild()
+
+        assert await self.revocations.is_revoked(jti) is False
+        self.repository.exists.assert_not_awaited()
+
+    async def test_rebuild_grows_past_capacity(self):
+        self.repository.get_active.return_value = [
+            RevokedAccessToken(uuid4(), self.now) for _ in range(150)
+        ]
+
+        await self.revocations.rebuild()
+
+        assert self.revocations.get_metrics().filter.capacity == 300  # noqa: PLR2004
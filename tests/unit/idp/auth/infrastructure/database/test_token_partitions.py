@@ -0,0 +1,180 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from common.infrastructure.database.sqlalchemy.executor import QueryExecutor
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.database.postgres.sqlalchemy.partitions.token_partitions import (
+    LOCK,
+    TokenPartition,
+    TokenPartitionManager,
+)
+
+
+DAY = timedelta(days=1)
+
+
+class TestTokenPartition:
+    def test_containing_aligns_to_period(self) -> None:
+        moment = datetime(2025, 7, 22, 13, 45, tzinfo=UTC)
+
+        partition = TokenPartition.containing(moment, DAY)
+
+        assert partition.start == datetime(2025, 7, 22, tzinfo=UTC)
+        assert partition.end == datetime(2025, 7, 23, tzinfo=UTC)
+
+    def test_containing_includes_lower_bound(self) -> None:
+        moment = datetime(2025, 7, 22, tzinfo=UTC)
+
+        assert TokenPartition.containing(moment, DAY).start == moment
+
+    def test_name_round_trip(self) -> None:
+        partition = TokenPartition.containing(datetime(2025, 7, 22, tzinfo=UTC), DAY)
+
+        assert partition.name == "tokens_p202507220000_202507230000"
+        assert TokenPartition.from_name(partition.name) == partition
+
+    @pytest.mark.parametrize(
+        "name", ["tokens_default", "tokens_p2025_x", "tokens_pfoo_bar"]
+    )
+    def test_from_name_ignores_foreign_tables(self, name: str) -> None:
+        assert TokenPartition.from_name(name) is None
+
+    def test_next(self) -> None:
+        partition = TokenPartition.containing(datetime(2025, 7, 22, tzinfo=UTC), DAY)
+
+        assert partition.next().start == partition.end
+        assert partition.next().end == partition.end + DAY
+
+
+@pytest.mark.asyncio
+class TestTokenPartitionManager:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.now = datetime(2025, 7, 22, 12, tzinfo=UTC)
+        self.clock = Mock(spec=IClock)
+        self.clock.now.return_value = DateTime(self.now)
+        self.config = AuthConfig(
+            secret_key="secret",
+            issuer="test",
+            refresh_token_ttl=timedelta(days=2),
+            token_partition_period=DAY,
+            token_partition_premake=DAY,
+        )
+
+        self.partitions: list[str] = []
+        self.statements: list[str] = []
+        self.executor = Mock(spec=QueryExecutor)
+        self.executor.execute.side_effect = self.execute
+        self.uow = AsyncMock(spec=IUnitOfWork)
+
+        self.manager = TokenPartitionManager(
+            self.clock, self.uow, self.executor, self.config
+        )
+
+    async def execute(self, statement: object) -> Mock:
+        self.statements.append(str(statement))
+        result = Mock()
+        result.scalars.return_value.all.return_value = list(self.partitions)
+        return result
+
+    def ddl(self) -> list[str]:
+        return [s for s in self.statements if not s.startswith("SELECT")]
+
+    async def test_dropped_concurrently_is_skipped(self):
+        self.partitions = ["tokens_p202507200000_202507210000"]
+        listed = self.manager.list_partitions
+
+        async def list_partitions() -> list[str]:
+            partitions = await listed()
+            self.partitions = []  # NOTE: Another worker drops it meanwhile
+            return partitions
+
+        self.manager.list_partitions = list_partitions  # type: ignore[method-assign]
+
+        assert await self.manager.drop_expired_partitions(self.now) == []
+        assert self.ddl() == []
+
+    async def test_creates_partitions_up_to_horizon(self):
+        created = await self.manager.create_partitions(self.now)
+
+        assert created == [
+            "tokens_p202507220000_202507230000",
+            "tokens_p202507230000_202507240000",
+            "tokens_p202507240000_202507250000",
+            "tokens_p202507250000_202507260000",
+        ]
+        assert all("PARTITION OF tokens" in s for s in self.ddl())
+
+    async def test_skips_existing_partitions(self):
+        self.partitions = [
+            "tokens_default",
+            "tokens_p202507220000_202507230000",
+            "tokens_p202507230000_202507240000",
+        ]
+
+        created = await self.manager.create_partitions(self.now)
+
+        assert created == [
+            "tokens_p202507240000_202507250000",
+            "tokens_p202507250000_202507260000",
+        ]
+
+    async def test_skips_ranges_covered_by_another_period(self):
+        self.partitions = ["tokens_p202507200000_202507270000"]
+
+        created = await self.manager.create_partitions(self.now)
+
+        assert created == []
+
+    async def test_changes_are_serialised(self):
+        await self.manager.create_partitions(self.now)
+
+        assert self.statements[0] == str(LOCK)
+        self.uow.__aenter__.assert_awaited_once()
+
+    async def test_overlaps(self) -> None:
+        partition = TokenPartition.containing(self.now, DAY)
+
+        assert partition.overlaps(TokenPartition(self.now, self.now + DAY))
+        assert not partition.overlaps(partition.next())
+
+    async def test_drops_only_fully_expired_partitions(self):
+        self.partitions = [
+            "tokens_default",
+            "tokens_p202507200000_202507210000",
+            "tokens_p202507210000_202507220000",
+            "tokens_p202507220000_202507230000",
+        ]
+
+        dropped = await self.manager.drop_expired_partitions(self.now)
+
+        assert dropped == [
+            "tokens_p202507200000_202507210000",
+            "tokens_p202507210000_202507220000",
+        ]
+        assert self.ddl() == [
+            "ALTER TABLE tokens DETACH PARTITION tokens_p202507200000_202507210000",
+            "DROP TABLE IF EXISTS tokens_p202507200000_202507210000",
+            "ALTER TABLE tokens DETACH PARTITION tokens_p202507210000_202507220000",
+            "DROP TABLE IF EXISTS tokens_p202507210000_202507220000",
+        ]
+        assert self.uow.__aenter__.await_count == 2  # noqa: PLR2004
+        assert self.statements.count(str(LOCK)) == 2  # noqa: PLR2004
+
+    async def test_maintain_uses_clock(self):
+        await self.manager.maintain()
+
+        self.clock.now.assert_called_once()
+        assert self.ddl()
+
+    async def test_rejects_sub_minute_period(self):
+        config = self.config.model_copy(
+            update={"token_partition_period": timedelta(seconds=30)}
+        )
+
+        with pytest.raises(ValueError, match="period"):
+            TokenPartitionManager(self.clock, self.uow, self.executor, config)
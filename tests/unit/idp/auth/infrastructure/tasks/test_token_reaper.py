@@ -0,0 +1,113 @@
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from common.domain.interfaces.clock import IClock
+from common.domain.value_objects.datetime import DateTime
+from idp.auth.application.interfaces.repositories.access_token_revocation_repository import (
+    IAccessTokenRevocationRepository,
+)
+from idp.auth.application.interfaces.repositories.token_repository import (
+    IRefreshTokenRepository,
+)
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.tasks.token_reaper import TokenReaper
+
+
+BATCH_SIZE = 10
+
+
+@pytest.mark.asyncio
+class TestTokenReaper:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.config = AuthConfig(
+            secret_key="secret",
+            issuer="test",
+            reaper_batch_size=BATCH_SIZE,
+            reaper_batch_delay=timedelta(milliseconds=50),
+        )
+        self.now = DateTime(datetime(2025, 7, 22, tzinfo=UTC))
+        self.clock = Mock(spec=IClock)
+        self.clock.now.return_value = self.now
+
+        self.repository = Mock(spec=IRefreshTokenRepository)
+        self.repository.delete_stale.return_value = 0
+        self.sleep = AsyncMock()
+        self.ticks = count()
+
+        self.reaper = TokenReaper(
+            self.clock,
+            self.repository,
+            self.config,
+            sleep=self.sleep,
+            timer=lambda: float(next(self.ticks)),
+        )
+
+    async def test_reap_single_partial_batch(self):
+        self.repository.delete_stale.return_value = 3
+
+        reaped = await self.reaper.reap()
+
+        assert reaped == 3  # noqa: PLR2004
+        self.repository.delete_stale.assert_awaited_once_with(self.now, BATCH_SIZE)
+        self.sleep.assert_not_awaited()
+
+    async def test_reap_drains_full_batches_with_throttling(self):
+        self.repository.delete_stale.side_effect = [BATCH_SIZE, BATCH_SIZE, 4]
+
+        reaped = await self.reaper.reap()
+
+        assert reaped == 2 * BATCH_SIZE + 4
+        assert self.repository.delete_stale.await_count == 3  # noqa: PLR2004
+        assert self.sleep.await_count == 2  # noqa: PLR2004
+        self.sleep.assert_awaited_with(0.05)
+
+    async def test_reap_uses_one_cutoff_per_run(self):
+        self.repository.delete_stale.side_effect = [BATCH_SIZE, 0]
+        self.clock.now.side_effect = [self.now, self.now + timedelta(hours=1)]
+
+        await self.reaper.reap()
+
+        cutoffs = {
+            call.args[0] for call in self.repository.delete_stale.await_args_list
+        }
+        assert cutoffs == {self.now}
+
+    async def test_metrics(self):
+        self.repository.delete_stale.side_effect = [BATCH_SIZE, 2]
+
+        await self.reaper.reap()
+        metrics = self.reaper.get_metrics()
+
+        assert metrics.runs == 1
+        assert metrics.batches == 2  # noqa: PLR2004
+        assert metrics.reaped == BATCH_SIZE + 2
+        assert metrics.last_batch_latency == 1.0
+        assert metrics.max_batch_latency == 1.0
+        assert metrics.total_batch_latency == 2.0  # noqa: PLR2004
+
+    async def test_failed_batch_propagates(self):
+        self.repository.delete_stale.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await self.reaper.reap()
+
+        assert self.reaper.get_metrics().reaped == 0
+
+    async def test_reap_purges_expired_revocations(self):
+        revocation_repository = Mock(spec=IAccessTokenRevocationRepository)
+        revocation_repository.delete_expired.return_value = 7
+        reaper = TokenReaper(
+            self.clock,
+            self.repository,
+            self.config,
+            revocation_repository,
+            sleep=self.sleep,
+        )
+
+        await reaper.reap()
+
+        revocation_repository.delete_expired.assert_awaited_once_with(self.now)
+        assert reaper.get_metrics().revocations_reaped == 7  # noqa: PLR2004
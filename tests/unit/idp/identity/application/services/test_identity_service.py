@@ -9,7 +9,11 @@ from idp.identity.application.dtos.commands.create_identity_command import (
 from idp.identity.application.dtos.commands.verify_password_command import (
     VerifyPasswordCommand,
 )
+from idp.identity.application.dtos.models.identity_credentials import (
+    IdentityCredentials,
+)
 from idp.identity.application.exceptions import (
+    IdentityNotFoundError,
     InvalidPasswordError,
     InvalidUsernameError,
     UsernameAlreadyTakenError,
@@ -18,7 +22,7 @@ from idp.identity.application.interfaces.repositories.identity_repository import
     IIdentityRepository,
 )
 from idp.identity.application.interfaces.services.password_hash_service import (
-    IPasswordHasher,
+    IAsyncPasswordHasher,
 )
 from idp.identity.application.services.identity_service import IdentityService
 from idp.identity.domain.entity.identity import Identity
@@ -42,16 +46,22 @@ class TestIdentityService:
         self.identity_repository = Mock(spec=IIdentityRepository)
         self.identity_repository.exists_by_username = AsyncMock(return_value=True)
         self.identity_repository.get_by_username = AsyncMock(return_value=self.identity)
+        self.identity_repository.get_credentials_by_username = AsyncMock(
+            return_value=IdentityCredentials(self.identity_id, self.password_hash)
+        )
 
         self.identity_factory = Mock(spec=IIdentityFactory)
         self.identity_factory.create = Mock(return_value=self.identity)
 
-        self.password_hasher = Mock(spec=IPasswordHasher)
-        self.password_hasher.verify = Mock(return_value=True)
-        self.password_hasher.hash = Mock(return_value=self.password_hash)
+        self.password_hasher = Mock(spec=IAsyncPasswordHasher)
+        self.password_hasher.verify = AsyncMock(return_value=True)
+        self.password_hasher.hash = AsyncMock(return_value=self.password_hash)
+        self.password_hasher.dummy_hash = Mock(return_value="dummy_hash")
 
         self.service = IdentityService(
-            self.identity_repository, self.identity_factory, self.password_hasher
+            self.identity_repository,
+            self.identity_factory,
+            self.password_hasher,
         )
 
     async def test_exists_by_username(self):
@@ -128,23 +138,31 @@ class TestIdentityService:
         assert isinstance(result, UUID)
         assert result == self.identity_id
 
-        self.identity_repository.exists_by_username.assert_awaited_once_with(
+        self.identity_repository.get_credentials_by_username.assert_awaited_once_with(
             command.username
         )
-        self.identity_repository.get_by_username.assert_awaited_once_with(self.username)
+        self.password_hasher.verify.assert_awaited_once_with(
+            self.password, self.password_hash
+        )
+        self.identity_repository.exists_by_username.assert_not_awaited()
+        self.identity_repository.get_by_username.assert_not_awaited()
 
     async def test_verify_password_invalid_username(self):
         command = VerifyPasswordCommand(username=self.username, password=self.password)
-        self.identity_repository.exists_by_username.return_value = False
+        self.identity_repository.get_credentials_by_username.side_effect = (
+            IdentityNotFoundError(self.username)
+        )
 
         # Act & Assert
         with pytest.raises(InvalidUsernameError):
             await self.service.verify_password(command)
+        self.password_hasher.verify.assert_awaited_once_with(
+            self.password, "dummy_hash"
+        )
 
     async def test_verify_password_invalid_password(self):
         # Arrange
         command = VerifyPasswordCommand(username=self.username, password=self.password)
-        self.identity_repository.exists_by_username.return_value = True
         self.password_hasher.verify.return_value = False
 
         # Act & Assert
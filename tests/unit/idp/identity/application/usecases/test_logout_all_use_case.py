@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from idp.auth.application.dtos.commands.logout_all_command import LogoutAllCommand
+from idp.auth.application.dtos.commands.revoke_sessions_command import (
+    RevokeSessionsCommand,
+)
+from idp.auth.application.interfaces.services.token_service import ITokenRevoker
+from idp.auth.application.usecases.command.logout_all_use_case import (
+    LogoutAllUseCase,
+)
+from idp.auth.application.usecases.command.revoke_sessions_use_case import (
+    RevokeSessionsUseCase,
+)
+
+
+@pytest.mark.asyncio
+class TestLogoutAllUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.token_revoker = Mock(spec=ITokenRevoker)
+        self.token_revoker.revoke_all = AsyncMock(return_value=2)
+
+        self.identity_id = uuid4()
+        self.use_case = LogoutAllUseCase(self.token_revoker)
+
+    async def test_logout_all_success(self):
+        await self.use_case.execute(LogoutAllCommand(self.identity_id))
+
+        self.token_revoker.revoke_all.assert_awaited_once_with(self.identity_id)
+
+
+@pytest.mark.asyncio
+class TestRevokeSessionsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.token_revoker = Mock(spec=ITokenRevoker)
+        self.token_revoker.revoke_all_many = AsyncMock(return_value=4)
+
+        self.identity_ids = [uuid4(), uuid4()]
+        self.use_case = RevokeSessionsUseCase(self.token_revoker)
+
+    async def test_revoke_sessions_success(self):
+        revoked = await self.use_case.execute(RevokeSessionsCommand(self.identity_ids))
+
+        assert revoked == 4  # noqa: PLR2004
+        self.token_revoker.revoke_all_many.assert_awaited_once_with(self.identity_ids)
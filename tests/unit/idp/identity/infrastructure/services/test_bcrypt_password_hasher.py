@@ -27,3 +27,9 @@ class TestBcryptPasswordHasher:
         hash1 = self.hasher.hash(password)
         hash2 = self.hasher.hash(password)
         assert hash1 != hash2
+
+    def test_dummy_hash_never_matches(self):
+        dummy_hash = self.hasher.dummy_hash()
+
+        assert not self.hasher.verify("", dummy_hash)
+        assert dummy_hash.split("$")[2] == self.hasher.hash("s3cret!").split("$")[2]
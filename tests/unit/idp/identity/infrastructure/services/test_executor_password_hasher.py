@@ -0,0 +1,117 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from common.application.exceptions import ServiceUnavailableError
+from idp.identity.application.interfaces.services.password_hash_service import (
+    IPasswordHasher,
+)
+from idp.identity.infrastructure.config.password_hasher_config import (
+    PasswordHasherConfig,
+    PasswordHasherExecutorEnum,
+)
+from idp.identity.infrastructure.services.executor.password_hasher import (
+    ExecutorPasswordHasher,
+)
+
+
+@pytest.mark.asyncio
+class TestExecutorPasswordHasher:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.hasher = Mock(spec=IPasswordHasher)
+        self.hasher.hash.return_value = "hashed"
+        self.hasher.verify.return_value = True
+
+        self.max_queue_depth = 2
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.service = ExecutorPasswordHasher(
+            self.hasher, self.executor, self.max_queue_depth
+        )
+        yield
+        self.service.shutdown()
+
+    async def test_hash_runs_in_executor(self):
+        caller_thread = threading.get_ident()
+        worker_threads: list[int] = []
+
+        def hash_(password: str) -> str:
+            worker_threads.append(threading.get_ident())
+            return "hashed"
+
+        self.hasher.hash.side_effect = hash_
+
+        result = await self.service.hash("password")
+
+        assert result == "hashed"
+        assert worker_threads
+        assert worker_threads[0] != caller_thread
+
+    async def test_verify(self):
+        result = await self.service.verify("password", "hashed")
+
+        assert result is True
+        self.hasher.verify.assert_called_once_with("password", "hashed")
+
+    async def test_inline_without_executor(self):
+        service = ExecutorPasswordHasher(self.hasher, None, max_queue_depth=1)
+
+        result = await service.verify("password", "hashed")
+
+        assert result is True
+        assert service.get_metrics().completed == 1
+
+    async def test_rejects_when_queue_is_full(self):
+        release = threading.Event()
+
+        def verify(password: str, hashed_password: str) -> bool:
+            release.wait(timeout=5)
+            return True
+
+        self.hasher.verify.side_effect = verify
+
+        pending = [
+            asyncio.create_task(self.service.verify("password", "hashed"))
+            for _ in range(self.max_queue_depth)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceUnavailableError):
+            await self.service.verify("password", "hashed")
+
+        release.set()
+        assert all(await asyncio.gather(*pending))
+
+        metrics = self.service.get_metrics()
+        assert metrics.rejected == 1
+        assert metrics.completed == self.max_queue_depth
+        assert metrics.max_in_flight == self.max_queue_depth
+        assert metrics.in_flight == 0
+
+    async def test_failure_is_counted_and_propagated(self):
+        self.hasher.hash.side_effect = ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await self.service.hash("password")
+
+        metrics = self.service.get_metrics()
+        assert metrics.failed == 1
+        assert metrics.in_flight == 0
+
+    @pytest.mark.parametrize(
+        ("executor", "has_executor"),
+        [
+            (PasswordHasherExecutorEnum.INLINE, False),
+            (PasswordHasherExecutorEnum.THREAD, True),
+        ],
+    )
+    async def test_create(self, executor: PasswordHasherExecutorEnum, has_executor):
+        config = PasswordHasherConfig(executor=executor)
+
+        service = ExecutorPasswordHasher.create(self.hasher, config)
+
+        assert (service.executor is not None) is has_executor
+        assert service.max_queue_depth == config.max_queue_depth
+        service.shutdown()
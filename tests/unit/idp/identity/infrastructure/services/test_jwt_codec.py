@@ -0,0 +1,123 @@
+import time
+from typing import Any
+
+import pytest
+from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.hmac.jwt_codec import HMACJWTCodec
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
+from idp.auth.infrastructure.services.jwt.codec import IJWTCodec
+from idp.identity.application.exceptions import InvalidTokenError, TokenExpiredError
+from jose import jwt
+
+
+class TestJWTCodec:
+    @pytest.fixture(autouse=True, params=[JoseJWTCodec, HMACJWTCodec])
+    def setup(self, request: pytest.FixtureRequest):
+        self.config = AuthConfig(secret_key="supersecretkey", issuer="my-service")
+        self.codec: IJWTCodec = request.param(self.config)
+
+    def claims(self, **overrides: Any) -> dict[str, Any]:
+        now = int(time.time())
+        claims: dict[str, Any] = {
+            "sub": "subject",
+            "iss": self.config.issuer,
+            "iat": now,
+            "exp": now + 60,
+        }
+        claims.update(overrides)
+        return {k: v for k, v in claims.items() if v is not None}
+
+    def jose_encode(self, claims: dict[str, Any], **kwargs: Any) -> str:
+        return jwt.encode(
+            claims,
+            kwargs.pop("key", self.config.secret_key),
+            algorithm=kwargs.pop("algorithm", self.config.algorithm),
+            **kwargs,
+        )
+
+    def test_roundtrip(self):
+        claims = self.claims(preferred_username="username")
+
+        assert self.codec.decode(self.codec.encode(claims)) == claims
+
+    def test_encode_is_jose_compatible(self):
+        claims = self.claims()
+
+        token = self.codec.encode(claims)
+
+        assert (
+            jwt.decode(
+                token,
+                self.config.secret_key,
+                algorithms=[self.config.algorithm],
+                issuer=self.config.issuer,
+            )
+            == claims
+        )
+
+    def test_decode_jose_token(self):
+        claims = self.claims()
+
+        assert self.codec.decode(self.jose_encode(claims)) == claims
+
+    def test_decode_token_with_extra_headers(self):
+        claims = self.claims()
+
+        token = self.jose_encode(claims, headers={"kid": "key"})
+
+        assert self.codec.decode(token) == claims
+
+    def test_expired_token_fails(self):
+        token = self.codec.encode(self.claims(exp=int(time.time()) - 60))
+
+        with pytest.raises(TokenExpiredError):
+            self.codec.decode(token)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"sub": None},
+            {"iat": None},
+            {"exp": None},
+            {"iss": "other-service"},
+            {"aud": "audience"},
+            {"nbf": int(time.time()) + 3600},
+        ],
+    )
+    def test_invalid_claims_fail(self, overrides: dict[str, Any]):
+        token = self.jose_encode(self.claims(**overrides))
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_wrong_key_fails(self):
+        token = self.jose_encode(self.claims(), key="other-key")
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_other_algorithm_fails(self):
+        token = self.jose_encode(self.claims(), algorithm="HS512")
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    @pytest.mark.parametrize("token", ["", "a.b", "a.b.c", "a.b.c.d", "ä.ö.ü"])
+    def test_malformed_token_fails(self, token: str):
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_tampered_payload_fails(self):
+        header, _, signature = self.codec.encode(self.claims()).split(".")
+        _, payload, _ = self.codec.encode(self.claims(sub="other")).split(".")
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(f"{header}.{payload}.{signature}")
+
+
+class TestHMACJWTCodec:
+    def test_unsupported_algorithm(self):
+        config = AuthConfig(secret_key="key", issuer="issuer", algorithm="RS256")
+
+        with pytest.raises(ValueError, match="RS256"):
+            HMACJWTCodec(config)
@@ -0,0 +1,181 @@
+import time
+from typing import Any
+
+import ecdsa
+import pytest
+import rsa
+from idp.auth.infrastructure.config.auth_config import AuthConfig, SigningKeyConfig
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
+from idp.auth.infrastructure.services.jose.key_ring import JWTKeyRing
+from idp.identity.application.exceptions import InvalidTokenError
+from jose import jwt
+
+
+def es256_key(kid: str, *, private: bool = True) -> SigningKeyConfig:
+    signing_key = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p)
+    if private:
+        return SigningKeyConfig(
+            kid=kid, algorithm="ES256", private_key=signing_key.to_pem().decode()
+        )
+    return SigningKeyConfig(
+        kid=kid,
+        algorithm="ES256",
+        public_key=signing_key.get_verifying_key().to_pem().decode(),
+    )
+
+
+class TestJWTKeyRing:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.old_key = es256_key("old")
+        self.new_key = es256_key("new")
+        self.config = AuthConfig(
+            secret_key="supersecretkey",
+            issuer="my-service",
+            signing_keys=[self.old_key, self.new_key],
+            active_kid="new",
+        )
+        self.key_ring = JWTKeyRing.from_config(self.config)
+        self.codec = JoseJWTCodec(self.config, self.key_ring)
+        self.now = int(time.time())
+
+    def claims(self) -> dict[str, Any]:
+        return {
+            "sub": "subject",
+            "iss": "my-service",
+            "iat": self.now,
+            "exp": self.now + 60,
+        }
+
+    def codec_for(self, active_kid: str) -> JoseJWTCodec:
+        config = self.config.model_copy(update={"active_kid": active_kid})
+        return JoseJWTCodec(config, JWTKeyRing.from_config(config))
+
+    def test_encode_uses_active_key(self):
+        token = self.codec.encode(self.claims())
+
+        assert jwt.get_unverified_header(token) == {
+            "alg": "ES256",
+            "kid": "new",
+            "typ": "JWT",
+        }
+        assert self.codec.decode(token) == self.claims()
+
+    def test_decode_token_signed_by_retiring_key(self):
+        token = self.codec_for("old").encode(self.claims())
+
+        assert self.codec.decode(token) == self.claims()
+
+    def test_decode_unknown_kid_fails(self):
+        other = JWTKeyRing.from_config(
+            self.config.model_copy(
+                update={"signing_keys": [es256_key("other")], "active_kid": None}
+            )
+        )
+        token = JoseJWTCodec(self.config, other).encode(self.claims())
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_decode_forged_kid_fails(self):
+        token = self.codec_for("old").encode(self.claims())
+        forged = jwt.encode(
+            self.claims(),
+            self.old_key.private_key.get_secret_value(),  # type: ignore[union-attr]
+            algorithm="ES256",
+            headers={"kid": "new"},
+        )
+
+        assert self.codec.decode(token)
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(forged)
+
+    def test_decode_secret_key_token_without_kid_fails(self):
+        token = jwt.encode(self.claims(), self.config.secret_key, algorithm="HS256")
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_decode_secret_key_token_with_fallback(self):
+        config = self.config.model_copy(update={"secret_key_fallback": True})
+        codec = JoseJWTCodec(config, self.key_ring)
+        token = jwt.encode(self.claims(), self.config.secret_key, algorithm="HS256")
+
+        assert codec.decode(token) == self.claims()
+
+    @pytest.mark.parametrize("kid", [["new"], {"kid": "new"}, 1])
+    def test_decode_malformed_kid_fails(self, kid: object):
+        token = jwt.encode(
+            self.claims(),
+            self.new_key.private_key.get_secret_value(),  # type: ignore[union-attr]
+            algorithm="ES256",
+            headers={"kid": kid},
+        )
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_decode_hmac_token_with_kid_fails(self):
+        token = jwt.encode(
+            self.claims(),
+            self.config.secret_key,
+            algorithm="HS256",
+            headers={"kid": "new"},
+        )
+
+        with pytest.raises(InvalidTokenError):
+            self.codec.decode(token)
+
+    def test_public_key_set(self):
+        key_set = self.key_ring.get_public_key_set()
+
+        assert [key["kid"] for key in key_set.keys] == ["old", "new"]
+        assert all(key["use"] == "sig" and "d" not in key for key in key_set.keys)
+        assert key_set.max_age == self.config.jwks_max_age.total_seconds()
+
+    def test_public_only_key_verifies(self):
+        config = self.config.model_copy(
+            update={
+                "signing_keys": [es256_key("public", private=False), self.new_key],
+                "active_kid": None,
+            }
+        )
+
+        key_ring = JWTKeyRing.from_config(config)
+
+        assert key_ring.active is not None
+        assert key_ring.active.kid == "new"
+
+    def test_rs256(self):
+        _, private_key = rsa.newkeys(1024)
+        config = self.config.model_copy(
+            update={
+                "signing_keys": [
+                    SigningKeyConfig(
+                        kid="rsa", private_key=private_key.save_pkcs1().decode()
+                    )
+                ],
+                "active_kid": "rsa",
+            }
+        )
+        codec = JoseJWTCodec(config, JWTKeyRing.from_config(config))
+
+        assert codec.decode(codec.encode(self.claims())) == self.claims()
+
+    @pytest.mark.parametrize(
+        ("keys", "active_kid"),
+        [
+            ([SigningKeyConfig(kid="k", algorithm="HS256", private_key="x")], None),
+            ([SigningKeyConfig(kid="k", algorithm="EdDSA", private_key="x")], None),
+            ([SigningKeyConfig(kid="k")], None),
+            ([es256_key("k", private=False)], "k"),
+            ([es256_key("k")], "missing"),
+        ],
+    )
+    def test_invalid_config(self, keys: list[SigningKeyConfig], active_kid: str | None):
+        config = self.config.model_copy(
+            update={"signing_keys": keys, "active_kid": active_kid}
+        )
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            JWTKeyRing.from_config(config)
@@ -9,11 +9,20 @@ from common.domain.value_objects.datetime import DateTime
 from idp.auth.application.interfaces.repositories.descriptor_repository import (
     IIdentityDescriptorRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
 from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
 from idp.auth.infrastructure.services.jwt.token_introspector import (
     JWTTokenIntrospector,
 )
-from idp.identity.application.exceptions import InvalidTokenError, TokenExpiredError
+from idp.identity.application.exceptions import (
+    InvalidTokenError,
+    TokenExpiredError,
+    TokenRevokedError,
+)
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
 from jose import jwt
 
 
@@ -40,7 +49,10 @@ class TestJWTTokenIntrospector:
         self.identity_repository.get_by_id.return_value = self.desc
 
         self.introspector = JWTTokenIntrospector(
-            self.config, self.clock, self.identity_repository
+            self.config,
+            self.clock,
+            self.identity_repository,
+            JoseJWTCodec(self.config),
         )
 
     def create_valid_token(self) -> str:
@@ -48,13 +60,14 @@ class TestJWTTokenIntrospector:
         exp = issued_at + self.config.access_token_ttl
         return self.create_token(issued_at, exp)
 
-    def create_token(self, iat: datetime, exp: datetime) -> str:
+    def create_token(self, iat: datetime, exp: datetime, **claims: str) -> str:
         return jwt.encode(
             {
                 "sub": str(self.user_id),
                 "iss": self.config.issuer,
                 "iat": int(iat.timestamp()),
                 "exp": int(exp.timestamp()),
+                **claims,
             },
             self.config.secret_key,
             algorithm=self.config.algorithm,
@@ -68,6 +81,29 @@ class TestJWTTokenIntrospector:
 
         self.identity_repository.get_by_id.assert_awaited_once_with(self.user_id)
 
+    async def test_stateless_descriptor_skips_repository(self):
+        self.config.stateless_descriptor = True
+        now = self.clock.now().value
+        token = self.create_token(
+            now, now + self.config.access_token_ttl, preferred_username="username"
+        )
+
+        result = await self.introspector.extract_user(token)
+
+        assert result == IdentityDescriptor(self.user_id, "username")
+        self.identity_repository.get_by_id.assert_not_awaited()
+
+    async def test_username_claim_ignored_when_not_stateless(self):
+        now = self.clock.now().value
+        token = self.create_token(
+            now, now + self.config.access_token_ttl, preferred_username="username"
+        )
+
+        result = await self.introspector.extract_user(token)
+
+        assert result == self.desc
+        self.identity_repository.get_by_id.assert_awaited_once_with(self.user_id)
+
     async def test_is_token_valid(self):
         token = self.create_valid_token()
         is_valid = await self.introspector.is_token_valid(token)
@@ -110,3 +146,79 @@ class TestJWTTokenIntrospector:
         token = self.create_valid_token()
         with pytest.raises(RepositoryError):
             await self.introspector.extract_user(token)
+
+    async def test_decode_is_cached(self, monkeypatch: pytest.MonkeyPatch):
+        token = self.create_valid_token()
+        first = self.introspector.decode(token)
+
+        decode = Mock(side_effect=AssertionError("token decoded twice"))
+        monkeypatch.setattr(jwt, "decode", decode)
+        second = self.introspector.decode(token)
+
+        assert second == first
+        metrics = self.introspector.get_metrics()
+        assert metrics.hits == 1
+        assert metrics.misses == 1
+
+    async def test_invalid_token_is_negatively_cached(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        with pytest.raises(InvalidTokenError):
+            self.introspector.decode("invalid-token")
+
+        decode = Mock(side_effect=AssertionError("token decoded twice"))
+        monkeypatch.setattr(jwt, "decode", decode)
+        with pytest.raises(InvalidTokenError):
+            self.introspector.decode("invalid-token")
+
+        assert self.introspector.get_metrics().hits == 1
+
+    async def test_cache_disabled(self):
+        config = self.config.model_copy(update={"token_cache_size": 0})
+        introspector = JWTTokenIntrospector(
+            config, self.clock, self.identity_repository, JoseJWTCodec(config)
+        )
+        token = self.create_valid_token()
+
+        introspector.decode(token)
+        introspector.decode(token)
+
+        assert introspector.get_metrics().hits == 0
+
+    async def test_revoked_jti_is_rejected(self):
+        jti = uuid4()
+        revocation_list = Mock(spec=IAccessTokenRevocationList)
+        revocation_list.is_revoked.return_value = True
+        self.introspector.revocation_list = revocation_list
+        now = self.clock.now().value
+        token = self.create_token(now, now + self.config.access_token_ttl, jti=str(jti))
+
+        with pytest.raises(TokenRevokedError):
+            await self.introspector.extract_user(token)
+        with pytest.raises(TokenRevokedError):
+            await self.introspector.validate(token)
+
+        revocation_list.is_revoked.assert_awaited_with(jti)
+
+    async def test_revocation_checked_after_cache_hit(self):
+        revocation_list = Mock(spec=IAccessTokenRevocationList)
+        revocation_list.is_revoked.return_value = False
+        self.introspector.revocation_list = revocation_list
+        now = self.clock.now().value
+        token = self.create_token(
+            now, now + self.config.access_token_ttl, jti=str(uuid4())
+        )
+
+        await self.introspector.validate(token)
+        revocation_list.is_revoked.return_value = True
+
+        with pytest.raises(TokenRevokedError):
+            await self.introspector.validate(token)
+
+    async def test_token_without_jti_skips_revocation_list(self):
+        revocation_list = Mock(spec=IAccessTokenRevocationList)
+        self.introspector.revocation_list = revocation_list
+
+        await self.introspector.validate(self.create_valid_token())
+
+        revocation_list.is_revoked.assert_not_awaited()
@@ -8,12 +8,19 @@ from common.domain.interfaces.token_generator import ITokenGenerator
 from common.domain.interfaces.uuid_generator import IUUIDGenerator
 from common.domain.value_objects.datetime import DateTime
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
+from idp.auth.application.interfaces.repositories.descriptor_repository import (
+    IIdentityDescriptorRepository,
+)
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
 from idp.auth.domain.entity.token import TokenTypeEnum
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.config.auth_config import AuthConfig
+from idp.auth.infrastructure.services.jose.jwt_codec import JoseJWTCodec
 from idp.auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
+from jose import jwt
 
 
 @pytest.mark.asyncio
@@ -37,6 +44,7 @@ class TestJWTTokenIssuer:
         self.token_gen.secure.return_value = "securetoken"
 
         self.refresh_token_repo = Mock(spec=IRefreshTokenRepository)
+        self.descriptor_repo = Mock(spec=IIdentityDescriptorRepository)
 
         self.issuer = JWTTokenIssuer(
             self.clock,
@@ -44,8 +52,13 @@ class TestJWTTokenIssuer:
             self.token_gen,
             self.uuid_gen,
             self.refresh_token_repo,
+            self.descriptor_repo,
+            JoseJWTCodec(self.config),
         )
 
+    def decode(self, token: str) -> dict[str, object]:
+        return jwt.get_unverified_claims(token)
+
     async def test_issue_access_token(self):
         user_id = uuid4()
 
@@ -63,7 +76,10 @@ class TestJWTTokenIssuer:
 
         assert token.token_type == TokenTypeEnum.REFRESH
         assert token.identity_id == user_id
-        assert token.value == "securetoken"
+        assert (
+            token.value
+            == RefreshTokenValue(token.token_id, "securetoken", token.expires_at).value
+        )
 
     async def test_issue_tokens(self):
         user_id = uuid4()
@@ -78,3 +94,34 @@ class TestJWTTokenIssuer:
         self.refresh_token_repo.add.assert_awaited_once_with(
             self.issuer.issue_refresh_token(user_id)
         )
+        self.descriptor_repo.get_by_id.assert_not_awaited()
+
+    async def test_access_token_jti_is_refresh_token_id(self):
+        self.uuid_gen.create.side_effect = lambda: uuid4()
+
+        tokens = await self.issuer.issue_tokens(uuid4())
+        refresh = self.refresh_token_repo.add.await_args.args[0]
+
+        assert self.decode(tokens.access_token)["jti"] == str(refresh.token_id)
+
+    async def test_standalone_access_token_has_own_jti(self):
+        token = self.issuer.issue_access_token(uuid4())
+
+        assert self.decode(token.value)["jti"] == str(token.token_id)
+
+    async def test_access_token_has_no_username_by_default(self):
+        token = self.issuer.issue_access_token(uuid4())
+
+        assert "preferred_username" not in self.decode(token.value)
+
+    async def test_issue_tokens_stateless_descriptor(self):
+        user_id = uuid4()
+        self.config.stateless_descriptor = True
+        self.descriptor_repo.get_by_id.return_value = IdentityDescriptor(
+            user_id, "username"
+        )
+
+        tokens = await self.issuer.issue_tokens(user_id)
+
+        assert self.decode(tokens.access_token)["preferred_username"] == "username"
+        self.descriptor_repo.get_by_id.assert_awaited_once_with(user_id)
@@ -1,18 +1,24 @@
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
 from common.application.exceptions import NotFoundError
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from common.domain.interfaces.clock import IClock
 from common.domain.value_objects.datetime import DateTime
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
+from idp.auth.domain.value_objects.refresh_token import RefreshTokenValue
 from idp.auth.infrastructure.services.jwt.token_issuer import JWTTokenIssuer
 from idp.auth.infrastructure.services.jwt.token_refresher import JWTTokenRefresher
-from idp.auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
 from idp.identity.application.exceptions import (
     InvalidTokenError,
     TokenExpiredError,
@@ -27,7 +33,6 @@ class TestJWTTokenRefresher:
         self.user_id = uuid4()
 
         self.token_issuer = Mock(spec=JWTTokenIssuer)
-        self.token_revoker = Mock(spec=JWTTokenRevoker)
 
         self.clock = Mock(spec=IClock)
         self.clock.now.return_value = DateTime(datetime(2025, 7, 22, tzinfo=UTC))
@@ -41,47 +46,93 @@ class TestJWTTokenRefresher:
         self.token.identity_id = self.user_id
 
         self.refresh_token_repo = Mock(spec=IRefreshTokenRepository)
+        self.refresh_token_repo.revoke_active.return_value = self.user_id
         self.refresh_token_repo.get.return_value = self.token
 
+        self.uow = AsyncMock(spec=IUnitOfWork)
+        self.uow.run.side_effect = self._run
+
+        self.revocation_list = Mock(spec=IAccessTokenRevocationList)
+
         self.refresher = JWTTokenRefresher(
             self.clock,
             self.token_issuer,
-            self.token_revoker,
             self.refresh_token_repo,
+            self.uow,
+            self.revocation_list,
         )
 
+    async def _run(self, func: Callable[[], Awaitable[Any]], *args: Any) -> Any:
+        return await func()
+
     async def test_refresh_valid_token(self):
         result = await self.refresher.refresh_tokens("refresh-token")
 
         assert isinstance(result, AuthTokens)
         assert result == self.tokens
 
-        self.token_revoker.revoke_refresh_token.assert_awaited_once()
+        self.refresh_token_repo.revoke_active.assert_awaited_once_with(
+            "refresh-token", self.clock.now.return_value
+        )
+        self.refresh_token_repo.get.assert_not_awaited()
         self.token_issuer.issue_tokens.assert_awaited_once_with(self.user_id)
 
+    async def test_refresh_revokes_previous_access_token(self):
+        refresh_token = RefreshTokenValue(uuid4(), "secret")
+
+        await self.refresher.refresh_tokens(refresh_token.value)
+
+        self.revocation_list.revoke.assert_awaited_once_with([refresh_token.token_id])
+
+    async def test_refresh_legacy_token_revokes_nothing(self):
+        await self.refresher.refresh_tokens("refresh-token")
+
+        self.revocation_list.revoke.assert_not_awaited()
+
+    async def test_refresh_rejected_token_revokes_nothing(self):
+        self.refresh_token_repo.revoke_active.return_value = None
+
+        with pytest.raises(TokenRevokedError):
+            await self.refresher.refresh_tokens(RefreshTokenValue(uuid4(), "s").value)
+
+        self.revocation_list.revoke.assert_not_awaited()
+
+    async def test_refresh_runs_in_one_transaction(self):
+        await self.refresher.refresh_tokens("refresh-token")
+
+        self.uow.run.assert_awaited_once()
+
     async def test_refresh_expired_token_fails(self):
+        self.refresh_token_repo.revoke_active.return_value = None
         self.token.is_expired.return_value = True
 
         with pytest.raises(TokenExpiredError):
             await self.refresher.refresh_tokens("refresh-token")
 
-        self.token_revoker.revoke_refresh_token.assert_not_awaited()
         self.token_issuer.issue_tokens.assert_not_awaited()
 
     async def test_refresh_revoked_token_fails(self):
+        self.refresh_token_repo.revoke_active.return_value = None
         self.token.is_revoked.return_value = True
 
         with pytest.raises(TokenRevokedError):
             await self.refresher.refresh_tokens("refresh-token")
 
-        self.token_revoker.revoke_refresh_token.assert_not_awaited()
+        self.token_issuer.issue_tokens.assert_not_awaited()
+
+    async def test_refresh_lost_race_fails_as_revoked(self):
+        self.refresh_token_repo.revoke_active.return_value = None
+
+        with pytest.raises(TokenRevokedError):
+            await self.refresher.refresh_tokens("refresh-token")
+
         self.token_issuer.issue_tokens.assert_not_awaited()
 
     async def test_refresh_no_token_fails_with_invalid_token(self):
+        self.refresh_token_repo.revoke_active.return_value = None
         self.refresh_token_repo.get.side_effect = NotFoundError("random-token")
 
         with pytest.raises(InvalidTokenError):
             await self.refresher.refresh_tokens("random-token")
 
-        self.token_revoker.revoke_refresh_token.assert_not_awaited()
         self.token_issuer.issue_tokens.assert_not_awaited()
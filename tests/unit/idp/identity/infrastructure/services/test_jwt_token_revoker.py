@@ -9,6 +9,9 @@ from common.domain.value_objects.datetime import DateTime
 from idp.auth.application.interfaces.repositories.token_repository import (
     IRefreshTokenRepository,
 )
+from idp.auth.application.interfaces.services.access_token_revocation_list import (
+    IAccessTokenRevocationList,
+)
 from idp.auth.infrastructure.services.jwt.token_revoker import JWTTokenRevoker
 from idp.identity.application.exceptions import InvalidTokenError
 
@@ -28,7 +31,11 @@ class TestJWTTokenRevoker:
         self.refresh_token_repo = Mock(spec=IRefreshTokenRepository)
         self.refresh_token_repo.get.return_value = self.token
 
-        self.revoker = JWTTokenRevoker(self.clock, self.refresh_token_repo)
+        self.revocation_list = Mock(spec=IAccessTokenRevocationList)
+
+        self.revoker = JWTTokenRevoker(
+            self.clock, self.refresh_token_repo, self.revocation_list
+        )
 
     async def test_revoke_token(self):
         token = "token"
@@ -57,3 +64,48 @@ class TestJWTTokenRevoker:
             await self.revoker.revoke_refresh_token("random-token")
 
         self.refresh_token_repo.revoke.assert_not_awaited()
+
+    async def test_revoke_all(self):
+        identity_id = uuid4()
+        token_ids = [uuid4(), uuid4()]
+        self.refresh_token_repo.revoke_all.return_value = token_ids
+
+        revoked = await self.revoker.revoke_all(identity_id)
+
+        assert revoked == len(token_ids)
+        self.refresh_token_repo.revoke_all.assert_awaited_once_with(
+            identity_id, self.clock.now.return_value
+        )
+        self.revocation_list.revoke.assert_awaited_once_with(token_ids)
+
+    async def test_revoke_all_many(self):
+        identity_ids = [uuid4(), uuid4()]
+        token_ids = [uuid4(), uuid4(), uuid4()]
+        self.refresh_token_repo.revoke_all_many.return_value = token_ids
+
+        revoked = await self.revoker.revoke_all_many(identity_ids)
+
+        assert revoked == len(token_ids)
+        self.refresh_token_repo.revoke_all_many.assert_awaited_once_with(
+            identity_ids, self.clock.now.return_value
+        )
+        self.revocation_list.revoke.assert_awaited_once_with(token_ids)
+
+    async def test_revoke_token_revokes_paired_access_token(self):
+        await self.revoker.revoke_refresh_token("token")
+
+        self.revocation_list.revoke.assert_awaited_once_with([self.token.token_id])
+
+    async def test_revoke_revoked_token_skips_access_token(self):
+        self.token.is_revoked.return_value = True
+
+        await self.revoker.revoke_refresh_token("revoked-token")
+
+        self.revocation_list.revoke.assert_not_awaited()
+
+    async def test_revoke_without_revocation_list(self):
+        revoker = JWTTokenRevoker(self.clock, self.refresh_token_repo)
+
+        await revoker.revoke_refresh_token("token")
+
+        self.refresh_token_repo.revoke.assert_awaited_once_with("token")
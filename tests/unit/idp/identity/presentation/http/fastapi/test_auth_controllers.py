@@ -1,30 +1,44 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 import pytest
+from common.application.interfaces.transactions.unit_of_work import IUnitOfWork
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 from idp.auth.application.dtos.commands.login_command import LoginCommand
+from idp.auth.application.dtos.commands.logout_all_command import LogoutAllCommand
 from idp.auth.application.dtos.commands.logout_command import LogoutCommand
 from idp.auth.application.dtos.commands.refresh_token_command import (
     RefreshTokenCommand,
 )
 from idp.auth.application.dtos.models.auth_tokens import AuthTokens
+from idp.auth.application.dtos.models.public_key_set import PublicKeySet
+from idp.auth.application.interfaces.services.public_key_set_provider import (
+    IPublicKeySetProvider,
+)
 from idp.auth.application.interfaces.usecases.command.login_use_case import (
     ILoginUseCase,
 )
+from idp.auth.application.interfaces.usecases.command.logout_all_use_case import (
+    ILogoutAllUseCase,
+)
 from idp.auth.application.interfaces.usecases.command.logout_use_case import (
     ILogoutUseCase,
 )
 from idp.auth.application.interfaces.usecases.command.refresh_token_use_case import (
     IRefreshTokenUseCase,
 )
-from idp.auth.presentation.http.fastapi.controllers import auth_router
+from idp.auth.presentation.http.fastapi.controllers import (
+    auth_router,
+    well_known_router,
+)
 from idp.identity.application.exceptions import (
     InvalidPasswordError,
     InvalidUsernameError,
 )
+from idp.identity.domain.value_objects.descriptor import IdentityDescriptor
 from idp.identity.presentation.http.fastapi.auth import (
+    get_descriptor,
     oauth2_scheme_no_error,
 )
 
@@ -39,14 +53,22 @@ class TestAuthController:
 
         self.login_use_case = AsyncMock(spec=ILoginUseCase)
         self.logout_use_case = AsyncMock(spec=ILogoutUseCase)
+        self.logout_all_use_case = AsyncMock(spec=ILogoutAllUseCase)
         self.refresh_token_use_case = AsyncMock(spec=IRefreshTokenUseCase)
 
         self.app.dependency_overrides[ILoginUseCase] = lambda: self.login_use_case
         self.app.dependency_overrides[ILogoutUseCase] = lambda: self.logout_use_case
+        self.app.dependency_overrides[ILogoutAllUseCase] = (
+            lambda: self.logout_all_use_case
+        )
         self.app.dependency_overrides[IRefreshTokenUseCase] = (
             lambda: self.refresh_token_use_case
         )
 
+        self.uow = Mock(spec=IUnitOfWork)
+        self.uow.scope.return_value = MagicMock()
+        self.app.dependency_overrides[IUnitOfWork] = lambda: self.uow
+
     async def test_login_success(self):
         # Arrange
         username = "testuser"
@@ -156,6 +178,30 @@ class TestAuthController:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.json() == {"detail": "Authentication required"}
 
+    async def test_logout_all_success(self):
+        # Arrange
+        descriptor = IdentityDescriptor(uuid4(), "testuser")
+        self.app.dependency_overrides[get_descriptor] = lambda: descriptor
+
+        # Act
+        response = self.client.post(
+            "/logout-all", headers={"Authorization": "Bearer access_token"}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        self.logout_all_use_case.execute.assert_awaited_once_with(
+            LogoutAllCommand(identity_id=descriptor.identity_id)
+        )
+
+    async def test_logout_all_unauthenticated_fails(self):
+        # Act
+        response = self.client.post("/logout-all")  # No token
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        self.logout_all_use_case.execute.assert_not_awaited()
+
     async def test_refresh_success(self):
         # Arrange
         token = "valid_refresh_token"
@@ -183,6 +229,18 @@ class TestAuthController:
             RefreshTokenCommand(token)
         )
 
+    async def test_refresh_owns_its_transaction(self):
+        # Arrange
+        self.refresh_token_use_case.execute.return_value = AuthTokens(
+            uuid4(), access_token="access", refresh_token="refresh"
+        )
+
+        # Act
+        self.client.post("/refresh", headers={"Authorization": "Bearer token"})
+
+        # Assert
+        self.uow.scope.assert_not_called()
+
     async def test_refresh_unauthenticated_fails(self):
         # Arrange
         self.app.dependency_overrides[oauth2_scheme_no_error] = lambda: None  # No token
@@ -193,3 +251,28 @@ class TestAuthController:
         # Assert
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.json() == {"detail": "Authentication required"}
+
+
+class TestWellKnownController:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.app = FastAPI()
+        self.app.include_router(well_known_router)
+        self.client: TestClient = TestClient(self.app)
+
+        self.key_set_provider = Mock(spec=IPublicKeySetProvider)
+        self.app.dependency_overrides[IPublicKeySetProvider] = (
+            lambda: self.key_set_provider
+        )
+
+    def test_jwks(self):
+        key = {"kty": "EC", "kid": "key", "alg": "ES256", "use": "sig"}
+        self.key_set_provider.get_public_key_set.return_value = PublicKeySet(
+            keys=[key], max_age=3600
+        )
+
+        response = self.client.get("/.well-known/jwks.json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"keys": [key]}
+        assert response.headers["Cache-Control"] == "public, max-age=3600"